@@ -0,0 +1,60 @@
+"""
+Compare parsing dates inline in an event loop with :mod:`undate.aio`, using
+thread and process executors. Inline parsing blocks the event loop for the
+whole run; with :mod:`undate.aio` the loop stays responsive, and with a
+process executor parsing can use multiple CPU cores. Request latency
+percentiles are recorded in the benchmark ``extra_info``.
+"""
+
+import asyncio
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from undate import Undate, aio
+
+VALUES = [
+    "2001-XX",
+    "1984?",
+    "18 June 1900",
+    "Tammuz 4816",
+    "Jumādā I 1243",
+    "Easter 1612",
+    "1800/1805",
+]
+
+
+@pytest.fixture(scope="module")
+def date_strings():
+    rng = random.Random(1234)
+    return [rng.choice(VALUES) for _ in range(500)]
+
+
+def test_parse_inline(benchmark, date_strings):
+    benchmark.group = "async omnibus parse 500 dates"
+
+    async def parse_all():
+        return [Undate.parse(value, "omnibus") for value in date_strings]
+
+    benchmark.pedantic(lambda: asyncio.run(parse_all()), rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize(
+    "executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor], ids=["thread", "process"]
+)
+def test_parse_aio(benchmark, date_strings, executor_cls):
+    benchmark.group = "async omnibus parse 500 dates"
+    # load the omnibus converter when each worker starts
+    with executor_cls(
+        max_workers=4, initializer=aio.get_converter, initargs=("omnibus",)
+    ) as executor:
+        parser = aio.AsyncParser(executor=executor, max_batch_size=32)
+        # start workers, so startup isn't included
+        list(executor.map(aio.parse_batch, [[("1984", "omnibus")]] * 4))
+
+        async def parse_all():
+            return await parser.parse_many(date_strings, "omnibus")
+
+        benchmark.pedantic(lambda: asyncio.run(parse_all()), rounds=3, iterations=1)
+    benchmark.extra_info["latency_percentiles"] = parser.latency_percentiles()
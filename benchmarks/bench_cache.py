@@ -0,0 +1,69 @@
+"""
+Parsing a stream of date strings where some values are much more common
+than others (a Zipfian distribution, as in real collections), with and
+without the parse cache (:mod:`undate.cache`). The cache hit rate is
+reported in ``extra_info``. Also compares parsing a batch of strings with
+an empty persistent cache (first run) and a filled one (repeated runs).
+"""
+
+import random
+
+import pytest
+
+from undate import Undate, cache
+from undate.converters.combined import OmnibusDateConverter
+
+#: number of strings parsed in each round
+STREAM_SIZE = 5000
+
+
+@pytest.fixture(scope="module")
+def stream(corpora):
+    # distinct strings from the EDTF and holiday corpora, parsed with the
+    # omnibus converter; string at rank k occurs with weight 1 / k ** 1.1
+    values = list(dict.fromkeys([*corpora["EDTF"], *corpora["holidays"]]))
+    rng = random.Random(1234)
+    rng.shuffle(values)
+    weights = [1 / rank**1.1 for rank in range(1, len(values) + 1)]
+    return rng.choices(values, weights=weights, k=STREAM_SIZE)
+
+
+def parse_all(values):
+    return [Undate.parse(value, "omnibus") for value in values]
+
+
+@pytest.mark.parametrize("maxsize", [None, 100, 10_000], ids=["off", "100", "10000"])
+def test_parse_stream(benchmark, stream, maxsize):
+    benchmark.group = f"parse {STREAM_SIZE} zipfian strings"
+
+    def setup():
+        # start each round with an empty cache
+        cache.disable()
+        if maxsize:
+            cache.enable(maxsize=maxsize)
+
+    try:
+        benchmark.pedantic(parse_all, args=(stream,), setup=setup, rounds=2)
+        benchmark.extra_info["hit_rate"] = cache.info().hit_rate
+    finally:
+        cache.disable()
+
+
+@pytest.mark.parametrize("filled", [False, True], ids=["first run", "repeat run"])
+def test_disk_cache(benchmark, tmp_path, stream, filled):
+    benchmark.group = f"parse {STREAM_SIZE} zipfian strings"
+    converter = OmnibusDateConverter()
+    path = tmp_path / "cache.sqlite"
+    if filled:
+        with cache.DiskParseCache(path) as disk_cache:
+            disk_cache.parse_many(converter, stream)
+
+    def setup():
+        if not filled:
+            path.unlink(missing_ok=True)
+
+    def parse_stream():
+        with cache.DiskParseCache(path) as disk_cache:
+            return disk_cache.parse_many(converter, stream)
+
+    benchmark.pedantic(parse_stream, setup=setup, rounds=2)
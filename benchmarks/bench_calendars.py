@@ -0,0 +1,91 @@
+"""
+Calendar conversion throughput for the convertdate-backed calendar converters:
+converting single dates to Gregorian, and constructing
+:class:`~undate.undate.Undate` objects in each calendar, which also calculates
+the earliest and latest possible Gregorian dates; and converting
+columns of Hebrew dates to the Islamic calendar, with convertdate for
+each date and in bulk through Julian day numbers
+(:meth:`~undate.converters.base.BaseCalendarConverter.to_jdn_array` and
+:meth:`~undate.converters.base.BaseCalendarConverter.from_jdn_array`).
+
+Bulk conversion uses ``UNDATE_BENCHMARK_ROWS`` dates (default: 100,000).
+"""
+
+import random
+
+import numpy as np
+import pytest
+from convertdate import hebrew, islamic
+
+from undate import Undate
+from undate.converters.calendars import (
+    GregorianDateConverter,
+    HebrewDateConverter,
+    IslamicDateConverter,
+    SeleucidDateConverter,
+)
+
+SIZE = 2000
+
+CALENDARS = {
+    "Gregorian": (GregorianDateConverter, 1000, 1999),
+    "Hebrew": (HebrewDateConverter, 5000, 5700),
+    "Islamic": (IslamicDateConverter, 100, 1400),
+    "Seleucid": (SeleucidDateConverter, 1500, 2100),
+}
+
+
+def calendar_dates(calendar, seed=1234):
+    converter_cls, min_year, max_year = CALENDARS[calendar]
+    converter = converter_cls()
+    rng = random.Random(seed)
+    dates = []
+    for _ in range(SIZE):
+        year = rng.randint(min_year, max_year)
+        month = rng.randint(converter.min_month(), converter.max_month(year))
+        dates.append((year, month, rng.randint(1, converter.max_day(year, month))))
+    return converter, dates
+
+
+@pytest.mark.parametrize("calendar", list(CALENDARS))
+def test_to_gregorian(benchmark, calendar):
+    benchmark.group = "convert dates to gregorian"
+    converter, dates = calendar_dates(calendar)
+    benchmark(lambda: [converter.to_gregorian(*date) for date in dates])
+
+
+@pytest.mark.parametrize("calendar", list(CALENDARS))
+@pytest.mark.parametrize("precision", ["day", "month", "year"])
+def test_undate_init(benchmark, calendar, precision):
+    benchmark.group = f"construct {precision} undates by calendar"
+    _, dates = calendar_dates(calendar)
+    size = {"day": 3, "month": 2, "year": 1}[precision]
+    args = [date[:size] for date in dates]
+    benchmark(lambda: [Undate(*arg, calendar=calendar) for arg in args])
+
+
+@pytest.fixture(scope="module")
+def hebrew_columns(benchmark_rows):
+    rng = random.Random(1234)
+    _, dates = calendar_dates("Hebrew")
+    rows = [rng.choice(dates) for _ in range(benchmark_rows)]
+    return tuple(np.array(column) for column in zip(*rows, strict=True))
+
+
+def test_hebrew_to_islamic_convertdate(benchmark, hebrew_columns):
+    benchmark.group = "convert hebrew column to islamic"
+    rows = list(zip(*(column.tolist() for column in hebrew_columns), strict=True))
+    benchmark.pedantic(
+        lambda: [islamic.from_jd(hebrew.to_jd(*row)) for row in rows], rounds=3
+    )
+
+
+def test_hebrew_to_islamic_jdn(benchmark, hebrew_columns):
+    benchmark.group = "convert hebrew column to islamic"
+    hebrew_converter = HebrewDateConverter()
+    islamic_converter = IslamicDateConverter()
+    benchmark(
+        lambda: islamic_converter.from_jdn_array(
+            hebrew_converter.to_jdn_array(*hebrew_columns)
+        )
+    )
@@ -0,0 +1,161 @@
+"""
+Comparing dates with :meth:`Undate.compare <undate.undate.Undate.compare>`
+and the rich comparison operators based on it: :func:`sorted` and
+:mod:`bisect` on a sorted list of day-precision dates with known years,
+and classifying mixed-precision pairs with a single ``compare`` call
+instead of separate ``<``, ``>``, ``==`` and ``in`` checks; and filtering
+dates with ``<`` against a cutoff date of each supported type, which
+compares single days directly with the calculated bounds; and a range
+filter over mixed-precision dates, with Python comparisons of each date
+and with tri-state comparisons of an
+:class:`~undate.array.UndateArray` (:meth:`~undate.array.UndateArray.after`
+and :meth:`~undate.array.UndateArray.before`).
+
+Sorting uses 10,000 dates; bisecting looks up 10,000 dates in
+``UNDATE_BENCHMARK_ROWS`` sorted dates (default: 100,000), which are
+also used for filtering.
+"""
+
+import bisect
+import datetime
+import random
+
+import numpy as np
+import pytest
+
+from undate import Undate
+from undate.array import TriState, UndateArray
+from undate.date import Date
+
+LOOKUPS = 10_000
+
+
+def with_bounds(undates):
+    # bounds are calculated on first use; calculate them before timing
+    for undate in undates:
+        _ = undate.earliest
+    return undates
+
+
+@pytest.fixture(scope="module")
+def sorted_days(benchmark_rows, make_undates):
+    return sorted(with_bounds(make_undates(benchmark_rows)), key=Undate.sort_key)
+
+
+def test_sorted(benchmark, make_undates):
+    benchmark.group = f"sort {LOOKUPS} dates with <"
+    days = with_bounds(make_undates(LOOKUPS))
+    benchmark.pedantic(sorted, args=(days,), rounds=3)
+
+
+def test_bisect(benchmark, sorted_days, make_undates):
+    benchmark.group = "bisect"
+    lookups = with_bounds(make_undates(LOOKUPS, seed=42))
+
+    def bisect_all():
+        return [bisect.bisect_left(sorted_days, undate) for undate in lookups]
+
+    benchmark.pedantic(bisect_all, rounds=3)
+
+
+@pytest.fixture(scope="module")
+def mixed_pairs():
+    rng = random.Random(1234)
+
+    def random_undate():
+        year = rng.randint(1890, 1910)
+        return rng.choice(
+            [
+                Undate(year, rng.randint(1, 12), rng.randint(1, 28)),
+                Undate(year, rng.randint(1, 12)),
+                Undate(year),
+            ]
+        )
+
+    pairs = [(random_undate(), random_undate()) for _ in range(LOOKUPS)]
+    for first, second in pairs:
+        _ = first.earliest, second.earliest
+    return pairs
+
+
+def classify_operators(pairs):
+    results = []
+    for first, second in pairs:
+        if first in second or second in first:
+            results.append("contains")
+        elif first == second:
+            results.append("equal")
+        elif first < second:
+            results.append("before")
+        elif first > second:
+            results.append("after")
+        else:
+            results.append("overlaps")
+    return results
+
+
+def classify_compare(pairs):
+    return [first.compare(second) for first, second in pairs]
+
+
+@pytest.mark.parametrize(
+    "classify", [classify_operators, classify_compare], ids=["operators", "compare"]
+)
+def test_classify(benchmark, mixed_pairs, classify):
+    benchmark.group = f"classify {LOOKUPS} pairs"
+    benchmark.pedantic(classify, args=(mixed_pairs,), rounds=3)
+
+
+@pytest.mark.parametrize(
+    "cutoff",
+    [
+        Undate(1800, 1, 1),
+        datetime.date(1800, 1, 1),
+        datetime.datetime(1800, 1, 1, 12),
+        np.datetime64("1800-01-01"),
+        Date(1800, 1, 1),
+    ],
+    ids=["Undate", "date", "datetime", "datetime64", "Date"],
+)
+def test_filter_cutoff(benchmark, sorted_days, cutoff):
+    benchmark.group = "filter before cutoff"
+    benchmark.pedantic(
+        lambda: [undate for undate in sorted_days if undate < cutoff], rounds=3
+    )
+
+
+@pytest.fixture(scope="module")
+def mixed_dates(benchmark_rows, make_undates):
+    return with_bounds(make_undates(benchmark_rows, ["mixed"], pool_size=2000))
+
+
+def in_range(undate, start, end):
+    # python comparisons can't express "possibly"; count dates that
+    # fall within the other as not in range
+    try:
+        return undate > start and undate < end
+    except NotImplementedError:
+        return False
+
+
+def test_range_filter_undates(benchmark, mixed_dates):
+    benchmark.group = "range filter"
+    start, end = Undate(1700), Undate(1800)
+    benchmark.pedantic(
+        lambda: [undate for undate in mixed_dates if in_range(undate, start, end)],
+        rounds=1,
+        iterations=1,
+    )
+
+
+def test_range_filter_array(benchmark, mixed_dates):
+    benchmark.group = "range filter"
+    dates = UndateArray.from_undates(mixed_dates)
+    start, end = Undate(1700), Undate(1800)
+
+    def range_filter():
+        # dates definitely or possibly in range
+        in_range = np.minimum(dates.after(start), dates.before(end))
+        return dates[in_range >= TriState.POSSIBLY]
+
+    benchmark(range_filter)
@@ -0,0 +1,82 @@
+"""
+Compare calculating durations one :class:`~undate.undate.Undate` at a time
+with the batch :meth:`UndateArray.duration <undate.array.UndateArray.duration>`,
+for partial dates like those in the Shakespeare and Company Project events
+dataset (see ``examples/shakespeare-and-company-project``): ISO8601 dates
+with year only, year and month, full dates, and month and day or month
+with an unknown year. Also durations of month-precision dates with
+unknown years in each calendar, which look up month lengths for every
+possible month and representative year.
+"""
+
+import random
+
+import pytest
+
+from undate import Undate
+from undate.array import UndateArray
+from undate.converters.iso8601 import ISO8601DateFormat
+
+
+def shxco_date_strings(size, seed=1234):
+    rng = random.Random(seed)
+    dates = []
+    for _ in range(size):
+        year = rng.randint(1919, 1941)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 28)
+        dates.append(
+            rng.choice(
+                [
+                    f"{year}-{month:02}-{day:02}",
+                    f"{year}-{month:02}-{day:02}",
+                    f"{year}-{month:02}",
+                    f"{year}",
+                    f"--{month:02}-{day:02}",
+                    f"--{month:02}",
+                ]
+            )
+        )
+    return dates
+
+
+@pytest.fixture(scope="module")
+def undates(benchmark_rows):
+    isoformat = ISO8601DateFormat()
+    # parse a pool of distinct strings and repeat them, since parsing
+    # is not what is being measured here
+    pool = [isoformat.parse(value) for value in shxco_date_strings(5000)]
+    return [pool[i % len(pool)] for i in range(benchmark_rows)]
+
+
+@pytest.fixture(scope="module")
+def undate_array(undates):
+    return UndateArray.from_undates(undates)
+
+
+def test_duration_per_undate(benchmark, undates):
+    benchmark.group = "duration"
+    benchmark.pedantic(
+        lambda: [undate.duration() for undate in undates], rounds=1, iterations=1
+    )
+
+
+def test_duration_array(benchmark, undate_array):
+    benchmark.group = "duration"
+    benchmark(undate_array.duration)
+
+
+def test_duration_from_undates(benchmark, undates):
+    # include the cost of building the array from undate objects
+    benchmark.group = "duration"
+    benchmark.pedantic(
+        lambda: UndateArray.from_undates(undates).duration(), rounds=1, iterations=1
+    )
+
+
+@pytest.mark.parametrize("calendar", ["Gregorian", "Islamic", "Hebrew"])
+def test_duration_unknown_year_months(benchmark, calendar):
+    benchmark.group = "duration of month-precision dates with unknown years"
+    undates = [Undate(month=month, calendar=calendar) for month in range(1, 13)]
+    undates += [Undate("XXXX", month, calendar=calendar) for month in ["XX", "1X"]]
+    benchmark(lambda: [undate.duration() for undate in undates])
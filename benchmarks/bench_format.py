@@ -0,0 +1,44 @@
+"""
+Formatting throughput for EDTF and ISO8601: formatting each
+:class:`~undate.undate.Undate` with :meth:`~undate.undate.Undate.format`,
+formatting a list with :meth:`~undate.undate.Undate.format_many`, and
+formatting an :class:`~undate.array.UndateArray` from its stored columns.
+
+Set ``UNDATE_BENCHMARK_ROWS`` to change the number of dates
+(default: 100,000).
+"""
+
+import pytest
+
+from undate import Undate
+from undate.array import UndateArray
+
+
+@pytest.fixture(scope="module")
+def undates(benchmark_rows, make_undates):
+    # mostly distinct dates, with a mix of precisions and unknown digits
+    kinds = ["day"] * 5 + ["month"] * 2 + ["century", "unknown_day", "month_day"]
+    return make_undates(benchmark_rows, kinds)
+
+
+@pytest.fixture(scope="module")
+def undate_array(undates):
+    return UndateArray.from_undates(undates)
+
+
+@pytest.mark.parametrize("format", ["EDTF", "ISO8601"])
+def test_format_each(benchmark, undates, format):
+    benchmark.group = f"format {format}"
+    benchmark.pedantic(lambda: [undate.format(format) for undate in undates], rounds=3)
+
+
+@pytest.mark.parametrize("format", ["EDTF", "ISO8601"])
+def test_format_many(benchmark, undates, format):
+    benchmark.group = f"format {format}"
+    benchmark.pedantic(Undate.format_many, args=(undates, format), rounds=3)
+
+
+@pytest.mark.parametrize("format", ["EDTF", "ISO8601"])
+def test_format_array(benchmark, undate_array, format):
+    benchmark.group = f"format {format}"
+    benchmark.pedantic(undate_array.format, args=(format,), rounds=3)
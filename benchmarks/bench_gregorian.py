@@ -0,0 +1,121 @@
+"""
+Compare Gregorian date parsing throughput as the number of languages for
+month names grows, for a grammar with one regular expression alternation per
+month (the approach used before month names were combined into a single
+trie-structured terminal) and for the trie-based month name terminal.
+Also compares startup time and throughput for a Gregorian converter
+with English month names only and with all supported languages.
+
+Requires babel to generate month names for additional languages.
+"""
+
+import random
+
+import pytest
+from lark import Lark
+
+from undate.converters import GRAMMAR_FILE_PATH
+from undate.converters.calendars import GregorianDateConverter
+from undate.converters.calendars.gregorian.month_names import MONTH_NAMES
+from undate.converters.calendars.gregorian.parser import (
+    build_parser,
+    month_numbers,
+)
+from undate.converters.trie import trie_regex
+
+babel_dates = pytest.importorskip("babel.dates")
+
+#: languages for month names; the first seven are the languages
+#: currently included in the generated grammar
+LANGUAGES = [
+    *["en", "es", "fr", "de", "rw", "lg", "ti"],
+    *["it", "pt", "nl", "da", "sv", "nb", "fi", "pl", "cs", "sk", "sl"],
+    *["hr", "hu", "ro", "tr", "id", "ms", "sw", "ca", "eu", "gl", "cy"],
+    *["ga", "is", "et", "lv", "lt", "sq", "af", "zu", "xh", "ha", "yo"],
+]
+
+GRAMMAR_PATH = GRAMMAR_FILE_PATH / "gregorian.lark"
+MONTH_IMPORT = "%import .gregorian_multilang.MONTH_NAME"
+
+
+def month_names(languages):
+    names = {}
+    for lang in languages:
+        for width in ["wide", "abbreviated"]:
+            for month, name in babel_dates.get_month_names(width, locale=lang).items():
+                names.setdefault(name.strip(".").casefold(), month)
+    return names
+
+
+def alternation_parser(names):
+    # one rule per month, each a case-insensitive alternation of names
+    by_month = {}
+    for name, month in names.items():
+        by_month.setdefault(month, []).append(name)
+    month_rules = "\n".join(
+        f"month_{month}: /({'|'.join(sorted(month_names, key=len, reverse=True))})/i"
+        for month, month_names in sorted(by_month.items())
+    )
+    grammar = GRAMMAR_PATH.read_text().replace(MONTH_IMPORT, month_rules)
+    grammar = grammar.replace(
+        "month: MONTH_NAME", "month: " + " | ".join(f"month_{m}" for m in by_month)
+    )
+    return Lark(grammar, start="gregorian_date", source_path=str(GRAMMAR_PATH))
+
+
+def trie_parser(names):
+    grammar = GRAMMAR_PATH.read_text().replace(
+        MONTH_IMPORT, f"MONTH_NAME: /{trie_regex(names)}/i"
+    )
+    return Lark(grammar, start="gregorian_date", source_path=str(GRAMMAR_PATH))
+
+
+@pytest.fixture(scope="module")
+def date_strings():
+    # dates in the original seven languages, so the same input
+    # can be parsed with every language set
+    names = list(month_names(LANGUAGES[:7]))
+    rng = random.Random(1234)
+    return [
+        rng.choice(
+            [
+                f"{rng.randint(1, 28)} {rng.choice(names)} {rng.randint(1600, 1999)}",
+                f"{rng.choice(names)} {rng.randint(1600, 1999)}",
+                f"{rng.choice(names)} {rng.randint(1, 28)}",
+            ]
+        )
+        for _ in range(200)
+    ]
+
+
+@pytest.mark.parametrize("num_languages", [7, 20, 40])
+@pytest.mark.parametrize(
+    "make_parser", [alternation_parser, trie_parser], ids=["alternation", "trie"]
+)
+def test_parse_throughput(benchmark, date_strings, make_parser, num_languages):
+    benchmark.group = "gregorian parse 200 dates"
+    parser = make_parser(month_names(LANGUAGES[:num_languages]))
+    benchmark.pedantic(
+        lambda: [parser.parse(value) for value in date_strings], rounds=3
+    )
+
+
+@pytest.mark.parametrize("languages", [("en",), None], ids=["en", "all"])
+def test_parser_startup(benchmark, languages):
+    # time to build a parser, bypassing the parser cache
+    benchmark.group = "gregorian parser startup"
+    all_languages = tuple(MONTH_NAMES)
+    benchmark.pedantic(build_parser, args=(languages or all_languages,), rounds=5)
+
+
+@pytest.mark.parametrize("languages", [["en"], None], ids=["en", "all"])
+def test_converter_throughput(benchmark, languages):
+    benchmark.group = "gregorian converter parse 200 dates"
+    converter = GregorianDateConverter(languages=languages)
+    rng = random.Random(1234)
+    names = list(month_numbers(["en"]))
+    values = [
+        f"{rng.randint(1, 28)} {rng.choice(names)} {rng.randint(1600, 1999)}"
+        for _ in range(200)
+    ]
+    benchmark.pedantic(lambda: [converter.parse(value) for value in values], rounds=3)
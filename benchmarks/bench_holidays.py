@@ -0,0 +1,55 @@
+"""
+Compare calculating movable feast dates one year at a time with
+:mod:`convertdate` against the bulk :func:`~undate.converters.holidays.movable_feast_dates`,
+and measure parsing "Easter 1612"-style liturgical dates.
+"""
+
+import datetime
+import random
+
+import numpy as np
+import pytest
+from convertdate import holidays
+
+from undate.converters.holidays import (
+    MOVABLE_FEASTS,
+    HolidayDateConverter,
+    computus,
+    movable_feast_dates,
+)
+
+
+@pytest.fixture(scope="module")
+def years(benchmark_rows):
+    # liturgical dates spread across a few centuries
+    return np.random.default_rng(1234).integers(1500, 1900, benchmark_rows)
+
+
+def test_feast_dates_per_year(benchmark, years):
+    benchmark.group = "movable feast dates"
+    offset = datetime.timedelta(days=MOVABLE_FEASTS["PENTECOST"])
+    benchmark.pedantic(
+        lambda: [datetime.date(*holidays.easter(int(year))) + offset for year in years],
+        rounds=1,
+        iterations=1,
+    )
+
+
+def test_feast_dates_computus(benchmark, years):
+    benchmark.group = "movable feast dates"
+    benchmark(computus, years)
+
+
+def test_feast_dates_table(benchmark, years):
+    benchmark.group = "movable feast dates"
+    benchmark(movable_feast_dates, "PENTECOST", years)
+
+
+def test_parse_movable_feasts(benchmark):
+    converter = HolidayDateConverter()
+    rng = random.Random(1234)
+    feasts = ["Easter", "Pentecost", "Ash Wednesday", "Trinity Sunday"]
+    values = [f"{rng.choice(feasts)} {rng.randint(1500, 1899)}" for _ in range(1000)]
+    benchmark.pedantic(
+        lambda: [converter.parse(value) for value in values], rounds=3, iterations=1
+    )
@@ -0,0 +1,68 @@
+"""
+Finding dates by month and day regardless of year with
+:class:`~undate.index.MonthDayIndex`, compared with a vectorized scan of
+precomputed month-day keys for every date. Dates are a mix of year-less
+days and months and dates with known years.
+
+Set ``UNDATE_BENCHMARK_ROWS`` to change the number of dates
+(default: 100,000).
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from undate import Undate
+from undate.index import MonthDayIndex, month_day_keys
+
+#: number of searches in each benchmark round
+SEARCHES = 100
+
+
+@pytest.fixture(scope="module")
+def undates(benchmark_rows, make_undates):
+    return make_undates(
+        benchmark_rows, ["month_day", "month_only", "day", "month"], pool_size=2000
+    )
+
+
+@pytest.fixture(scope="module")
+def queries():
+    rng = random.Random(42)
+    return [
+        (
+            Undate(month=month, day=day),
+            Undate(month=month, day=min(day + rng.randint(0, 7), 28)),
+        )
+        for month, day in (
+            (rng.randint(1, 12), rng.randint(1, 28)) for _ in range(SEARCHES)
+        )
+    ]
+
+
+def test_build(benchmark, undates):
+    benchmark.group = "month-day index build"
+    benchmark.pedantic(MonthDayIndex, args=(undates,), rounds=3)
+
+
+def test_search_scan(benchmark, undates, queries):
+    benchmark.group = f"month-day search x{SEARCHES}"
+    keys = np.array([month_day_keys(undate) for undate in undates])
+
+    def scan():
+        return [
+            np.flatnonzero(
+                (keys[:, 0] <= month_day_keys(end)[1])
+                & (keys[:, 1] >= month_day_keys(start)[0])
+            )
+            for start, end in queries
+        ]
+
+    benchmark.pedantic(scan, rounds=3)
+
+
+def test_search_index(benchmark, undates, queries):
+    benchmark.group = f"month-day search x{SEARCHES}"
+    index = MonthDayIndex(undates)
+    benchmark(lambda: [index.search(start, end) for start, end in queries])
@@ -0,0 +1,69 @@
+"""
+Compare pandas Series of :class:`~undate.undate.Undate` stored with the
+``undate`` extension dtype against the same values in an ``object`` column.
+
+Run with ``pytest benchmarks/bench_pandas.py``; set ``UNDATE_BENCHMARK_ROWS``
+to change the number of rows (default: 100,000; object columns sort slowly,
+so expect several minutes for a million rows).
+"""
+
+import numpy as np
+import pytest
+
+from undate import Undate
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("undate.pandas")
+
+
+@pytest.fixture(scope="module")
+def series(benchmark_rows, make_undates):
+    # day-precision dates with known years can be compared in an object
+    # column without raising errors, so use those for both approaches
+    pool = make_undates(2000)
+    indices = np.random.default_rng(42).integers(0, len(pool), benchmark_rows)
+    undate_series = pd.Series(pool, dtype="undate").take(indices)
+    object_series = pd.Series(np.array(pool, dtype=object)[indices], dtype=object)
+    return {"undate": undate_series.reset_index(drop=True), "object": object_series}
+
+
+@pytest.mark.parametrize("storage", ["object", "undate"])
+def test_sort(benchmark, series, storage):
+    benchmark.group = "pandas sort"
+    benchmark.pedantic(series[storage].sort_values, rounds=1, iterations=1)
+
+
+def test_filter_object(benchmark, series):
+    benchmark.group = "pandas filter"
+    year = Undate(1801)
+    benchmark.pedantic(
+        lambda: series["object"][series["object"].map(lambda d: d in year)],
+        rounds=1,
+        iterations=1,
+    )
+
+
+def test_filter_undate(benchmark, series):
+    benchmark.group = "pandas filter"
+    year = Undate(1801)
+    benchmark(lambda: series["undate"][series["undate"].undate.contains(year)])
+
+
+def test_groupby_object(benchmark, series):
+    benchmark.group = "pandas groupby"
+    # undates are not hashable; group on string representation instead
+    benchmark.pedantic(
+        lambda: series["object"].astype(str).value_counts(), rounds=1, iterations=1
+    )
+
+
+def test_groupby_undate(benchmark, series):
+    benchmark.group = "pandas groupby"
+    benchmark(series["undate"].value_counts)
+
+
+@pytest.mark.parametrize("storage", ["object", "undate"])
+def test_memory(benchmark, series, storage):
+    benchmark.group = "pandas memory"
+    memory = benchmark(series[storage].memory_usage, deep=True)
+    benchmark.extra_info["bytes_per_row"] = memory / len(series[storage])
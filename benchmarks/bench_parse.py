@@ -0,0 +1,68 @@
+"""
+Parsing throughput for each converter with a realistic corpus (see
+``conftest.py``): EDTF dates with unknown digits, ISO8601 intervals,
+Hebrew and Islamic dates with month names, and liturgical holidays, and
+for the omnibus converter with the corpora it supports mixed together.
+"""
+
+import random
+
+import pytest
+
+from undate.converters.base import BaseDateConverter
+from undate.converters.combined import OmnibusDateConverter
+
+FORMATS = ["EDTF", "ISO8601", "Hebrew", "Islamic", "holidays"]
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_parse(benchmark, corpora, format):
+    benchmark.group = "parse 500 dates"
+    converter = BaseDateConverter.available_converters()[format]()
+    values = corpora[format]
+    benchmark.pedantic(
+        lambda: [converter.parse(value) for value in values], rounds=3, iterations=1
+    )
+
+
+def test_parse_omnibus(benchmark, corpora):
+    benchmark.group = "parse 500 dates"
+    converter = OmnibusDateConverter()
+    # omnibus does not include an ISO8601 parser; intervals within a single
+    # year are also not currently parsed as EDTF by omnibus
+    values = random.Random(1234).sample(
+        [
+            value
+            for format in FORMATS
+            if format != "ISO8601"
+            for value in corpora[format]
+        ],
+        500,
+    )
+    benchmark.pedantic(
+        lambda: [converter.parse(value) for value in values], rounds=3, iterations=1
+    )
+
+
+@pytest.mark.parametrize("use_bounds", [False, True], ids=["format", "format+bounds"])
+def test_parse_format_iso8601(benchmark, use_bounds):
+    # converting between formats doesn't need earliest and latest, which
+    # are only calculated when used; ISO8601 parsing doesn't use a
+    # grammar, so Undate initialization is a large part of the time
+    benchmark.group = "parse and format 2000 ISO8601 dates"
+    converter = BaseDateConverter.available_converters()["ISO8601"]()
+    rng = random.Random(1234)
+    values = [
+        rng.choice(["1920", "1931-05", "1938-11-02", "--05-03"]) for _ in range(2000)
+    ]
+
+    def parse_format():
+        formatted = []
+        for value in values:
+            date = converter.parse(value)
+            if use_bounds:
+                _ = date.earliest, date.latest
+            formatted.append(converter.to_string(date))
+        return formatted
+
+    benchmark(parse_format)
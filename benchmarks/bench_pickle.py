@@ -0,0 +1,94 @@
+"""
+Size and speed of pickling dates, as used when passing dates between
+processes (e.g. :class:`~undate.aio.AsyncParser` with a process pool) or
+caching them, with the compact pickling implemented by undate classes
+and with default pickling of every attribute (including converters and
+calculated dates). Pickled size in bytes is reported in ``extra_info``.
+"""
+
+import copyreg
+import io
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from undate import Undate, UndateInterval
+from undate.date import Date, Timedelta, UnDelta
+
+
+def _set_attributes(obj, state):
+    obj.__dict__.update(state)
+
+
+class DefaultPickler(pickle.Pickler):
+    """Pickler that ignores custom pickling for undate classes, to compare
+    with default pickling of instance attributes and numpy arrays."""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, (Undate, UndateInterval, UnDelta)):
+            return (
+                copyreg.__newobj__,
+                (type(obj),),
+                dict(vars(obj)),
+                None,
+                None,
+                _set_attributes,
+            )
+        if isinstance(obj, (Date, Timedelta)):
+            return np.ndarray.__reduce__(obj)
+        return NotImplemented
+
+
+def default_dumps(obj):
+    buffer = io.BytesIO()
+    DefaultPickler(buffer, protocol=pickle.DEFAULT_PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def dates():
+    # undates and intervals with bounds already calculated, as after
+    # comparing or sorting; plus durations
+    rng = random.Random(1234)
+    undates = [
+        rng.choice(
+            [
+                Undate(rng.randint(1500, 1950), rng.randint(1, 12), rng.randint(1, 28)),
+                Undate(rng.randint(1500, 1950), rng.randint(1, 12)),
+                Undate(f"1{rng.randint(5, 9)}XX", label="century"),
+            ]
+        )
+        for _ in range(2000)
+    ]
+    intervals = [
+        UndateInterval(Undate(year), Undate(year + rng.randint(1, 20)))
+        for year in (rng.randint(1500, 1950) for _ in range(500))
+    ]
+    for undate in undates:
+        _ = undate.earliest, undate.latest
+    durations = [undate.duration() for undate in undates[:500]]
+    return [*undates, *intervals, *durations]
+
+
+@pytest.mark.parametrize(
+    "dumps",
+    [default_dumps, pickle.dumps],
+    ids=["default", "compact"],
+)
+def test_dumps(benchmark, dates, dumps):
+    benchmark.group = "pickle 3000 dates"
+    benchmark.extra_info["bytes"] = len(dumps(dates))
+    benchmark.pedantic(dumps, args=(dates,), rounds=5)
+
+
+@pytest.mark.parametrize(
+    "dumps",
+    [default_dumps, pickle.dumps],
+    ids=["default", "compact"],
+)
+def test_loads(benchmark, dates, dumps):
+    benchmark.group = "unpickle 3000 dates"
+    data = dumps(dates)
+    benchmark.pedantic(pickle.loads, args=(data,), rounds=5)
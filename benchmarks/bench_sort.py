@@ -0,0 +1,49 @@
+"""
+Sorting collections of dates: :func:`sorted` with ``<`` comparisons
+(which only works for dates that never fall within each other, so uses
+day-precision dates with known years), :func:`sorted` with
+:meth:`Undate.sort_key <undate.undate.Undate.sort_key>`, and
+:meth:`UndateArray.argsort <undate.array.UndateArray.argsort>`.
+
+Sorting with Python comparisons uses 10,000 dates; ``argsort`` uses
+``UNDATE_BENCHMARK_ROWS`` dates (default: 100,000).
+"""
+
+import numpy as np
+import pytest
+
+from undate import Undate
+from undate.array import UndateArray
+
+PYTHON_SORT_SIZE = 10_000
+
+
+@pytest.fixture(scope="module")
+def days(make_undates):
+    return make_undates(PYTHON_SORT_SIZE)
+
+
+def test_sort_compare(benchmark, days):
+    benchmark.group = f"sort {PYTHON_SORT_SIZE} dates"
+    # bounds are calculated on first use; calculate them before timing
+    _ = [undate.earliest for undate in days]
+    benchmark.pedantic(sorted, args=(days,), rounds=3)
+
+
+@pytest.mark.parametrize("kind", ["day", "mixed"])
+def test_sort_key(benchmark, make_undates, kind):
+    benchmark.group = f"sort {PYTHON_SORT_SIZE} dates"
+    undates = make_undates(PYTHON_SORT_SIZE, [kind])
+    _ = [undate.earliest for undate in undates]
+    benchmark.pedantic(
+        sorted, args=(undates,), kwargs={"key": Undate.sort_key}, rounds=3
+    )
+
+
+@pytest.mark.parametrize("kind", ["day", "mixed"])
+def test_argsort(benchmark, benchmark_rows, make_undates, kind):
+    benchmark.group = "argsort"
+    pool = UndateArray.from_undates(make_undates(2000, [kind]))
+    indices = np.random.default_rng(42).integers(0, len(pool), benchmark_rows)
+    dates = pool.take(indices)
+    benchmark.pedantic(dates.argsort, rounds=5)
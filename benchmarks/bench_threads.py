@@ -0,0 +1,44 @@
+"""
+Measure parsing throughput when a single converter instance is shared
+by multiple threads. Parsing is mostly pure Python, so throughput is limited
+by the GIL on standard CPython builds; on free-threaded builds it should
+scale with the number of threads.
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from undate.converters.combined import OmnibusDateConverter
+
+VALUES = [
+    "2001-XX",
+    "1984?",
+    "18 June 1900",
+    "Tammuz 4816",
+    "Jumādā I 1243",
+    "Easter 1612",
+    "1800/1805",
+]
+
+
+@pytest.fixture(scope="module")
+def date_strings():
+    rng = random.Random(1234)
+    return [rng.choice(VALUES) for _ in range(500)]
+
+
+@pytest.mark.parametrize("num_threads", [1, 2, 4, 8])
+def test_parse_threads(benchmark, date_strings, num_threads):
+    benchmark.group = "omnibus parse 500 dates, shared converter"
+    converter = OmnibusDateConverter()
+    chunks = [date_strings[i::num_threads] for i in range(num_threads)]
+
+    def parse_chunk(values):
+        return [converter.parse(value) for value in values]
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        benchmark.pedantic(
+            lambda: list(executor.map(parse_chunk, chunks)), rounds=3, iterations=1
+        )
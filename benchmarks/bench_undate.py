@@ -0,0 +1,134 @@
+"""
+Benchmarks for the core hot paths: constructing :class:`~undate.undate.Undate`
+and :class:`~undate.date.Date` objects (including earliest and latest
+dates for unknown years), comparing and sorting undates, memory
+used per object, and import time. Memory per object is recorded in the
+benchmark ``extra_info``.
+"""
+
+import random
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+from undate import Undate
+from undate.date import Date
+
+#: number of objects constructed or compared in each benchmark
+SIZE = 2000
+
+
+def date_parts(seed=1234):
+    rng = random.Random(seed)
+    return [
+        (rng.randint(1000, 1999), rng.randint(1, 12), rng.randint(1, 28))
+        for _ in range(SIZE)
+    ]
+
+
+def undate_args(kind, seed=1234):
+    parts = date_parts(seed)
+    if kind == "day":
+        return [(year, month, day) for year, month, day in parts]
+    if kind == "month":
+        return [(year, month) for year, month, _ in parts]
+    if kind == "year":
+        return [(year,) for year, _, _ in parts]
+    # unknown digits in year and month
+    return [(f"{str(year)[:2]}XX", f"{month:02}"[0] + "X") for year, month, _ in parts]
+
+
+@pytest.fixture(scope="module")
+def undates():
+    args = undate_args("day") + undate_args("unknown", seed=5678)
+    return [Undate(*arg) for arg in random.Random(1234).sample(args, SIZE)]
+
+
+@pytest.mark.parametrize("kind", ["day", "month", "year", "unknown"])
+def test_undate_init(benchmark, kind):
+    benchmark.group = "construct undates"
+    args = undate_args(kind)
+    benchmark(lambda: [Undate(*arg) for arg in args])
+
+
+@pytest.mark.parametrize("calendar", ["Gregorian", "Hebrew", "Islamic"])
+def test_unknown_year_bounds(benchmark, calendar):
+    # dates with unknown years have bounds in extreme years
+    benchmark.group = "unknown year bounds"
+    rng = random.Random(1234)
+    args = [(rng.randint(1, 12), rng.randint(1, 28)) for _ in range(SIZE)]
+
+    def construct():
+        undates = [Undate(month=m, day=d, calendar=calendar) for m, d in args]
+        return [(undate.earliest, undate.latest) for undate in undates]
+
+    benchmark(construct)
+
+
+def test_date_new(benchmark):
+    benchmark.group = "construct dates"
+    parts = date_parts()
+    benchmark(lambda: [Date(*part) for part in parts])
+
+
+def test_undate_eq(benchmark, undates):
+    benchmark.group = "compare undates"
+    pairs = list(zip(undates, reversed(undates), strict=True))
+    benchmark(lambda: [a == b for a, b in pairs])
+
+
+def test_undate_lt(benchmark, undates):
+    benchmark.group = "compare undates"
+    # only compare known day-precision dates, which are always comparable
+    known = [undate for undate in undates if undate.known_year]
+    pairs = list(zip(known, reversed(known), strict=True))
+
+    benchmark(lambda: [a < b for a, b in pairs])
+
+
+def test_undate_sort(benchmark, undates):
+    benchmark.group = "compare undates"
+    known = [undate for undate in undates if undate.known_year]
+    benchmark(sorted, known)
+
+
+def allocated_bytes(func):
+    """Bytes allocated (and still in use) by the objects returned by func."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+@pytest.mark.parametrize("kind", ["day", "unknown"])
+def test_undate_memory(benchmark, kind):
+    benchmark.group = "memory per object"
+    args = undate_args(kind)
+    benchmark.extra_info["bytes_per_object"] = (
+        allocated_bytes(lambda: [Undate(*arg) for arg in args]) / SIZE
+    )
+    benchmark.pedantic(lambda: [Undate(*arg) for arg in args], rounds=1)
+
+
+@pytest.mark.parametrize(
+    "module", ["undate", "undate.converters.combined"], ids=["undate", "omnibus"]
+)
+def test_import_time(benchmark, module):
+    # fresh interpreter for each import; includes interpreter startup
+    benchmark.group = "import time"
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    result = benchmark.pedantic(
+        subprocess.run, args=(command,), kwargs={"capture_output": True}, rounds=5
+    )
+    # cumulative import time in microseconds, as reported by python -X importtime
+    for line in result.stderr.decode().splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            benchmark.extra_info["import_time_us"] = int(fields[1])
@@ -0,0 +1,62 @@
+"""
+Resolving dates with a known weekday and partially known year (e.g.
+"Tuesday, 12 March 1XXX") to candidate dates with
+:meth:`Undate.resolve_weekday <undate.undate.Undate.resolve_weekday>`,
+which calculates weekdays for all possible years at once, compared with
+checking the weekday of each possible year with
+:class:`~undate.date.Date`; and resolving a column of dates and weekdays
+with :meth:`UndateArray.resolve_weekday
+<undate.array.UndateArray.resolve_weekday>`.
+
+Set ``UNDATE_BENCHMARK_ROWS`` to change the number of rows in the column
+(default: 100,000).
+"""
+
+import random
+
+import pytest
+
+from undate import Undate
+from undate.array import UndateArray
+from undate.date import Date, Weekday
+
+
+@pytest.mark.parametrize("calendar", ["Gregorian", "Hebrew"])
+def test_resolve_loop(benchmark, calendar):
+    benchmark.group = f"resolve weekday 1XXX-03-12 {calendar}"
+    undate = Undate("1XXX", 3, 12, calendar=calendar)
+    converter = undate.calendar_converter
+
+    def resolve():
+        return [
+            year
+            for year in undate.possible_years
+            if Date(*converter.to_gregorian(year, 3, 12)).weekday == Weekday.TUESDAY
+        ]
+
+    benchmark(resolve)
+
+
+@pytest.mark.parametrize("calendar", ["Gregorian", "Hebrew"])
+def test_resolve_weekday(benchmark, calendar):
+    benchmark.group = f"resolve weekday 1XXX-03-12 {calendar}"
+    undate = Undate("1XXX", 3, 12, calendar=calendar)
+    benchmark(undate.resolve_weekday, Weekday.TUESDAY)
+
+
+@pytest.fixture(scope="module")
+def weekday_column(benchmark_rows):
+    rng = random.Random(1234)
+    pool = [
+        Undate(f"{rng.randint(15, 19)}XX", rng.randint(1, 12), rng.randint(1, 28))
+        for _ in range(200)
+    ]
+    undates = [rng.choice(pool) for _ in range(benchmark_rows)]
+    weekdays = [rng.randint(0, 6) for _ in range(benchmark_rows)]
+    return UndateArray.from_undates(undates), weekdays
+
+
+def test_resolve_weekday_column(benchmark, weekday_column):
+    benchmark.group = "resolve weekday column"
+    dates, weekdays = weekday_column
+    benchmark.pedantic(dates.resolve_weekday, args=(weekdays,), rounds=3)
@@ -0,0 +1,180 @@
+import datetime
+import itertools
+import os
+import random
+
+import pytest
+from convertdate import hebrew
+
+from undate import Undate
+
+pytest.importorskip("pytest_benchmark")
+
+#: number of rows used for collection benchmarks; override with
+#: the UNDATE_BENCHMARK_ROWS environment variable
+BENCHMARK_ROWS = int(os.environ.get("UNDATE_BENCHMARK_ROWS", "100000"))
+
+
+@pytest.fixture(scope="session")
+def benchmark_rows():
+    return BENCHMARK_ROWS
+
+
+#: kinds of dates generated by :func:`random_undates`, by name
+UNDATE_KINDS = {
+    "day": lambda rng: Undate(
+        rng.randint(1500, 1950), rng.randint(1, 12), rng.randint(1, 28)
+    ),
+    "month": lambda rng: Undate(rng.randint(1500, 1950), rng.randint(1, 12)),
+    "year": lambda rng: Undate(rng.randint(1500, 1950)),
+    "century": lambda rng: Undate(f"1{rng.randint(5, 9)}XX"),
+    "unknown_day": lambda rng: Undate(
+        rng.randint(1500, 1950), rng.randint(1, 12), "XX"
+    ),
+    "month_day": lambda rng: Undate(month=rng.randint(1, 12), day=rng.randint(1, 28)),
+    "month_only": lambda rng: Undate(month=rng.randint(1, 12)),
+}
+#: mixed precision, including dates that fall within each other and
+#: partially known and unknown years, which can't be sorted with comparisons
+UNDATE_KINDS["mixed"] = lambda rng: UNDATE_KINDS[
+    rng.choice(["day", "month", "year", "century", "month_day"])
+](rng)
+
+
+def random_undates(size, kinds=("day",), pool_size=None, seed=1234):
+    """Random dates of the named kinds (keys of :data:`UNDATE_KINDS`;
+    repeat a kind to generate more of it). If ``pool_size`` is set, dates
+    are chosen from a pool of that many dates, so that dates repeat as
+    they do in real collections; otherwise, dates are mostly distinct."""
+    rng = random.Random(seed)
+    generators = [UNDATE_KINDS[kind] for kind in kinds]
+    count = size if pool_size is None else pool_size
+    undates = [rng.choice(generators)(rng) for _ in range(count)]
+    if pool_size is None:
+        return undates
+    return [rng.choice(undates) for _ in range(size)]
+
+
+@pytest.fixture(scope="session")
+def make_undates():
+    """Seeded generator of random dates; see :func:`random_undates`."""
+    return random_undates
+
+
+#: number of strings in each parsing corpus; parsing is much slower than
+#: vectorized operations, so corpora are smaller than collection benchmarks
+CORPUS_SIZE = 500
+
+HEBREW_MONTHS = [
+    *["Nisan", "Iyyar", "Sivan", "Tammuz", "Av", "Elul", "Tishrei"],
+    *["Ḥeshvan", "Kislev", "Teveth", "Shevat", "Adar", "Adar II"],
+]
+ISLAMIC_MONTHS = [
+    *["Muḥarram", "Ṣafar", "Rabīʿ I", "Rabīʿ ath-Thānī"],
+    *["Jumādā I", "Jumādā ath-Thāniyah", "Rajab", "Shaʿbān"],
+    *["Ramaḍān", "Shawwāl", "Dhū al-Qaʿdah", "Dhū al-Ḥijjah"],
+]
+HOLIDAYS = [
+    *["Easter", "Easter Monday", "Holy Saturday", "Ascension", "Pentecost"],
+    *["Whit Monday", "Trinity Sunday", "Ash Wednesday", "Shrove Tuesday"],
+    *["Epiphany", "Candlemas", "St. Patrick's Day", "All Fools Day"],
+]
+
+
+def edtf_strings(size=CORPUS_SIZE, seed=1234):
+    """EDTF dates with unknown digits, qualifiers, and intervals, like
+    those in catalog metadata."""
+    rng = random.Random(seed)
+    strings = []
+    for _ in range(size):
+        year = rng.randint(1000, 1999)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 28)
+        strings.append(
+            rng.choice(
+                [
+                    f"{year}-{month:02}-{day:02}",
+                    f"{year}-{month:02}",
+                    f"{str(year)[:3]}X",
+                    f"{str(year)[:2]}XX",
+                    f"{year}-XX",
+                    f"{year}-{month:02}-XX",
+                    f"XXXX-{month:02}-{day:02}",
+                    f"{year}?",
+                    f"{year}-{month:02}~",
+                    f"{year}/{year + rng.randint(1, 20)}",
+                ]
+            )
+        )
+    return strings
+
+
+def iso_interval_strings(size=CORPUS_SIZE, seed=1234):
+    """ISO8601 intervals between dates of varying precision."""
+    rng = random.Random(seed)
+    strings = []
+    for _ in range(size):
+        start = datetime.date(rng.randint(1800, 1999), 1, 1) + datetime.timedelta(
+            days=rng.randint(0, 364)
+        )
+        end = start + datetime.timedelta(days=rng.randint(40, 1000))
+        strings.append(
+            rng.choice(
+                [
+                    f"{start.isoformat()}/{end.isoformat()}",
+                    f"{start:%Y-%m}/{end:%Y-%m}",
+                    f"{start.year}/{end.year + 1}",
+                    f"{start.isoformat()}/{end.year + 1}",
+                ]
+            )
+        )
+    return strings
+
+
+def month_name_strings(months, min_year, max_year, size=CORPUS_SIZE, seed=1234):
+    """Dates with month names: day, month and year, or month and year."""
+    rng = random.Random(seed)
+    strings = []
+    for _ in range(size):
+        month = rng.choice(months)
+        year = rng.randint(min_year, max_year)
+        strings.append(
+            rng.choice([f"{rng.randint(1, 29)} {month} {year}", f"{month} {year}"])
+        )
+    return strings
+
+
+def hebrew_strings(size=CORPUS_SIZE, seed=1234):
+    """Hebrew calendar dates with month names (Anno Mundi years).
+    Adar II only occurs in leap years, so dates in Adar II use the next
+    leap year."""
+    strings = month_name_strings(HEBREW_MONTHS, 5000, 5700, size, seed)
+    for i, value in enumerate(strings):
+        if "Adar II" in value:
+            prefix, year = value.rsplit(" ", 1)
+            leap_year = next(y for y in itertools.count(int(year)) if hebrew.leap(y))
+            strings[i] = f"{prefix} {leap_year}"
+    return strings
+
+
+def islamic_strings(size=CORPUS_SIZE, seed=1234):
+    """Islamic calendar dates with transliterated month names (Hijri years)."""
+    return month_name_strings(ISLAMIC_MONTHS, 100, 1400, size, seed)
+
+
+def holiday_strings(size=CORPUS_SIZE, seed=1234):
+    """Liturgical dates, e.g. "Easter 1612"."""
+    rng = random.Random(seed)
+    return [f"{rng.choice(HOLIDAYS)} {rng.randint(1500, 1900)}" for _ in range(size)]
+
+
+@pytest.fixture(scope="session")
+def corpora():
+    """Parsing corpora by converter name."""
+    return {
+        "EDTF": edtf_strings(),
+        "ISO8601": iso_interval_strings(),
+        "Hebrew": hebrew_strings(),
+        "Islamic": islamic_strings(),
+        "holidays": holiday_strings(),
+    }
@@ -1,26 +1,37 @@
 #!/usr/bin/env python
 """
 This script generates the gregorian_multilang.lark file
-with month names (full and abbreviated) based on the list of
-target languages.
+and the month_names.py module with month names (full and abbreviated)
+based on the list of target languages.
 
-Run this script with hatch to regenerate the file::
+The grammar file defines a single ``MONTH_NAME`` terminal that matches
+month names in all languages, using a trie-structured regular expression;
+the Python module provides the month names for each language, which are
+used to look up the numeric month for a parsed month name.
+
+Run this script with hatch to regenerate the files::
 
     hatch run codegen:generate
 
 """
 
+import json
 import pathlib
-from collections import defaultdict
 
 from babel.dates import get_month_names
 
+from undate.converters.trie import trie_regex
+
 # lark grammar path relative to this script
 GRAMMAR_DIR_PATH = (
     pathlib.Path(__file__).parent.parent / "src" / "undate" / "converters" / "grammars"
 )
 # file that is generated by this script, in that directory
 MONTH_GRAMMAR_FILE = GRAMMAR_DIR_PATH / "gregorian_multilang.lark"
+# python module with month names by language, also generated by this script
+MONTH_NAMES_FILE = (
+    GRAMMAR_DIR_PATH.parent / "calendars" / "gregorian" / "month_names.py"
+)
 
 # include month names in the following languages
 languages = [
@@ -39,37 +50,67 @@ warning_text = """// WARNING: This file is auto-generated. DO NOT EDIT.
 
 """
 
+module_text = '''"""
+Month names (full and abbreviated) for parsing Gregorian dates,
+by language code.
+
+WARNING: This file is auto-generated. DO NOT EDIT.
+To regenerate: hatch run codegen:generate
+"""
+
+#: casefolded month names and numeric month, by language code
+MONTH_NAMES: dict[str, dict[str, int]] = {}
+'''
+
+
+def get_language_month_names(lang: str) -> dict[str, int]:
+    """Get a dictionary of casefolded month names (full and abbreviated)
+    and numeric month for a single language."""
+    month_names: dict[str, int] = {}
+    for width in ["wide", "abbreviated"]:
+        for month_num, month_name in get_month_names(width, locale=lang).items():
+            # some locales use a . on the shortened month; let's ignore that
+            month_name = month_name.strip(".").casefold()
+            # in some cases, abbreviated and full are the same;
+            # only add if not already present
+            month_names.setdefault(month_name, month_num)
+    return month_names
+
 
 def main():
-    # create a dictionary of lists to hold the names for each month
-    all_month_names = defaultdict(list)
-
-    for lang in languages:
-        for width in ["wide", "abbreviated"]:
-            for month_num, month_name in get_month_names(width, locale=lang).items():
-                # some locales use a . on the shortened month; let's ignore that
-                month_name = month_name.strip(".").lower()
-                # In some cases different languages have the same abbreviations;
-                # in some cases, abbreviated and full are the same.
-                # Only add if not already present, to avoid redundancy
-                if month_name not in all_month_names[month_num]:
-                    all_month_names[month_num].append(month_name)
+    all_month_names = {lang: get_language_month_names(lang) for lang in languages}
+
+    # warn about names that are used for different months in different languages
+    name_months: dict[str, set[int]] = {}
+    for month_names in all_month_names.values():
+        for name, month_num in month_names.items():
+            name_months.setdefault(name, set()).add(month_num)
+    for name, months in name_months.items():
+        if len(months) > 1:
+            print(f"Warning: '{name}' is used for multiple months: {sorted(months)}")
 
     with MONTH_GRAMMAR_FILE.open("w") as outfile:
         outfile.write(warning_text)
-
-        # for each numeric month, generate a rule with all variant names:
-        # month_1:  /January|Jan/i
-        for i, names in all_month_names.items():
-            # combine all names in a case-insensitive OR regex
-            # sort shortest variants last to avoid partial matches hitting first
-            or_names = "|".join(sorted(names, key=len, reverse=True))
-            outfile.write(f"month_{i}: /({or_names})/i\n")
-
-    print(
-        f"Successfully regenerated {MONTH_GRAMMAR_FILE.relative_to(pathlib.Path.cwd())}"
-    )
-    print("If the file has changed, make sure to commit the new version.")
+        # single case-insensitive terminal for month names in all languages;
+        # numeric month is determined from the name when transforming
+        outfile.write(f"MONTH_NAME: /{trie_regex(name_months)}/i\n")
+
+    # write out month names as a python dictionary, formatted one name per line
+    lines = ["{"]
+    for lang, month_names in all_month_names.items():
+        lines.append(f"    {json.dumps(lang)}: {{")
+        lines.extend(
+            f"        {json.dumps(name, ensure_ascii=False)}: {month_num},"
+            for name, month_num in month_names.items()
+        )
+        lines.append("    },")
+    lines.append("}")
+    with MONTH_NAMES_FILE.open("w") as outfile:
+        outfile.write(module_text.replace("{}", "\n".join(lines)))
+
+    for path in [MONTH_GRAMMAR_FILE, MONTH_NAMES_FILE]:
+        print(f"Successfully regenerated {path.relative_to(pathlib.Path.cwd())}")
+    print("If the files have changed, make sure to commit the new versions.")
 
 
 if __name__ == "__main__":
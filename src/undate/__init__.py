@@ -4,12 +4,13 @@ __version__ = "0.8.0"
 
 # ruff: noqa: I001
 from undate.date import DatePrecision, UnDelta
-from undate.undate import Calendar, Undate
+from undate.undate import Calendar, Relation, Undate
 from undate.interval import UndateInterval
 
 __all__ = [
     "Calendar",
     "DatePrecision",
+    "Relation",
     "UnDelta",
     "Undate",
     "UndateInterval",
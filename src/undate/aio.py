@@ -0,0 +1,212 @@
+"""
+Asynchronous parsing for :mod:`asyncio` applications.
+
+Parsing dates can take long enough (particularly for the omnibus parser)
+to block an event loop, so :class:`AsyncParser` runs parsing in an executor
+instead. Concurrent requests are collected into small batches, so that many
+short parses share the overhead of a single executor call; the number of
+pending requests is limited, so callers wait when the parser falls behind::
+
+    from undate import aio
+
+    date = await aio.parse("Easter 1612", "omnibus")
+    dates = await aio.parse_many(["1984?", "2001-XX"], "EDTF")
+
+The module-level functions use a default :class:`AsyncParser` for the
+running event loop, with the loop's default (thread) executor. To parse in
+separate processes, create an :class:`AsyncParser` with a
+:class:`~concurrent.futures.ProcessPoolExecutor`; use :func:`get_converter`
+as the initializer to load converters when each worker process starts::
+
+    with ProcessPoolExecutor(
+        initializer=aio.get_converter, initargs=("omnibus",)
+    ) as executor:
+        parser = aio.AsyncParser(executor=executor)
+        dates = await parser.parse_many(values, "omnibus")
+
+-------------------
+"""
+
+import asyncio
+import collections
+import time
+import weakref
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
+
+import numpy as np
+
+from undate import cache as parse_cache
+from undate.converters.base import BaseDateConverter
+from undate.interval import UndateInterval
+from undate.undate import Undate
+
+
+def get_converter(format: str) -> BaseDateConverter:
+    """Converter instance for a named format, shared by all batches parsed
+    in this process (converters are safe to share between threads)."""
+    try:
+        return BaseDateConverter.get_converter(format)
+    except KeyError:
+        raise ValueError(f"Unsupported format '{format}'") from None
+
+
+def parse_batch(
+    requests: Sequence[tuple[str, str]],
+) -> list[Undate | UndateInterval | Exception]:
+    """Parse a batch of (value, format) pairs; values that can't be parsed
+    return the exception instead of a result. Runs in the executor, so it
+    must be a module-level function to support process executors."""
+    return [_parse_or_error(value, format) for value, format in requests]
+
+
+def _parse_or_error(value: str, format: str) -> Undate | UndateInterval | Exception:
+    try:
+        return parse_cache.parse(get_converter(format), value)
+    # any error is returned to the caller that requested this value,
+    # rather than failing the rest of the batch
+    except Exception as err:  # noqa: BLE001
+        return err
+
+
+class AsyncParser:
+    """Parse dates in an executor, combining concurrent requests into batches.
+
+    :param executor: executor for parsing; uses the event loop's default
+        executor if not specified
+    :param max_batch_size: maximum number of values parsed in one executor call
+    :param max_batch_delay: maximum time (in seconds) to wait for more
+        requests before parsing a batch that is not full
+    :param max_pending: maximum number of requests queued or being parsed;
+        additional requests wait until earlier ones are finished
+    :param latency_window: number of recent requests to keep latencies for
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_batch_size: int = 64,
+        max_batch_delay: float = 0.002,
+        max_pending: int = 1024,
+        latency_window: int = 10000,
+    ):
+        if max_batch_size < 1 or max_pending < 1:
+            raise ValueError("Batch size and pending limit must be at least 1")
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        #: request latencies in seconds, from call to result, most recent last
+        self.latencies: collections.deque[float] = collections.deque(
+            maxlen=latency_window
+        )
+        #: number of batches sent to the executor
+        self.batch_count = 0
+        self._pending = asyncio.Semaphore(max_pending)
+        # requests waiting to be sent to the executor, with their futures
+        self._batch: list[tuple[str, str, asyncio.Future]] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        # keep references to running batches so they aren't garbage collected
+        self._tasks: set[asyncio.Task] = set()
+
+    async def parse(self, value: str, format: str) -> Undate | UndateInterval:
+        """Parse a string to an undate or undate interval using the
+        specified format, as :meth:`Undate.parse <undate.undate.Undate.parse>`."""
+        # check the format before queueing, so unsupported formats fail immediately
+        if format not in BaseDateConverter.available_converters():
+            raise ValueError(f"Unsupported format '{format}'")
+        start = time.perf_counter()
+        async with self._pending:
+            future = asyncio.get_running_loop().create_future()
+            self._add(value, format, future)
+            result = await future
+        self.latencies.append(time.perf_counter() - start)
+        return result
+
+    async def parse_many(
+        self, values: Iterable[str], format: str, return_exceptions: bool = False
+    ) -> list[Undate | UndateInterval | BaseException]:
+        """Parse multiple strings with the specified format, returning
+        results in the same order. If ``return_exceptions`` is True, values that
+        can't be parsed return the exception instead of raising it."""
+        return await asyncio.gather(
+            *(self.parse(value, format) for value in values),
+            return_exceptions=return_exceptions,
+        )
+
+    def latency_percentiles(
+        self, percentiles: Sequence[float] = (50, 90, 99)
+    ) -> dict[float, float]:
+        """Latency in seconds at the specified percentiles, for recent
+        requests; empty if no requests have been parsed."""
+        if not self.latencies:
+            return {}
+        values = np.percentile(np.fromiter(self.latencies, float), percentiles)
+        return dict(zip(percentiles, values.tolist(), strict=True))
+
+    def _add(self, value: str, format: str, future: asyncio.Future):
+        self._batch.append((value, format, future))
+        if len(self._batch) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self.max_batch_delay, self._flush
+            )
+
+    def _flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            self.batch_count += 1
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[str, str, asyncio.Future]]):
+        loop = asyncio.get_running_loop()
+        requests = [(value, format) for value, format, _ in batch]
+        try:
+            results = await loop.run_in_executor(self.executor, parse_batch, requests)
+        except Exception as err:  # noqa: BLE001
+            # executor failure (e.g. a broken process pool) fails the whole batch
+            results = [err] * len(batch)
+        for (_, _, future), result in zip(batch, results, strict=True):
+            # caller may have cancelled while waiting
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+# default parser for each event loop, used by module-level functions
+_default_parsers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncParser] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def default_parser() -> AsyncParser:
+    """Default :class:`AsyncParser` for the running event loop."""
+    loop = asyncio.get_running_loop()
+    parser = _default_parsers.get(loop)
+    if parser is None:
+        parser = _default_parsers[loop] = AsyncParser()
+    return parser
+
+
+async def parse(value: str, format: str) -> Undate | UndateInterval:
+    """Parse a string with the specified format using the default parser;
+    see :meth:`AsyncParser.parse`."""
+    return await default_parser().parse(value, format)
+
+
+async def parse_many(
+    values: Iterable[str], format: str, return_exceptions: bool = False
+) -> list[Undate | UndateInterval | BaseException]:
+    """Parse multiple strings with the specified format using the default
+    parser; see :meth:`AsyncParser.parse_many`."""
+    return await default_parser().parse_many(
+        values, format, return_exceptions=return_exceptions
+    )
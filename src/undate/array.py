@@ -0,0 +1,746 @@
+"""
+Columnar storage for collections of :class:`~undate.undate.Undate` objects.
+
+:class:`UndateArray` stores the values used to initialize each undate
+(with unknown digits recorded as bit masks), the date precision, the calendar,
+and the Gregorian earliest and latest bounds as NumPy arrays, so that
+operations over large collections (filtering, sorting, grouping) can run as
+NumPy expressions instead of Python comparisons between individual
+:class:`~undate.undate.Undate` objects.
+
+Example usage::
+
+    dates = UndateArray.from_undates([Undate(1801, 3), Undate("19XX"), Undate(month=5)])
+    dates.known_year  # array([ True, False, False])
+    dates.contains(Undate(1801, 3, 12))  # array([ True, False, False])
+
+Comparisons that can't be decided for some dates, because the dates are
+uncertain, are available as tri-state arrays of :class:`TriState` values
+(false, possibly, true), so that dates that may match are explicit::
+
+    dates.before(Undate(1850))  # array([2, 1, 1], dtype=int8)
+    dates[dates.before(Undate(1850)) >= TriState.POSSIBLY]
+
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from enum import IntEnum
+
+import numpy as np
+
+from undate.converters.base import BaseDateConverter
+from undate.date import Date, DatePrecision, UnDelta
+from undate.undate import Calendar, Undate
+
+#: names of the parts of the date, in the order used for columns
+DATE_PARTS: tuple[str, str, str] = ("year", "month", "day")
+
+#: calendars in the order used for numeric calendar codes
+CALENDARS: list[Calendar] = list(Calendar)
+
+
+class TriState(IntEnum):
+    """Result of a comparison that may not be decidable for uncertain dates,
+    as returned by tri-state comparisons such as :meth:`UndateArray.before`.
+    Values are ordered, so ``result >= TriState.POSSIBLY`` selects dates
+    that possibly or definitely match, and results can be combined with
+    :func:`numpy.minimum` (and) and :func:`numpy.maximum` (or)."""
+
+    #: definitely false
+    FALSE = 0
+    #: possibly true, depending on unknown parts of the dates
+    POSSIBLY = 1
+    #: definitely true
+    TRUE = 2
+
+
+def encode_part(value: int | str | None) -> tuple[int, int, int, bool]:
+    """Encode a single year, month or day value used to initialize an
+    :class:`~undate.undate.Undate` as a tuple of integer value (with unknown
+    digits as zero), bit mask of unknown digits (lowest bit for the last digit),
+    number of characters (for partially known values only), and
+    a boolean indicating whether the value is fully known."""
+    if value is None:
+        return (0, 0, 0, False)
+    if isinstance(value, int):
+        return (value, 0, 0, True)
+    mask = 0
+    for i, char in enumerate(reversed(value)):
+        if char == Undate.MISSING_DIGIT:
+            mask |= 1 << i
+    return (int(value.replace(Undate.MISSING_DIGIT, "0")), mask, len(value), False)
+
+
+def decode_part(value: int, mask: int, width: int, known: bool) -> int | str | None:
+    """Decode a value encoded by :func:`encode_part`."""
+    if known:
+        return int(value)
+    if not mask:
+        return None
+    sign = "-" if value < 0 else ""
+    digits = list(f"{abs(value):0{width - len(sign)}d}")
+    for i in range(len(digits)):
+        if mask & (1 << i):
+            digits[-(i + 1)] = Undate.MISSING_DIGIT
+    return sign + "".join(digits)
+
+
+def _group_rows(*columns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Group rows with identical values in the specified integer columns.
+    Returns an array of positions of the first row in each group, and an
+    array mapping each row to its group. Combines the columns one at a
+    time using one-dimensional :func:`numpy.unique`, which is much faster
+    than finding unique rows of a two-dimensional array."""
+    codes = np.zeros(len(columns[0]), dtype=np.int64)
+    first = np.zeros(min(len(codes), 1), dtype=np.intp)
+    for column in columns:
+        _, column_codes = np.unique(column, return_inverse=True)
+        # codes are less than the number of rows, so this can't overflow
+        combined = codes * (int(column_codes.max(initial=0)) + 1) + column_codes
+        _, first, codes = np.unique(combined, return_index=True, return_inverse=True)
+    return first, codes
+
+
+def _as_datetime64(value: Date | datetime.date) -> np.datetime64:
+    # convert a Date or datetime.date to a numpy scalar with day units;
+    # item() returns an integer number of days for dates outside the range
+    # supported by datetime.date, which datetime64 also accepts
+    return np.datetime64(np.asarray(value, dtype="datetime64[D]").item(), "D")
+
+
+class UndateArray:
+    """A collection of :class:`~undate.undate.Undate` objects stored as NumPy
+    columns. Use :meth:`from_undates` to create a new array. Missing values
+    (``None``) are supported; :meth:`isna` reports which rows are missing.
+
+    Indexing with an integer returns an :class:`~undate.undate.Undate`
+    (or ``None`` for a missing value); indexing with a slice, integer array or
+    boolean mask returns a new :class:`UndateArray`. Rows can be set with
+    the same kinds of index, from an undate, ``None``, or a sequence or
+    array of undates.
+    """
+
+    #: values used to initialize each part of the date (year, month, day),
+    #: with unknown digits set to zero; shape (n, 3)
+    values: np.ndarray
+    #: bit masks of unknown digits for each part of the date; shape (n, 3)
+    masks: np.ndarray
+    #: number of characters for partially known parts of the date; shape (n, 3)
+    widths: np.ndarray
+    #: whether each part of the date is fully known; shape (n, 3)
+    known: np.ndarray
+    #: date precision, as integer values of :class:`~undate.date.DatePrecision`
+    precision: np.ndarray
+    #: calendar, as an index into :data:`CALENDARS`
+    calendar: np.ndarray
+    #: earliest possible date in the Gregorian calendar; NaT for missing values
+    earliest: np.ndarray
+    #: latest possible date in the Gregorian calendar; NaT for missing values
+    latest: np.ndarray
+    #: labels, as an object array
+    labels: np.ndarray
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        masks: np.ndarray,
+        widths: np.ndarray,
+        known: np.ndarray,
+        precision: np.ndarray,
+        calendar: np.ndarray,
+        earliest: np.ndarray,
+        latest: np.ndarray,
+        labels: np.ndarray,
+    ):
+        self.values = np.asarray(values, dtype=np.int64).reshape(-1, 3)
+        self.masks = np.asarray(masks, dtype=np.uint32).reshape(-1, 3)
+        self.widths = np.asarray(widths, dtype=np.uint8).reshape(-1, 3)
+        self.known = np.asarray(known, dtype=bool).reshape(-1, 3)
+        self.precision = np.asarray(precision, dtype=np.int8)
+        self.calendar = np.asarray(calendar, dtype=np.int8)
+        self.earliest = np.asarray(earliest, dtype="datetime64[D]")
+        self.latest = np.asarray(latest, dtype="datetime64[D]")
+        self.labels = np.asarray(labels, dtype=object)
+
+    @classmethod
+    def from_undates(cls, undates: Iterable[Undate | None]) -> UndateArray:
+        """Create a new array from a sequence of :class:`~undate.undate.Undate`
+        objects; ``None`` is stored as a missing value."""
+        undates = list(undates)
+        size = len(undates)
+        parts = np.zeros((size, 3, 4), dtype=np.int64)
+        precision = np.zeros(size, dtype=np.int8)
+        calendar = np.zeros(size, dtype=np.int8)
+        earliest = np.full(size, np.datetime64("NaT", "D"), dtype="datetime64[D]")
+        latest = earliest.copy()
+        labels = np.full(size, None, dtype=object)
+        calendar_codes = {cal: i for i, cal in enumerate(CALENDARS)}
+
+        # collect values for non-missing rows in lists and convert them
+        # to arrays all at once, which is much faster than setting values
+        # in the arrays row by row
+        rows = []
+        encoded: dict[tuple, list] = {}
+        row_parts, row_precision, row_calendar = [], [], []
+        row_earliest, row_latest, row_labels = [], [], []
+        for i, undate in enumerate(undates):
+            if undate is None:
+                continue
+            if not isinstance(undate, Undate):
+                raise TypeError(f"Expected Undate or None, got {type(undate)}")
+            rows.append(i)
+            initial = tuple(undate.initial_values[part] for part in DATE_PARTS)
+            if initial not in encoded:
+                encoded[initial] = [encode_part(value) for value in initial]
+            row_parts.append(encoded[initial])
+            row_precision.append(undate.precision)
+            row_calendar.append(calendar_codes[undate.calendar])
+            row_earliest.append(undate.earliest)
+            row_latest.append(undate.latest)
+            row_labels.append(undate.label)
+
+        if rows:
+            parts[rows] = row_parts
+            precision[rows] = row_precision
+            calendar[rows] = row_calendar
+            earliest[rows] = np.array(row_earliest, dtype="datetime64[D]")
+            latest[rows] = np.array(row_latest, dtype="datetime64[D]")
+            labels[rows] = row_labels
+
+        return cls(
+            values=parts[:, :, 0],
+            masks=parts[:, :, 1],
+            widths=parts[:, :, 2],
+            known=parts[:, :, 3],
+            precision=precision,
+            calendar=calendar,
+            earliest=earliest,
+            latest=latest,
+            labels=labels,
+        )
+
+    def __len__(self) -> int:
+        return len(self.earliest)
+
+    def __iter__(self) -> Iterator[Undate | None]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} of {len(self)} undates>"
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self._get_undate(int(key))
+        return self._subset(key)
+
+    def __setitem__(self, key, value: Undate | Iterable[Undate | None] | None):
+        # set rows selected by key (integer, slice, integer array or mask)
+        # from a single undate (or None for a missing value) or a sequence
+        # or array of them, by setting every column
+        if value is None or isinstance(value, Undate):
+            value = self.from_undates([value])
+        elif not isinstance(value, UndateArray):
+            value = self.from_undates(value)
+        if isinstance(key, (int, np.integer)) and len(value) != 1:
+            raise ValueError("Can only set a single value at an integer position")
+        for column in (
+            "values",
+            "masks",
+            "widths",
+            "known",
+            "precision",
+            "calendar",
+            "earliest",
+            "latest",
+            "labels",
+        ):
+            new_values = getattr(value, column)
+            if isinstance(key, (int, np.integer)):
+                new_values = new_values[0]
+            getattr(self, column)[key] = new_values
+
+    def _subset(self, key) -> UndateArray:
+        # index every column with the same key (slice, integer array or mask)
+        return self.__class__(
+            values=self.values[key],
+            masks=self.masks[key],
+            widths=self.widths[key],
+            known=self.known[key],
+            precision=self.precision[key],
+            calendar=self.calendar[key],
+            earliest=self.earliest[key],
+            latest=self.latest[key],
+            labels=self.labels[key],
+        )
+
+    def _get_undate(self, i: int) -> Undate | None:
+        if np.isnat(self.earliest[i]):
+            return None
+        year, month, day = (
+            decode_part(
+                self.values[i, j],
+                self.masks[i, j],
+                self.widths[i, j],
+                self.known[i, j],
+            )
+            for j in range(len(DATE_PARTS))
+        )
+        return Undate(
+            year,
+            month,
+            day,
+            label=self.labels[i],
+            calendar=CALENDARS[self.calendar[i]],
+        )
+
+    def to_undates(self) -> list[Undate | None]:
+        """Return a list of :class:`~undate.undate.Undate` objects (or ``None``
+        for missing values)."""
+        return list(self)
+
+    def take(self, indices: np.ndarray, allow_fill: bool = False) -> UndateArray:
+        """Take rows by position. When ``allow_fill`` is true, negative
+        indices result in missing values."""
+        indices = np.asarray(indices, dtype=np.intp)
+        if not allow_fill:
+            return self._subset(indices)
+        fill = indices < 0
+        if fill.all():
+            return self.missing(len(indices))
+        result = self._subset(np.where(fill, 0, indices))
+        result.earliest[fill] = np.datetime64("NaT", "D")
+        result.latest[fill] = np.datetime64("NaT", "D")
+        result.labels[fill] = None
+        return result
+
+    @classmethod
+    def missing(cls, size: int) -> UndateArray:
+        """Create a new array of the specified size with only missing values."""
+        return cls.from_undates([None] * size)
+
+    def copy(self) -> UndateArray:
+        """Return a copy of this array."""
+        return self.__class__(
+            values=self.values.copy(),
+            masks=self.masks.copy(),
+            widths=self.widths.copy(),
+            known=self.known.copy(),
+            precision=self.precision.copy(),
+            calendar=self.calendar.copy(),
+            earliest=self.earliest.copy(),
+            latest=self.latest.copy(),
+            labels=self.labels.copy(),
+        )
+
+    @classmethod
+    def concatenate(cls, arrays: Iterable[UndateArray]) -> UndateArray:
+        """Combine multiple arrays into a single array."""
+        arrays = list(arrays)
+        return cls(
+            values=np.concatenate([a.values for a in arrays]),
+            masks=np.concatenate([a.masks for a in arrays]),
+            widths=np.concatenate([a.widths for a in arrays]),
+            known=np.concatenate([a.known for a in arrays]),
+            precision=np.concatenate([a.precision for a in arrays]),
+            calendar=np.concatenate([a.calendar for a in arrays]),
+            earliest=np.concatenate([a.earliest for a in arrays]),
+            latest=np.concatenate([a.latest for a in arrays]),
+            labels=np.concatenate([a.labels for a in arrays]),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the array columns (not including labels)."""
+        return sum(
+            col.nbytes
+            for col in [
+                self.values,
+                self.masks,
+                self.widths,
+                self.known,
+                self.precision,
+                self.calendar,
+                self.earliest,
+                self.latest,
+                self.labels,
+            ]
+        )
+
+    def isna(self) -> np.ndarray:
+        """Boolean array indicating missing values."""
+        return np.isnat(self.earliest)
+
+    @property
+    def known_year(self) -> np.ndarray:
+        """Boolean array indicating whether the year is fully known;
+        equivalent to :attr:`Undate.known_year <undate.undate.Undate.known_year>`."""
+        return self.known[:, 0] & ~self.isna()
+
+    @property
+    def unknown_year(self) -> np.ndarray:
+        """Boolean array indicating whether the year is completely unknown;
+        equivalent to :attr:`Undate.unknown_year <undate.undate.Undate.unknown_year>`."""
+        return ~self.known[:, 0] & (self.masks[:, 0] == 0) & ~self.isna()
+
+    @property
+    def partially_known(self) -> np.ndarray:
+        """Boolean array indicating whether any part of the date is
+        partially known (has unknown digits)."""
+        return (self.masks != 0).any(axis=1)
+
+    @property
+    def fully_known(self) -> np.ndarray:
+        """Boolean array indicating dates with a known year and no partially known parts,
+        which can be compared for equality."""
+        return self.known_year & ~self.partially_known
+
+    def argsort(self) -> np.ndarray:
+        """Positions that sort the array in the same order as
+        :meth:`Undate.sort_key <undate.undate.Undate.sort_key>`: by earliest
+        date, latest date, and precision (most precise first), with dates
+        with a completely unknown year after other dates and missing values
+        last. Dates with identical keys keep their original order."""
+        # year is completely unknown if unset or all digits are unknown
+        year_mask = self.masks[:, 0].astype(np.int64)
+        unknown_year = ~self.known[:, 0] & (
+            year_mask == (1 << self.widths[:, 0].astype(np.int64)) - 1
+        )
+        # last key is the primary sort key
+        return np.lexsort(
+            (
+                -self.precision.astype(np.int64),
+                self.latest.view(np.int64),
+                self.earliest.view(np.int64),
+                unknown_year,
+                self.isna(),
+            )
+        )
+
+    def _factorize(self) -> tuple[np.ndarray, np.ndarray]:
+        """Group identical values (ignoring labels). Returns an array of
+        positions of the first row for each unique value, and an array
+        mapping each row to the index of its unique value."""
+        keys = np.column_stack(
+            [
+                self.values,
+                self.masks,
+                self.widths,
+                self.known,
+                self.precision,
+                self.calendar,
+                self.isna(),
+            ]
+        ).astype(np.int64)
+        _, first, inverse = np.unique(
+            keys, axis=0, return_index=True, return_inverse=True
+        )
+        return first, inverse.reshape(-1)
+
+    @staticmethod
+    def _other_bounds(other: object) -> Undate:
+        if isinstance(other, UndateArray):
+            raise TypeError("Comparison between two arrays is not supported")
+        return Undate.to_undate(other)
+
+    def equals(self, other: object) -> np.ndarray:
+        """Elementwise equality with a single date, following the same
+        logic as :meth:`Undate.__eq__ <undate.undate.Undate.__eq__>`:
+        dates with unknown years or partially known values are never equal."""
+        other = self._other_bounds(other)
+        if not other.known_year or any(
+            other.is_partially_known(part) for part in DATE_PARTS
+        ):
+            return np.zeros(len(self), dtype=bool)
+        return (
+            self.fully_known
+            & (self.earliest == _as_datetime64(other.earliest))
+            & (self.latest == _as_datetime64(other.latest))
+            & (self.precision == other.precision)
+        )
+
+    def contains(self, other: object) -> np.ndarray:
+        """Boolean array indicating which dates contain the specified date,
+        following the same logic as :meth:`Undate.__contains__
+        <undate.undate.Undate.__contains__>`; ``other`` may be an
+        :class:`~undate.undate.Undate` or anything supported by
+        :meth:`Undate.to_undate <undate.undate.Undate.to_undate>`."""
+        other = self._other_bounds(other)
+        if other.unknown_year:
+            return np.zeros(len(self), dtype=bool)
+        return (
+            ~self.unknown_year
+            & ~self.isna()
+            & (self.earliest <= _as_datetime64(other.earliest))
+            & (self.latest >= _as_datetime64(other.latest))
+            & (self.precision < other.precision)
+        )
+
+    def overlaps(self, other: object) -> np.ndarray:
+        """Boolean array indicating which dates overlap the specified date or
+        :class:`~undate.interval.UndateInterval`, based on earliest and latest
+        possible dates. Dates with unknown years are never considered
+        to overlap."""
+        from undate.interval import UndateInterval
+
+        result = ~self.unknown_year & ~self.isna()
+        if isinstance(other, UndateInterval):
+            # open-ended intervals are only bounded on one side
+            if other.earliest:
+                result &= self.latest >= _as_datetime64(other.earliest.earliest)
+            if other.latest:
+                result &= self.earliest <= _as_datetime64(other.latest.latest)
+            return result
+
+        other = self._other_bounds(other)
+        if other.unknown_year:
+            return np.zeros(len(self), dtype=bool)
+        return (
+            result
+            & (self.latest >= _as_datetime64(other.earliest))
+            & (self.earliest <= _as_datetime64(other.latest))
+        )
+
+    def _tristate(self, true: np.ndarray, possible: np.ndarray) -> np.ndarray:
+        # combine definitely and possibly true conditions into TriState values;
+        # missing values are always false
+        present = ~self.isna()
+        return ((possible | true) & present).astype(np.int8) + (true & present)
+
+    def before(self, other: object) -> np.ndarray:
+        """Tri-state array of :class:`TriState` values for ``date < other``:
+        true where the latest possible date is before the other date starts,
+        false where the earliest possible date is not before the other date
+        ends, and possibly true otherwise (including dates that overlap or
+        contain the other date, and dates with unknown years)."""
+        other = self._other_bounds(other)
+        unknown = self.unknown_year | other.unknown_year
+        return self._tristate(
+            ~unknown & (self.latest < _as_datetime64(other.earliest)),
+            unknown | (self.earliest < _as_datetime64(other.latest)),
+        )
+
+    def after(self, other: object) -> np.ndarray:
+        """Tri-state array of :class:`TriState` values for ``date > other``;
+        see :meth:`before`."""
+        other = self._other_bounds(other)
+        unknown = self.unknown_year | other.unknown_year
+        return self._tristate(
+            ~unknown & (self.earliest > _as_datetime64(other.latest)),
+            unknown | (self.latest > _as_datetime64(other.earliest)),
+        )
+
+    def equal(self, other: object) -> np.ndarray:
+        """Tri-state array of :class:`TriState` values for ``date == other``:
+        true where :meth:`equals` is true; false for dates with a different
+        precision, dates that don't overlap, and fully known dates that are not
+        equal; and possibly true for other dates with unknown or partially
+        known values."""
+        other = self._other_bounds(other)
+        exact = self.fully_known & other._is_exact()
+        overlap = self.unknown_year | other.unknown_year
+        overlap |= (self.earliest <= _as_datetime64(other.latest)) & (
+            self.latest >= _as_datetime64(other.earliest)
+        )
+        same_precision = self.precision == other.precision
+        return self._tristate(self.equals(other), same_precision & overlap & ~exact)
+
+    def includes(self, other: object) -> np.ndarray:
+        """Tri-state array of :class:`TriState` values for ``other in date``:
+        true where :meth:`contains` is true and the date is fully known;
+        false for dates that are not less precise than the other date, dates
+        that don't overlap it, and fully known dates that don't contain it;
+        and possibly true for other dates with unknown or partially known values
+        (e.g. ``19XX`` possibly includes 1950)."""
+        other = self._other_bounds(other)
+        exact = self.fully_known & other._is_exact()
+        overlap = self.unknown_year | other.unknown_year
+        overlap |= (self.earliest <= _as_datetime64(other.latest)) & (
+            self.latest >= _as_datetime64(other.earliest)
+        )
+        less_precise = self.precision < other.precision
+        return self._tristate(
+            self.fully_known & self.contains(other), less_precise & overlap & ~exact
+        )
+
+    def duration(self) -> tuple[np.ndarray, np.ndarray]:
+        """Inclusive duration of each date in days, as two integer arrays of
+        minimum and maximum number of days; these differ where the duration
+        is uncertain (see :meth:`Undate.duration <undate.undate.Undate.duration>`).
+        Values for missing rows are zero."""
+        min_days = np.zeros(len(self), dtype=np.int64)
+        max_days = np.zeros(len(self), dtype=np.int64)
+        valid = ~self.isna()
+
+        # day-precision dates are always a single day
+        single_day = valid & (self.precision == DatePrecision.DAY)
+        min_days[single_day] = max_days[single_day] = 1
+        # known dates can be calculated directly from earliest and latest
+        certain = valid & ~single_day & self.fully_known
+        certain_days = (self.latest[certain] - self.earliest[certain]).astype(
+            np.int64
+        ) + 1
+        min_days[certain] = max_days[certain] = certain_days
+
+        # calculate remaining durations once for each distinct case
+        uncertain = np.flatnonzero(valid & ~single_day & ~certain)
+        if len(uncertain):
+            first, inverse = np.unique(
+                self._duration_keys(uncertain),
+                axis=0,
+                return_index=True,
+                return_inverse=True,
+            )[1:]
+            case_min = np.empty(len(first), dtype=np.int64)
+            case_max = np.empty(len(first), dtype=np.int64)
+            for case, row in enumerate(uncertain[first]):
+                duration = self._get_undate(int(row)).duration()  # type: ignore[union-attr]
+                if isinstance(duration, UnDelta):
+                    case_min[case] = duration.days.lower
+                    case_max[case] = duration.days.upper
+                else:
+                    case_min[case] = case_max[case] = duration.days
+            inverse = inverse.reshape(-1)
+            min_days[uncertain] = case_min[inverse]
+            max_days[uncertain] = case_max[inverse]
+        return min_days, max_days
+
+    def _duration_keys(self, rows: np.ndarray) -> np.ndarray:
+        """Columns that determine the duration of dates that are not
+        single days and not fully known: calendar, precision,
+        month (value and mask of unknown digits), and year (value
+        and mask). The day never affects the duration of these dates,
+        and neither does the year when it is completely unknown."""
+        year, month = 0, 1
+        return np.column_stack(
+            [
+                self.calendar[rows],
+                self.precision[rows],
+                self.values[rows, month],
+                self.masks[rows, month],
+                self.known[rows, month],
+                self.values[rows, year],
+                self.masks[rows, year],
+                self.known[rows, year],
+            ]
+        ).astype(np.int64)
+
+    def resolve_weekday(self, weekdays) -> tuple[np.ndarray, UndateArray]:
+        """Resolve dates with known weekdays to the fully known dates they
+        could be (see :meth:`Undate.resolve_weekday
+        <undate.undate.Undate.resolve_weekday>`), for a column of dates and a
+        column of weekdays (:class:`~undate.date.Weekday` values, or -1 where
+        the weekday is unknown). Returns candidates in long format: an array of
+        row positions, and an array with one candidate date for each position.
+        Each distinct combination of date and weekday is resolved once; rows
+        that are missing, have no weekday, or can't be resolved (e.g. dates
+        without a day or year) have no candidates."""
+        weekdays = np.asarray(weekdays, dtype=np.int64)
+        if weekdays.shape != (len(self),):
+            raise ValueError("Weekdays must have the same length as the array")
+        rows = np.flatnonzero(~self.isna() & (weekdays >= 0))
+        if not len(rows):
+            return np.array([], dtype=np.int64), self.missing(0)
+        first, inverse = self._factorize()
+        keys, key_inverse = np.unique(
+            inverse[rows] * 7 + weekdays[rows], return_inverse=True
+        )
+        key_inverse = key_inverse.reshape(-1)
+        # resolve each distinct date and weekday once
+        undates: list[Undate] = []
+        key_offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        for k, key in enumerate(keys):
+            undate = self._get_undate(int(first[key // 7]))
+            # dates that can't be resolved have no candidates
+            with suppress(ValueError):
+                undates.extend(undate.resolve_weekday(int(key % 7)))  # type: ignore[union-attr]
+            key_offsets[k + 1] = len(undates)
+        counts = np.diff(key_offsets)[key_inverse]
+        positions = np.repeat(rows, counts)
+        # candidates for each row: offset of its key, plus position within the row
+        row_starts = np.cumsum(counts) - counts
+        indices = np.arange(len(positions)) + np.repeat(
+            key_offsets[:-1][key_inverse] - row_starts, counts
+        )
+        return positions, self.from_undates(undates).take(indices)
+
+    def format(self, format: str) -> np.ndarray:
+        """Format every date in the array using the named converter
+        (e.g. ``"EDTF"``); returns an object array of strings, with
+        ``None`` for missing values. For converters that support formatting
+        parts of a date (see
+        :meth:`~undate.converters.BaseDateConverter.part_to_string`), strings
+        are generated directly from the stored columns, formatting each unique
+        year, month, and day once; otherwise, each unique value is formatted
+        once as an :class:`~undate.undate.Undate`."""
+        try:
+            converter = BaseDateConverter.get_converter(format)
+        except KeyError:
+            raise ValueError(f"Unsupported format '{format}'") from None
+        result = np.full(len(self), None, dtype=object)
+        if not len(self):
+            return result
+        if type(converter).part_to_string is BaseDateConverter.part_to_string:
+            first, inverse = self._factorize()
+            formatted = np.array(
+                [
+                    converter.to_string(undate) if undate is not None else None
+                    for undate in (self._get_undate(int(i)) for i in first)
+                ],
+                dtype=object,
+            )
+            result[:] = formatted[inverse]
+            return result
+
+        rows = np.flatnonzero(~self.isna())
+        strings = np.full(len(rows), "", dtype=object)
+        for j, part in enumerate(DATE_PARTS):
+            part_strings = self._format_part(converter, rows, j, part)
+            # join parts with -, skipping omitted parts
+            separator = np.where((strings != "") & (part_strings != ""), "-", "")
+            strings = strings + separator + part_strings
+        result[rows] = strings
+        # dates with no parts can't be formatted this way; use the
+        # converter, which will raise an error if appropriate
+        for i in rows[strings == ""]:
+            result[i] = converter.to_string(self._get_undate(int(i)))
+        return result
+
+    def _format_part(
+        self, converter: BaseDateConverter, rows: np.ndarray, j: int, part: str
+    ) -> np.ndarray:
+        """Format one part of the date for the specified rows, formatting
+        each unique combination of value and precision once. Returns an
+        object array of strings, with empty strings for omitted parts."""
+        # combine everything but the value into a single integer column;
+        # masks use at most 32 bits and widths 8 bits
+        other = (
+            self.masks[rows, j].astype(np.int64)
+            | self.widths[rows, j].astype(np.int64) << 32
+            | self.known[rows, j].astype(np.int64) << 40
+            | self.precision[rows].astype(np.int64) << 41
+        )
+        first, inverse = _group_rows(self.values[rows, j], other)
+        unique_rows = rows[first]
+        formatted = np.array(
+            [
+                converter.part_to_string(
+                    part,
+                    decode_part(
+                        self.values[i, j],
+                        self.masks[i, j],
+                        self.widths[i, j],
+                        self.known[i, j],
+                    ),
+                    DatePrecision(self.precision[i]),
+                )
+                or ""
+                for i in unique_rows.tolist()
+            ],
+            dtype=object,
+        )
+        return formatted[inverse]
@@ -0,0 +1,341 @@
+"""
+Opt-in cache for parsing results, for collections where the same date
+strings occur many times.
+
+When the cache is enabled, :meth:`Undate.parse <undate.undate.Undate.parse>`
+(and parsing with :mod:`undate.aio`) looks up each converter name and
+configuration (see :attr:`~undate.converters.base.BaseDateConverter.cache_key`)
+and input string in a bounded least-recently-used cache before parsing, and adds new
+results to it::
+
+    from undate import cache
+
+    cache.enable(maxsize=100_000)
+    Undate.parse("Easter 1612", "omnibus")  # parsed and cached
+    Undate.parse("Easter 1612", "omnibus")  # from the cache
+    cache.info()  # CacheInfo(hits=1, misses=1, maxsize=100000, currsize=1)
+
+Results are stored pickled, so every call returns new objects: changing
+a returned date (e.g., setting a label) never changes the cached value.
+Errors are not cached. The cache is shared by all threads; each process
+has its own cache, so enable it in worker processes to use it there.
+
+For batch jobs that parse the same strings on every run, a
+:class:`DiskParseCache` keeps results in a local SQLite database between
+runs, so that only new strings are parsed::
+
+    with cache.DiskParseCache("dates.sqlite") as disk_cache:
+        dates = disk_cache.parse_many(converter, values)
+
+Cached results are discarded automatically when the undate version or the
+source of any converter or grammar changes (see :func:`cache_version`).
+
+-------------------
+"""
+
+import hashlib
+import pathlib
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import cache
+
+from undate import __version__
+from undate.converters.base import BaseDateConverter
+
+#: default maximum number of cached results
+DEFAULT_MAXSIZE = 10_000
+
+
+@dataclass
+class CacheInfo:
+    """Cache statistics, similar to :func:`functools.lru_cache` cache info."""
+
+    #: number of results returned from the cache
+    hits: int = 0
+    #: number of values that were not found in the cache
+    misses: int = 0
+    #: maximum number of cached results
+    maxsize: int = DEFAULT_MAXSIZE
+    #: current number of cached results
+    currsize: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups returned from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ParseCache:
+    """Bounded least-recently-used cache of parse results, keyed on
+    converter :attr:`~undate.converters.base.BaseDateConverter.cache_key`
+    and input string.
+
+    :param maxsize: maximum number of cached results
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # pickled results, least recently used first
+        self._results: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, converter: BaseDateConverter, value: str):
+        """Parse a string with the specified converter, returning a
+        copy of the cached result if there is one."""
+        key = (converter.cache_key, value)
+        with self._lock:
+            data = self._results.get(key)
+            if data is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if data is not None:
+            return pickle.loads(data)
+
+        result = converter.parse(value)
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._results[key] = data
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Remove all cached results and reset statistics."""
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Current cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+
+@cache
+def cache_version() -> str:
+    """Hash of the undate version and the source code and grammar files
+    of the undate package, which determine parse results and how they
+    are stored; results cached with a different version are not used."""
+    package_path = pathlib.Path(__file__).parent
+    digest = hashlib.sha256(__version__.encode())
+    for path in sorted(package_path.rglob("*")):
+        if path.suffix in {".py", ".lark"}:
+            digest.update(path.relative_to(package_path).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class DiskParseCache:
+    """Persistent cache of parse results in a local SQLite database,
+    keyed on converter :attr:`~undate.converters.base.BaseDateConverter.cache_key`
+    and input string. Results are stored pickled, along with the
+    :func:`cache_version` they were parsed with and the format of the
+    converter keys; when either changes, all cached results are discarded. Errors are not cached.
+    Can be used as a context manager, which closes the database on exit.
+
+    :param path: path to the database file; created if it does not exist
+    :param version: cache version; defaults to :func:`cache_version`
+    """
+
+    #: maximum number of values looked up in a single query
+    BATCH_SIZE = 500
+    #: format of the converter keys in the results table, stored with the
+    #: version; databases keyed on converter names alone are discarded
+    KEY_FORMAT = "cache_key"
+
+    def __init__(self, path: str | pathlib.Path, version: str | None = None):
+        self.path = pathlib.Path(path)
+        self.version = version or cache_version()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results (converter TEXT, value TEXT,"
+                " result BLOB, PRIMARY KEY (converter, value)) WITHOUT ROWID"
+            )
+            row = self._db.execute(
+                "SELECT value FROM metadata WHERE key = 'version'"
+            ).fetchone()
+            stored_version = f"{self.version} {self.KEY_FORMAT}"
+            if row is None or row[0] != stored_version:
+                # parsed with a different version of undate or stored with
+                # differently keyed converters; discard results
+                self._db.execute("DELETE FROM results")
+                self._db.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES ('version', ?)",
+                    (stored_version,),
+                )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
+
+    def parse(self, converter: BaseDateConverter, value: str):
+        """Parse a string with the specified converter, using the
+        cached result if there is one."""
+        return self.parse_many(converter, [value])[0]
+
+    def parse_many(
+        self,
+        converter: BaseDateConverter,
+        values: Iterable[str],
+        return_exceptions: bool = False,
+    ) -> list:
+        """Parse multiple strings with the specified converter, returning
+        results in the same order. Cached results are looked up in batches,
+        each new value is only parsed once, and new results are added to the
+        cache in a single transaction. If ``return_exceptions`` is True,
+        values that can't be parsed return the exception instead of raising it."""
+        values = list(values)
+        cached = self._lookup(converter.cache_key, set(values))
+        # newly parsed results, returned for the first occurrence of each value
+        parsed: dict[str, object] = {}
+        errors: dict[str, Exception] = {}
+        new_results = []
+        try:
+            for value in dict.fromkeys(values):
+                if value in cached:
+                    continue
+                result = _parse_or_error(converter, value)
+                if isinstance(result, Exception):
+                    if not return_exceptions:
+                        raise result
+                    errors[value] = result
+                    continue
+                parsed[value] = result
+                data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+                new_results.append((converter.cache_key, value, data))
+        finally:
+            # store new results, even if parsing failed on a later value
+            self._store(new_results)
+        hits = sum(value in cached for value in values)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(values) - hits
+        # repeated occurrences of new values get a copy, as for cached values
+        cached.update((value, data) for _, value, data in new_results)
+        return [
+            errors[value]
+            if value in errors
+            else parsed.pop(value)
+            if value in parsed
+            else pickle.loads(cached[value])
+            for value in values
+        ]
+
+    def _lookup(self, key: str, values: set[str]) -> dict[str, bytes]:
+        # cached results for the specified values, in batches
+        cached: dict[str, bytes] = {}
+        with self._lock:
+            for batch in _batches(sorted(values), self.BATCH_SIZE):
+                placeholders = ", ".join("?" * len(batch))
+                cached.update(
+                    self._db.execute(
+                        "SELECT value, result FROM results"
+                        f" WHERE converter = ? AND value IN ({placeholders})",
+                        (key, *batch),
+                    )
+                )
+        return cached
+
+    def _store(self, results: list[tuple[str, str, bytes]]):
+        if results:
+            with self._lock, self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?)", results
+                )
+
+    def clear(self):
+        """Remove all cached results and reset statistics."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM results")
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Current cache statistics; the maximum size is 0, since
+        the cache size is not limited."""
+        with self._lock:
+            (size,) = self._db.execute("SELECT COUNT(*) FROM results").fetchone()
+            return CacheInfo(self.hits, self.misses, 0, size)
+
+
+def _parse_or_error(converter: BaseDateConverter, value: str):
+    try:
+        return converter.parse(value)
+    except Exception as err:  # noqa: BLE001
+        return err
+
+
+def _batches(values: list[str], size: int) -> Iterator[list[str]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+# cache used by Undate.parse, when enabled
+_cache: ParseCache | None = None
+
+
+def is_enabled() -> bool:
+    """Check whether the parse cache is enabled."""
+    return _cache is not None
+
+
+def enable(maxsize: int = DEFAULT_MAXSIZE):
+    """Start caching parse results, keeping up to ``maxsize`` results.
+    If the cache is already enabled with a different size, it is replaced
+    with an empty cache."""
+    global _cache
+    if _cache is None or _cache.maxsize != maxsize:
+        _cache = ParseCache(maxsize)
+
+
+def disable():
+    """Stop caching parse results and discard cached results."""
+    global _cache
+    _cache = None
+
+
+def clear():
+    """Remove all cached results and reset statistics."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def info() -> CacheInfo:
+    """Statistics for the parse cache; all zero if it is not enabled."""
+    if _cache is None:
+        return CacheInfo(maxsize=0)
+    return _cache.info()
+
+
+def parse(converter: BaseDateConverter, value: str):
+    """Parse a string with the specified converter, using the
+    cache if it is enabled."""
+    # get a reference once, in case another thread disables the cache
+    parse_cache = _cache
+    if parse_cache is None:
+        return converter.parse(value)
+    return parse_cache.parse(converter, value)
@@ -39,6 +39,34 @@ To add support for a new calendar converter:
 Calendar converter subclasses are also automatically loaded and included
 in the list of available converters.
 
+Calendar converters can also implement conversion to and from Julian day
+numbers with vectorized ``to_jdn_array`` and ``from_jdn_array`` methods,
+which support converting columns of dates directly between calendars
+(e.g., Hebrew to Islamic) without creating :class:`~undate.date.Date`
+objects::
+
+    jdns = hebrew_converter.to_jdn_array(years, months, days)
+    years, months, days = islamic_converter.from_jdn_array(jdns)
+
+Scalar ``to_jdn`` and ``from_jdn`` and Gregorian conversion with
+``from_gregorian`` and ``from_gregorian_array`` are provided based on
+these methods.
+
+Thread safety
+^^^^^^^^^^^^^
+
+Converter instances may be shared between threads: ``parse`` and
+``to_string`` can be called concurrently on the same converter.
+Lark parsers keep parsing state for each call, and transformers do not store
+anything on the instance while transforming; labels and other attributes are
+only set on newly created :class:`~undate.Undate` objects. Shared caches (such
+as the table of Easter dates and parsers for a subset of Gregorian month name
+languages) are built under a lock or replaced in a single assignment.
+
+When implementing a converter, keep per-call state in local variables
+rather than on the converter or transformer instance, and only
+configure attributes in ``__init__``.
+
 -------------------
 """
 
@@ -46,12 +74,21 @@ import importlib
 import logging
 import pathlib
 import pkgutil
+from collections.abc import Sequence
 from functools import cache
+from typing import ClassVar
+
+import numpy as np
+from lark import Lark
 
-from undate.date import Date
+from undate import profiling
+from undate.date import EPOCH_JDN, Date, DatePrecision, gregorian_days, weekdays
 
 logger = logging.getLogger(__name__)
 
+#: integer values accepted by array conversion methods: a scalar, sequence, or array
+IntArray = int | Sequence[int] | np.ndarray
+
 
 #: Path to parser grammar files
 GRAMMAR_FILE_PATH = pathlib.Path(__file__).parent / "grammars"
@@ -68,6 +105,29 @@ class BaseDateConverter:
     LEAP_YEAR = 0
     NON_LEAP_YEAR = 0
 
+    # available converters and shared converter instances, cached
+    # by name; cleared when a new converter subclass is defined
+    _available_converters: ClassVar[dict[str, type["BaseDateConverter"]]] = {}
+    _converter_instances: ClassVar[dict[str, "BaseDateConverter"]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        BaseDateConverter._available_converters = {}
+        BaseDateConverter._converter_instances = {}
+        # add profiling hooks to parse and conversion methods defined
+        # on this class; inherited methods already have them
+        if "parse" in vars(cls):
+            cls.parse = profiling.timed_parse(vars(cls)["parse"])  # type: ignore[method-assign]
+        if "to_gregorian" in vars(cls):
+            cls.to_gregorian = profiling.timed_conversion(vars(cls)["to_gregorian"])  # type: ignore[attr-defined]
+
+    @property
+    def cache_key(self) -> str:
+        """Converter name and any configuration that changes parse results,
+        used to key cached results (see :mod:`undate.cache`). Converters
+        with options that change parsing must override this."""
+        return self.name
+
     def parse(self, value: str):
         """
         Parse a string and return an :class:`~undate.undate.Undate` or
@@ -78,6 +138,16 @@ class BaseDateConverter:
         # should return an undate or undate interval
         raise NotImplementedError
 
+    def _parse_tree(self, parser: Lark, value: str):
+        # parse a string with a Lark parser and transform the parse tree
+        # with this converter's transformer, timing each step when profiling
+        if not profiling.enabled:
+            return self.transformer.transform(parser.parse(value))  # type: ignore[attr-defined]
+        with profiling.stage("lark"):
+            parsetree = parser.parse(value)
+        with profiling.stage("transform"):
+            return self.transformer.transform(parsetree)  # type: ignore[attr-defined]
+
     def to_string(self, undate) -> str:
         """
         Convert an :class:`~undate.undate.Undate` or
@@ -89,6 +159,20 @@ class BaseDateConverter:
         # convert an undate or interval to string representation for this format
         raise NotImplementedError
 
+    def part_to_string(
+        self, part: str, value: int | str | None, precision: DatePrecision
+    ) -> str | None:
+        """
+        Convert a single part of a date (``year``, ``month``, or ``day``), as
+        used to initialize an :class:`~undate.undate.Undate` with the specified
+        precision, to string; returns None if the part is omitted. Formats
+        where the parts of a date are joined with ``-`` can implement this
+        to support formatting from stored values without creating
+        :class:`~undate.undate.Undate` objects (see
+        :meth:`undate.array.UndateArray.format`). Optional.
+        """
+        raise NotImplementedError
+
     # cache import class method to ensure we only import once
     @classmethod
     @cache
@@ -121,7 +205,31 @@ class BaseDateConverter:
         """
         Dictionary of available converters keyed on name.
         """
-        return {c.name: c for c in cls.subclasses()}
+        if cls is not BaseDateConverter:
+            return {c.name: c for c in cls.subclasses()}
+        # cache converters available from the base class, which is used for
+        # looking up converters by name
+        if not BaseDateConverter._available_converters:
+            BaseDateConverter._available_converters = {
+                c.name: c for c in cls.subclasses()
+            }
+        # return a copy so the cached dictionary can't be modified
+        return dict(BaseDateConverter._available_converters)
+
+    @classmethod
+    def get_converter(cls, name: str) -> "BaseDateConverter":
+        """
+        Shared instance of the available converter with the specified name.
+        Converters are safe to share (see notes on thread safety above), so
+        the instance is created on first use and reused, to avoid the cost of
+        looking up and initializing the converter every time.
+        Raises :class:`KeyError` if no converter has that name.
+        """
+        converter = BaseDateConverter._converter_instances.get(name)
+        if converter is None:
+            converter = BaseDateConverter.available_converters()[name]()
+            BaseDateConverter._converter_instances[name] = converter
+        return converter
 
     @classmethod
     def subclasses(cls) -> set[type["BaseDateConverter"]]:
@@ -195,7 +303,30 @@ class BaseCalendarConverter(BaseDateConverter):
         # add 1 because the difference doesn't include the end point
         return (year_end - year_start).days + 1
 
-    def representative_years(self, years: list[int] | None = None) -> list[int]:
+    def max_day_array(self, years: IntArray, months: IntArray) -> np.ndarray:
+        """Maximum numeric day for each of the specified years and months,
+        given as integer arrays (or scalars), as an integer array. The default
+        implementation calls :meth:`max_day` for each year and month;
+        calendars can override it with a vectorized calculation."""
+        years, months = np.broadcast_arrays(np.atleast_1d(years), months)
+        return np.array(
+            [
+                self.max_day(year, month)
+                for year, month in zip(years.tolist(), months.tolist(), strict=True)
+            ],
+            dtype=np.int64,
+        )
+
+    def days_in_year_array(self, years: IntArray) -> np.ndarray:
+        """Number of days in each of the specified years, as an integer array.
+        The default implementation calls :meth:`days_in_year` for each year;
+        calendars can override it with a vectorized calculation."""
+        return np.array(
+            [self.days_in_year(year) for year in np.atleast_1d(years).tolist()],
+            dtype=np.int64,
+        )
+
+    def representative_years(self, years: Sequence[int] | None = None) -> list[int]:
         """Returns a list of representative years within the specified list.
         Result should include one for each type of variant year for this
         calendar (e.g., leap year and non-leap year). If no years are specified,
@@ -208,3 +339,91 @@ class BaseCalendarConverter(BaseDateConverter):
         into the Gregorian equivalent date. Should return a tuple of year, month, day.
         """
         raise NotImplementedError
+
+    def to_jdn(self, year: int, month: int, day: int) -> int:
+        """Julian day number of a date in this calendar, specified by
+        numeric year, month, and day."""
+        return int(self.to_jdn_array(year, month, day)[0])
+
+    def from_jdn(self, jdn: int) -> tuple[int, int, int]:
+        """Date in this calendar for a Julian day number, as a tuple
+        of year, month, day."""
+        year, month, day = self.from_jdn_array(jdn)
+        return (int(year[0]), int(month[0]), int(day[0]))
+
+    def to_jdn_array(
+        self, years: IntArray, months: IntArray, days: IntArray
+    ) -> np.ndarray:
+        """Julian day numbers for dates in this calendar, specified as
+        integer arrays (or scalars) of years, months and days, as an integer
+        array. Dates are not validated. The default implementation converts
+        each date with :meth:`to_gregorian`; calendars can override it with
+        a vectorized calculation."""
+        years, months, days = np.broadcast_arrays(
+            np.atleast_1d(years), np.asarray(months), np.asarray(days)
+        )
+        gregorian = np.array(
+            [
+                self.to_gregorian(year, month, day)
+                for year, month, day in zip(
+                    years.tolist(), months.tolist(), days.tolist(), strict=True
+                )
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 3)
+        return gregorian_days(*gregorian.T) + EPOCH_JDN
+
+    def from_jdn_array(
+        self, jdns: IntArray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Dates in this calendar for an integer array of Julian day numbers,
+        as arrays of years, months and days. Calendars that support
+        conversion from Julian day numbers must implement this method."""
+        raise NotImplementedError
+
+    def from_gregorian(self, year: int, month: int, day: int) -> tuple[int, int, int]:
+        """Convert a Gregorian date, specified by numeric year, month, and day,
+        to the equivalent date in this calendar, as a tuple of year, month, day."""
+        years, months, days = self.from_gregorian_array(year, month, day)
+        return (int(years[0]), int(months[0]), int(days[0]))
+
+    def from_gregorian_array(
+        self, years: IntArray, months: IntArray, days: IntArray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convert Gregorian dates, specified as integer arrays of years,
+        months and days, to this calendar; returns arrays of years, months
+        and days. Converts through Julian day numbers, so this is only
+        supported for calendars that implement :meth:`from_jdn_array`."""
+        return self.from_jdn_array(
+            gregorian_days(np.atleast_1d(years), months, days) + EPOCH_JDN
+        )
+
+    def weekdays(
+        self, years: Sequence[int] | np.ndarray, month: int, day: int
+    ) -> np.ndarray:
+        """Weekday (as :class:`~undate.date.Weekday` values) of the specified
+        month and day in each of the specified years in this calendar, as an
+        integer array; -1 for years when the date does not exist (e.g. February 29
+        in a non-leap year). Calculated for all years at once from Julian day
+        numbers; dates that don't convert back to the same date don't exist.
+        For calendars without :meth:`from_jdn_array`, each year is checked
+        with :meth:`max_month` and :meth:`max_day`."""
+        years = np.asarray(years, dtype=np.int64)
+        if not self.min_month() <= month <= self.max_month(self.LEAP_YEAR) or day < 1:
+            return np.full(len(years), -1, dtype=np.int64)
+        if type(self).from_jdn_array is BaseCalendarConverter.from_jdn_array:
+            valid = np.array(
+                [
+                    month <= self.max_month(year) and day <= self.max_day(year, month)
+                    for year in years.tolist()
+                ],
+                dtype=bool,
+            )
+            # only convert dates that exist
+            jdns = np.zeros(len(years), dtype=np.int64)
+            jdns[valid] = self.to_jdn_array(years[valid], month, day)
+        else:
+            jdns = self.to_jdn_array(years, month, day)
+            same_year, same_month, same_day = self.from_jdn_array(jdns)
+            valid = (same_year == years) & (same_month == month) & (same_day == day)
+        return np.where(valid, weekdays(jdns - EPOCH_JDN), -1)
@@ -1,16 +1,31 @@
-from calendar import isleap, monthrange
+from calendar import isleap
+from collections.abc import Iterable, Sequence
 
-from lark.exceptions import UnexpectedInput
+import numpy as np
+from lark import Lark
+from lark.exceptions import UnexpectedInput, VisitError
 
-from undate.converters.base import BaseCalendarConverter
-from undate.converters.calendars.gregorian.parser import gregorian_parser
+from undate.converters.base import BaseCalendarConverter, IntArray
+from undate.converters.calendars.gregorian.parser import get_parser
 from undate.converters.calendars.gregorian.transformer import GregorianDateTransformer
+from undate.date import EPOCH_JDN, gregorian_days, gregorian_from_days
 from undate.undate import Undate
 
+#: number of days in each month in a non-leap year, by month number
+#: (index 0 is unused); February has one more day in leap years
+MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 
 class GregorianDateConverter(BaseCalendarConverter):
     """
     Calendar converter class for Gregorian calendar.
+
+    By default, parses month names in all supported languages. To only
+    recognize month names in some languages, specify a list of language codes;
+    the parser for those languages is built on first use and cached::
+
+        GregorianDateConverter(languages=["de", "fr"]).parse("18 avril 2025")
+
     """
 
     #: converter name: Gregorian
@@ -23,8 +38,25 @@ class GregorianDateConverter(BaseCalendarConverter):
     #: arbitrary known leap year
     LEAP_YEAR: int = 2024
 
-    def __init__(self):
-        self.transformer = GregorianDateTransformer()
+    def __init__(self, languages: Iterable[str] | None = None):
+        #: language codes for month names; None for all supported languages
+        self.languages = tuple(languages) if languages is not None else None
+        # build the parser now, so unsupported languages are reported immediately
+        get_parser(self.languages)
+        self.transformer = GregorianDateTransformer(languages=self.languages)
+
+    @property
+    def parser(self) -> Lark:
+        """Parser for the configured month name languages; looked up from the
+        parser cache rather than stored, so converters can be pickled."""
+        return get_parser(self.languages)
+
+    @property
+    def cache_key(self) -> str:
+        """Converter name and configured month name languages, if any."""
+        if self.languages is None:
+            return self.name
+        return f"{self.name}[{','.join(self.languages)}]"
 
     def min_month(self) -> int:
         """First month for the Gregorian calendar."""
@@ -36,24 +68,47 @@ class GregorianDateConverter(BaseCalendarConverter):
 
     def max_day(self, year: int, month: int) -> int:
         """maximum numeric day for the specified year and month in this calendar"""
-        # if month is known, use that to calculate
-        if month:
-            # if year is known, use it; otherwise use a known non-leap year
-            # (only matters for February)
-            year = year or self.NON_LEAP_YEAR
-
-            # Use monthrange from python builtin calendar module.
-            # returns first day of the month and number of days in the month
-            # for the specified year and month.
-            _, max_day = monthrange(year, month)
-        else:
-            # if year and month are unknown, return maximum possible
-            # TODO: should this return an IntervalRange?
-            max_day = 31
-
-        return max_day
-
-    def representative_years(self, years: list[int] | None = None) -> list[int]:
+        # if month is unknown, return maximum possible
+        # TODO: should this return an IntervalRange?
+        if not month:
+            return 31
+        if not 1 <= month <= 12:
+            raise ValueError(f"Month {month} is out of range for Gregorian calendar")
+        # if year is unknown, use a known non-leap year
+        # (only matters for February)
+        year = year or self.NON_LEAP_YEAR
+        return MONTH_DAYS[month] + (month == 2 and isleap(year))
+
+    def max_day_array(self, years: IntArray, months: IntArray) -> np.ndarray:
+        """Maximum numeric day for each of the specified years and months,
+        given as integer arrays (or scalars) of known years and months."""
+        years, months = np.broadcast_arrays(
+            np.atleast_1d(years).astype(np.int64), np.asarray(months, dtype=np.int64)
+        )
+        if ((months < 1) | (months > 12)).any():
+            raise ValueError("Gregorian months must be between 1 and 12")
+        return np.array(MONTH_DAYS)[months] + (
+            (months == 2) & self.is_leap_year_array(years)
+        )
+
+    def is_leap_year(self, year: int) -> bool:
+        """Check whether a year is a leap year in the Gregorian calendar."""
+        return isleap(year)
+
+    def is_leap_year_array(self, years: IntArray) -> np.ndarray:
+        """Check which of the specified years are leap years, as a boolean array."""
+        years = np.atleast_1d(years).astype(np.int64)
+        return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+    def days_in_year(self, year: int) -> int:
+        """the number of days in the specified year for this calendar"""
+        return 365 + isleap(year)
+
+    def days_in_year_array(self, years: IntArray) -> np.ndarray:
+        """Number of days in each of the specified years, as an integer array."""
+        return 365 + self.is_leap_year_array(years).astype(np.int64)
+
+    def representative_years(self, years: Sequence[int] | None = None) -> list[int]:
         """Takes a list of years and returns a subset with one leap year and one non-leap year.
         If no years are specified, returns a known leap year and non-leap year.
         """
@@ -88,6 +143,21 @@ class GregorianDateConverter(BaseCalendarConverter):
         """
         return (year, month, day)
 
+    def to_jdn_array(
+        self, years: IntArray, months: IntArray, days: IntArray
+    ) -> np.ndarray:
+        """Julian day numbers for Gregorian dates, specified as integer arrays
+        (or scalars) of years, months and days. Dates are not validated;
+        days past the end of a month continue into the next month."""
+        return gregorian_days(np.atleast_1d(years), months, days) + EPOCH_JDN
+
+    def from_jdn_array(
+        self, jdns: IntArray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Gregorian dates for an integer array of Julian day numbers,
+        as arrays of years, months and days."""
+        return gregorian_from_days(np.atleast_1d(jdns) - EPOCH_JDN)
+
     def parse(self, value: str) -> Undate:
         """
         Parse a Gregorian date string of any supported precision in any
@@ -101,11 +171,15 @@ class GregorianDateConverter(BaseCalendarConverter):
         # parse the input string, then transform to undate object
         try:
             # parse the string with our Gregorian date parser
-            parsetree = gregorian_parser.parse(value)
-            # transform the parse tree into an undate object
-            undate_obj = self.transformer.transform(parsetree)
+            # and transform the parse tree into an undate object
+            undate_obj = self._parse_tree(self.parser, value)
             # set the original date string as the label
             undate_obj.label = value
             return undate_obj
         except UnexpectedInput as err:
             raise ValueError(f"Could not parse '{value}' as a Gregorian date") from err
+        except VisitError as err:
+            # invalid dates, e.g. a day or month that doesn't exist in that year
+            raise ValueError(
+                f"Could not parse '{value}' as a Gregorian date: {err.orig_exc}"
+            ) from err
@@ -0,0 +1,182 @@
+"""
+Month names (full and abbreviated) for parsing Gregorian dates,
+by language code.
+
+WARNING: This file is auto-generated. DO NOT EDIT.
+To regenerate: hatch run codegen:generate
+"""
+
+#: casefolded month names and numeric month, by language code
+MONTH_NAMES: dict[str, dict[str, int]] = {
+    "en": {
+        "january": 1,
+        "february": 2,
+        "march": 3,
+        "april": 4,
+        "may": 5,
+        "june": 6,
+        "july": 7,
+        "august": 8,
+        "september": 9,
+        "october": 10,
+        "november": 11,
+        "december": 12,
+        "jan": 1,
+        "feb": 2,
+        "mar": 3,
+        "apr": 4,
+        "jun": 6,
+        "jul": 7,
+        "aug": 8,
+        "sep": 9,
+        "oct": 10,
+        "nov": 11,
+        "dec": 12,
+    },
+    "es": {
+        "enero": 1,
+        "febrero": 2,
+        "marzo": 3,
+        "abril": 4,
+        "mayo": 5,
+        "junio": 6,
+        "julio": 7,
+        "agosto": 8,
+        "septiembre": 9,
+        "octubre": 10,
+        "noviembre": 11,
+        "diciembre": 12,
+        "ene": 1,
+        "feb": 2,
+        "mar": 3,
+        "abr": 4,
+        "may": 5,
+        "jun": 6,
+        "jul": 7,
+        "ago": 8,
+        "sept": 9,
+        "oct": 10,
+        "nov": 11,
+        "dic": 12,
+    },
+    "fr": {
+        "janvier": 1,
+        "février": 2,
+        "mars": 3,
+        "avril": 4,
+        "mai": 5,
+        "juin": 6,
+        "juillet": 7,
+        "août": 8,
+        "septembre": 9,
+        "octobre": 10,
+        "novembre": 11,
+        "décembre": 12,
+        "janv": 1,
+        "févr": 2,
+        "avr": 4,
+        "juil": 7,
+        "sept": 9,
+        "oct": 10,
+        "nov": 11,
+        "déc": 12,
+    },
+    "de": {
+        "januar": 1,
+        "februar": 2,
+        "märz": 3,
+        "april": 4,
+        "mai": 5,
+        "juni": 6,
+        "juli": 7,
+        "august": 8,
+        "september": 9,
+        "oktober": 10,
+        "november": 11,
+        "dezember": 12,
+        "jan": 1,
+        "feb": 2,
+        "apr": 4,
+        "aug": 8,
+        "sept": 9,
+        "okt": 10,
+        "nov": 11,
+        "dez": 12,
+    },
+    "rw": {
+        "mutarama": 1,
+        "gashyantare": 2,
+        "werurwe": 3,
+        "mata": 4,
+        "gicurasi": 5,
+        "kamena": 6,
+        "nyakanga": 7,
+        "kanama": 8,
+        "nzeri": 9,
+        "ukwakira": 10,
+        "ugushyingo": 11,
+        "ukuboza": 12,
+        "mut": 1,
+        "gas": 2,
+        "wer": 3,
+        "mat": 4,
+        "gic": 5,
+        "kam": 6,
+        "nya": 7,
+        "kan": 8,
+        "nze": 9,
+        "ukw": 10,
+        "ugu": 11,
+        "uku": 12,
+    },
+    "lg": {
+        "janwaliyo": 1,
+        "febwaliyo": 2,
+        "marisi": 3,
+        "apuli": 4,
+        "maayi": 5,
+        "juuni": 6,
+        "julaayi": 7,
+        "agusito": 8,
+        "sebuttemba": 9,
+        "okitobba": 10,
+        "novemba": 11,
+        "desemba": 12,
+        "jan": 1,
+        "feb": 2,
+        "mar": 3,
+        "apu": 4,
+        "maa": 5,
+        "juu": 6,
+        "jul": 7,
+        "agu": 8,
+        "seb": 9,
+        "oki": 10,
+        "nov": 11,
+        "des": 12,
+    },
+    "ti": {
+        "ጥሪ": 1,
+        "ለካቲት": 2,
+        "መጋቢት": 3,
+        "ሚያዝያ": 4,
+        "ጉንበት": 5,
+        "ሰነ": 6,
+        "ሓምለ": 7,
+        "ነሓሰ": 8,
+        "መስከረም": 9,
+        "ጥቅምቲ": 10,
+        "ሕዳር": 11,
+        "ታሕሳስ": 12,
+        "ለካ": 2,
+        "መጋ": 3,
+        "ሚያ": 4,
+        "ግን": 5,
+        "ሓም": 7,
+        "ነሓ": 8,
+        "መስ": 9,
+        "ጥቅ": 10,
+        "ሕዳ": 11,
+        "ታሕ": 12,
+    },
+}
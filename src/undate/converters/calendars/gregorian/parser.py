@@ -1,10 +1,72 @@
+import threading
+from collections.abc import Iterable
+
 from lark import Lark
 
 from undate.converters import GRAMMAR_FILE_PATH
+from undate.converters.calendars.gregorian.month_names import MONTH_NAMES
+from undate.converters.trie import trie_regex
 
 grammar_path = GRAMMAR_FILE_PATH / "gregorian.lark"
 
+
+def month_numbers(languages: Iterable[str] | None = None) -> dict[str, int]:
+    """Dictionary of casefolded month names and numeric month for the specified
+    language codes (all available languages, if not specified). If the same
+    name is used for different months, the first language takes precedence."""
+    if languages is None:
+        languages = MONTH_NAMES.keys()
+    numbers: dict[str, int] = {}
+    for lang in languages:
+        for name, month in MONTH_NAMES[lang].items():
+            numbers.setdefault(name, month)
+    return numbers
+
+
 # open based on filename to allow relative imports based on grammar file
 gregorian_parser = Lark.open(
     str(grammar_path), rel_to=__file__, start="gregorian_date", strict=True
 )
+
+
+# parsers for subsets of languages, keyed on tuple of language codes
+_parsers: dict[tuple[str, ...], Lark] = {}
+# lock so that each parser is only built once when used from multiple threads
+_parsers_lock = threading.Lock()
+
+
+def get_parser(languages: tuple[str, ...] | None = None) -> Lark:
+    """Get a Gregorian date parser that recognizes month names in the
+    specified languages (as a tuple of language codes); if no languages are
+    specified, returns the parser for all supported languages. Parsers for
+    a subset of languages are built on first use and cached."""
+    if languages is None:
+        return gregorian_parser
+    parser = _parsers.get(languages)
+    if parser is None:
+        with _parsers_lock:
+            # check again, in case another thread built it while waiting
+            parser = _parsers.get(languages)
+            if parser is None:
+                parser = _parsers[languages] = build_parser(languages)
+    return parser
+
+
+def build_parser(languages: tuple[str, ...]) -> Lark:
+    """Build a new Gregorian date parser that recognizes month names
+    in the specified languages. Use :meth:`get_parser` to get a cached parser."""
+    unsupported = set(languages) - MONTH_NAMES.keys()
+    if unsupported:
+        raise ValueError(
+            f"Unsupported language(s) for month names: {', '.join(sorted(unsupported))}"
+        )
+    # replace the month name terminal for all languages with one
+    # for the requested languages only
+    grammar = grammar_path.read_text().replace(
+        "%import .gregorian_multilang.MONTH_NAME",
+        f"MONTH_NAME: /{trie_regex(month_numbers(languages))}/i",
+    )
+    # source path is required for relative imports
+    return Lark(
+        grammar, start="gregorian_date", strict=True, source_path=str(grammar_path)
+    )
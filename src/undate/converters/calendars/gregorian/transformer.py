@@ -1,6 +1,9 @@
+from collections.abc import Iterable
+
 from lark import Transformer, Tree
 
 from undate import Calendar, Undate
+from undate.converters.calendars.gregorian.parser import month_numbers
 
 
 class GregorianDateTransformer(Transformer):
@@ -10,6 +13,15 @@ class GregorianDateTransformer(Transformer):
 
     calendar = Calendar.GREGORIAN
 
+    #: casefolded month names and numeric month; all supported languages
+    #: unless languages are specified when initializing
+    month_numbers: dict[str, int] = month_numbers()
+
+    def __init__(self, languages: Iterable[str] | None = None, visit_tokens=True):
+        super().__init__(visit_tokens=visit_tokens)
+        if languages is not None:
+            self.month_numbers = month_numbers(languages)
+
     def gregorian_date(self, items):
         parts = {}
         for child in items:
@@ -29,11 +41,8 @@ class GregorianDateTransformer(Transformer):
         return Tree(data="year", children=[value])
 
     def month(self, items):
-        # month has a nested tree for the rule and the value
-        # the name of the rule (month_1, month_2, etc) gives us the
-        # number of the month needed for converting the date
-        tree = items[0]
-        month_n = tree.data.split("_")[-1]
+        # month name token; look up the numeric month by casefolded name
+        month_n = self.month_numbers[str(items[0]).casefold()]
         return Tree(data="month", children=[month_n])
 
     def day(self, items):
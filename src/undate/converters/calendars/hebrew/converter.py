@@ -1,11 +1,152 @@
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
 from convertdate import hebrew
-from lark.exceptions import UnexpectedInput
+from lark.exceptions import UnexpectedInput, VisitError
 
 from undate import Undate, UndateInterval
-from undate.converters.base import BaseCalendarConverter
+from undate.converters.base import BaseCalendarConverter, IntArray
 from undate.converters.calendars.hebrew.parser import hebrew_parser
 from undate.converters.calendars.hebrew.transformer import HebrewDateTransformer
 
+#: number of years to check at a time when finding representative years
+REPRESENTATIVE_YEARS_CHUNK = 1000
+#: maximum number of year ranges with cached representative years
+REPRESENTATIVE_YEARS_CACHE_SIZE = 256
+
+
+def elapsed_days(years: np.ndarray) -> np.ndarray:
+    """Number of days from the Hebrew epoch to the new year (1 Tishri) of each
+    year, as an integer array; vectorized equivalent of ``delay_1`` and
+    ``delay_2`` from :mod:`convertdate.hebrew`."""
+    years = np.asarray(years, dtype=np.int64)
+
+    def delay_1(year):
+        months = (235 * year - 234) // 19
+        parts = 12084 + 13753 * months
+        day = months * 29 + parts // 25920
+        # new year cannot fall on Sunday, Wednesday, or Friday
+        return day + ((3 * (day + 1)) % 7 < 3)
+
+    last, present, next_ = delay_1(years - 1), delay_1(years), delay_1(years + 1)
+    delay_2 = np.where(next_ - present == 356, 2, np.where(present - last == 382, 1, 0))
+    return present + delay_2
+
+
+def year_days(years: np.ndarray) -> np.ndarray:
+    """Number of days in each Hebrew year, as an integer array;
+    vectorized equivalent of :func:`convertdate.hebrew.year_days`."""
+    years = np.asarray(years, dtype=np.int64)
+    return elapsed_days(years + 1) - elapsed_days(years)
+
+
+#: Julian day number of the Hebrew epoch; the new year (1 Tishri) of each
+#: year is this many days plus :func:`elapsed_days` for the year
+HEBREW_EPOCH_JDN = 347998
+
+#: average length of a Hebrew year in days, used to estimate the year of a date
+MEAN_YEAR_DAYS = 35975351 / 98496
+
+#: months in order from the start of the civil year (Tishri); Adar II (13)
+#: only occurs in leap years
+CIVIL_MONTHS = np.array([7, 8, 9, 10, 11, 12, 13, 1, 2, 3, 4, 5, 6])
+
+#: position of each month number in :data:`CIVIL_MONTHS` (position 0 is unused)
+CIVIL_MONTH_POSITIONS = np.concatenate([[0], np.argsort(CIVIL_MONTHS)])
+
+#: all possible lengths of a Hebrew year, in days
+YEAR_LENGTHS = np.array([353, 354, 355, 383, 384, 385])
+
+
+def _month_starts(year_length: int) -> np.ndarray:
+    # days from 1 Tishri to the first of each month, in civil year order
+    month_days = np.array([30, 29, 30, 29, 30, 30, 29, 30, 29, 30, 29, 30, 29])
+    if year_length < 383:
+        # Adar has 29 days and there is no Adar II
+        month_days[5:7] = [29, 0]
+    if year_length % 10 == 5:
+        # Heshvan has 30 days in complete years
+        month_days[1] = 30
+    elif year_length % 10 == 3:
+        # Kislev has 29 days in deficient years
+        month_days[2] = 29
+    return np.cumsum(month_days) - month_days
+
+
+#: days from the new year to the first day of each month in :data:`CIVIL_MONTHS`
+#: order, for each of :data:`YEAR_LENGTHS`
+MONTH_STARTS = np.array([_month_starts(length) for length in YEAR_LENGTHS])
+
+
+def to_jdn(years, months, days) -> np.ndarray:
+    """Julian day numbers for Hebrew dates, specified as integer arrays
+    (or scalars) of years, months and days; vectorized equivalent of
+    :func:`convertdate.hebrew.to_jd`. Dates are not validated."""
+    years, months, days = (
+        arr.astype(np.int64)
+        for arr in np.broadcast_arrays(np.atleast_1d(years), months, days)
+    )
+    if ((months < 1) | (months > 13)).any():
+        raise ValueError("Hebrew months must be between 1 and 13")
+    new_years = elapsed_days(years)
+    lengths = elapsed_days(years + 1) - new_years
+    offsets = MONTH_STARTS[
+        np.searchsorted(YEAR_LENGTHS, lengths), CIVIL_MONTH_POSITIONS[months]
+    ]
+    return HEBREW_EPOCH_JDN + new_years + offsets + days - 1
+
+
+def from_jdn(jdns) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Hebrew dates for an integer array of Julian day numbers, as arrays of
+    years, months and days; vectorized equivalent of
+    :func:`convertdate.hebrew.from_jd`."""
+    days_since = np.atleast_1d(jdns).astype(np.int64) - HEBREW_EPOCH_JDN
+    # estimate the year from the average year length, then correct it
+    years = np.floor(days_since / MEAN_YEAR_DAYS).astype(np.int64) + 1
+    while (too_late := elapsed_days(years) > days_since).any():
+        years -= too_late
+    while (too_early := elapsed_days(years + 1) <= days_since).any():
+        years += too_early
+
+    new_years = elapsed_days(years)
+    day_of_year = days_since - new_years
+    year_types = np.searchsorted(YEAR_LENGTHS, elapsed_days(years + 1) - new_years)
+    positions = np.empty(len(years), dtype=np.int64)
+    for year_type, starts in enumerate(MONTH_STARTS):
+        rows = year_types == year_type
+        positions[rows] = np.searchsorted(starts, day_of_year[rows], side="right") - 1
+    days = day_of_year - MONTH_STARTS[year_types, positions] + 1
+    return years, CIVIL_MONTHS[positions], days
+
+
+@lru_cache(maxsize=REPRESENTATIVE_YEARS_CACHE_SIZE)
+def _range_representative_years(years: range) -> tuple[int, ...]:
+    # ranges cover all the years for a partially known year like 48XX,
+    # so the same ranges are used repeatedly
+    return _representative_years(years)
+
+
+def _representative_years(years: Sequence[int]) -> tuple[int, ...]:
+    year_lengths: set[int] = set()
+    max_year_lengths = 6  # there are 6 different possible length years
+    rep_years: list[int] = []
+    # calculate year lengths for a chunk of years at a time, since
+    # all year lengths are usually found within a short span of years
+    for start in range(0, len(years), REPRESENTATIVE_YEARS_CHUNK):
+        chunk = np.asarray(years[start : start + REPRESENTATIVE_YEARS_CHUNK])
+        lengths = year_days(chunk)
+        # first occurrence of each length within this chunk, in order
+        _, first = np.unique(lengths, return_index=True)
+        for i in np.sort(first):
+            if int(lengths[i]) not in year_lengths:
+                year_lengths.add(int(lengths[i]))
+                rep_years.append(int(chunk[i]))
+        # stop if we find one example of each type of year
+        if len(year_lengths) == max_year_lengths:
+            break
+    return tuple(rep_years)
+
 
 class HebrewDateConverter(BaseCalendarConverter):
     """
@@ -59,31 +200,21 @@ class HebrewDateConverter(BaseCalendarConverter):
         """the number of days in the specified year for this calendar"""
         return int(hebrew.year_days(year))
 
-    def representative_years(self, years: list[int] | None = None) -> list[int]:
+    def representative_years(self, years: Sequence[int] | None = None) -> list[int]:
         """Takes a list of years and returns a subset with all possible variations in number of days.
-        If no years are specified, returns ...
+        If no years are specified, returns a known leap year and non-leap year.
+        Results are cached for ranges of years, such as the possible years
+        for a partially known year.
         """
 
-        year_lengths = set()
-        max_year_lengths = 6  # there are 6 different possible length years
-
         # if years is unset or list is empty
         if not years:
             # NOTE: this does not cover all possible lengths, but should cover min/max
             return [self.LEAP_YEAR, self.NON_LEAP_YEAR]
 
-        rep_years = []
-        for year in years:
-            days = self.days_in_year(year)
-            if days not in year_lengths:
-                year_lengths.add(days)
-                rep_years.append(year)
-
-            # stop if we find one example of each type of year
-            if len(year_lengths) == max_year_lengths:
-                break
-
-        return rep_years
+        if isinstance(years, range):
+            return list(_range_representative_years(years))
+        return list(_representative_years(years))
 
     def to_gregorian(self, year: int, month: int, day: int) -> tuple[int, int, int]:
         """Convert a Hebrew date, specified by year, month, and day,
@@ -91,6 +222,20 @@ class HebrewDateConverter(BaseCalendarConverter):
         """
         return hebrew.to_gregorian(year, month, day)
 
+    def to_jdn_array(
+        self, years: IntArray, months: IntArray, days: IntArray
+    ) -> np.ndarray:
+        """Julian day numbers for Hebrew dates, specified as integer arrays
+        (or scalars) of years, months and days. Dates are not validated."""
+        return to_jdn(years, months, days)
+
+    def from_jdn_array(
+        self, jdns: IntArray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Hebrew dates for an integer array of Julian day numbers,
+        as arrays of years, months and days."""
+        return from_jdn(jdns)
+
     def parse(self, value: str) -> Undate | UndateInterval:
         """
         Parse a Hebrew date string and return an :class:`~undate.undate.Undate` or
@@ -103,14 +248,18 @@ class HebrewDateConverter(BaseCalendarConverter):
         # parse the input string, then transform to undate object
         try:
             # parse the string with our Hebrew date parser
-            parsetree = hebrew_parser.parse(value)
-            # transform the parse tree into an undate or undate interval
-            undate_obj = self.transformer.transform(parsetree)
+            # and transform the parse tree into an undate or undate interval
+            undate_obj = self._parse_tree(hebrew_parser, value)
             # set the original date as a label, with the calendar name
             undate_obj.label = f"{value} {self.calendar_name}"
             return undate_obj
         except UnexpectedInput as err:
             raise ValueError(f"Could not parse '{value}' as a Hebrew date") from err
+        except VisitError as err:
+            # invalid dates, e.g. a day or month that doesn't exist in that year
+            raise ValueError(
+                f"Could not parse '{value}' as a Hebrew date: {err.orig_exc}"
+            ) from err
 
     # do we need to support conversion the other direction?
     # i.e., generate a Hebrew date from an arbitrary undate or undate interval?
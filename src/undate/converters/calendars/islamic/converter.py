@@ -1,11 +1,52 @@
+from collections.abc import Sequence
+
+import numpy as np
 from convertdate import islamic
-from lark.exceptions import UnexpectedInput
+from lark.exceptions import UnexpectedInput, VisitError
 
 from undate import Undate, UndateInterval
-from undate.converters.base import BaseCalendarConverter
+from undate.converters.base import BaseCalendarConverter, IntArray
 from undate.converters.calendars.islamic.parser import islamic_parser
 from undate.converters.calendars.islamic.transformer import IslamicDateTransformer
 
+#: number of days in each month in a non-leap year, by month number
+#: (index 0 is unused); the last month has 30 days in leap years
+MONTH_DAYS = (0, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29)
+
+#: Julian day number of the day before the Islamic epoch (1 Muharram 1 AH)
+ISLAMIC_EPOCH_JDN = 1948439
+
+
+def to_jdn(years, months, days) -> np.ndarray:
+    """Julian day numbers for Islamic dates, specified as integer arrays
+    (or scalars) of years, months and days; integer equivalent of
+    :func:`convertdate.islamic.to_jd`. Dates are not validated."""
+    years, months, days = (
+        np.asarray(arr, dtype=np.int64) for arr in (np.atleast_1d(years), months, days)
+    )
+    return (
+        days
+        # months alternate between 30 and 29 days: ceil(29.5 * (month - 1))
+        + (59 * (months - 1) + 1) // 2
+        + (years - 1) * 354
+        # leap days in the 30-year cycle
+        + (3 + 11 * years) // 30
+        + ISLAMIC_EPOCH_JDN
+    )
+
+
+def from_jdn(jdns) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Islamic dates for an integer array of Julian day numbers, as arrays of
+    years, months and days; integer equivalent of
+    :func:`convertdate.islamic.from_jd`."""
+    jdns = np.atleast_1d(jdns).astype(np.int64)
+    years = (30 * (jdns - ISLAMIC_EPOCH_JDN - 1) + 10646) // 10631
+    # ceil((jdn - (29 + first day of the year)) / 29.5) + 1, at most 12
+    after_first_month = jdns - 29 - to_jdn(years, 1, 1)
+    months = np.minimum(12, -((-2 * after_first_month) // 59) + 1)
+    days = jdns - to_jdn(years, months, 1) + 1
+    return years, months, days
+
 
 class IslamicDateConverter(BaseCalendarConverter):
     """
@@ -34,7 +75,38 @@ class IslamicDateConverter(BaseCalendarConverter):
 
     def max_day(self, year: int, month: int) -> int:
         """maximum numeric day for the specified year and month in this calendar"""
-        return islamic.month_length(year, month)
+        if not 1 <= month <= 12:
+            raise ValueError(f"Month {month} is out of range for Islamic calendar")
+        return MONTH_DAYS[month] + (month == 12 and self.is_leap_year(year))
+
+    def max_day_array(self, years: IntArray, months: IntArray) -> np.ndarray:
+        """Maximum numeric day for each of the specified years and months,
+        given as integer arrays (or scalars)."""
+        years, months = np.broadcast_arrays(
+            np.atleast_1d(years).astype(np.int64), np.asarray(months, dtype=np.int64)
+        )
+        if ((months < 1) | (months > 12)).any():
+            raise ValueError("Islamic months must be between 1 and 12")
+        return np.array(MONTH_DAYS)[months] + (
+            (months == 12) & self.is_leap_year_array(years)
+        )
+
+    def is_leap_year(self, year: int) -> bool:
+        """Check whether a year is a leap year (with 355 days) in the
+        Islamic calendar; equivalent to :func:`convertdate.islamic.leap`."""
+        return (year * 11 + 14) % 30 < 11
+
+    def is_leap_year_array(self, years: IntArray) -> np.ndarray:
+        """Check which of the specified years are leap years, as a boolean array."""
+        return (np.atleast_1d(years).astype(np.int64) * 11 + 14) % 30 < 11
+
+    def days_in_year(self, year: int) -> int:
+        """the number of days in the specified year for this calendar"""
+        return 354 + self.is_leap_year(year)
+
+    def days_in_year_array(self, years: IntArray) -> np.ndarray:
+        """Number of days in each of the specified years, as an integer array."""
+        return 354 + self.is_leap_year_array(years).astype(np.int64)
 
     def min_month(self) -> int:
         """smallest numeric month for this calendar."""
@@ -44,7 +116,7 @@ class IslamicDateConverter(BaseCalendarConverter):
         """maximum numeric month for this calendar"""
         return 12
 
-    def representative_years(self, years: list[int] | None = None) -> list[int]:
+    def representative_years(self, years: Sequence[int] | None = None) -> list[int]:
         """Takes a list of years and returns a subset with one leap year and one non-leap year.
         If no years are specified, returns a known leap year and non-leap year.
         """
@@ -56,7 +128,7 @@ class IslamicDateConverter(BaseCalendarConverter):
         found_non_leap = False
         rep_years = []
         for year in years:
-            if islamic.leap(year):
+            if self.is_leap_year(year):
                 if not found_leap:
                     found_leap = True
                     rep_years.append(year)
@@ -77,6 +149,20 @@ class IslamicDateConverter(BaseCalendarConverter):
         # NOTE: this results in weird numbers for months when year gets sufficiently high
         return islamic.to_gregorian(year, month, day)
 
+    def to_jdn_array(
+        self, years: IntArray, months: IntArray, days: IntArray
+    ) -> np.ndarray:
+        """Julian day numbers for Hijri dates, specified as integer arrays
+        (or scalars) of years, months and days. Dates are not validated."""
+        return to_jdn(years, months, days)
+
+    def from_jdn_array(
+        self, jdns: IntArray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Hijri dates for an integer array of Julian day numbers,
+        as arrays of years, months and days."""
+        return from_jdn(jdns)
+
     def parse(self, value: str) -> Undate | UndateInterval:
         """
         Parse an Islamic/Hijri date string and return an :class:`~undate.undate.Undate` or
@@ -89,14 +175,18 @@ class IslamicDateConverter(BaseCalendarConverter):
         # parse the input string, then transform to undate object
         try:
             # parse the string with our Islamic Hijri date parser
-            parsetree = islamic_parser.parse(value)
-            # transform the parse tree into an undate or undate interval
-            undate_obj = self.transformer.transform(parsetree)
+            # and transform the parse tree into an undate or undate interval
+            undate_obj = self._parse_tree(islamic_parser, value)
             # set the original date as a label, with the calendar name
             undate_obj.label = f"{value} {self.calendar_name}"
             return undate_obj
         except UnexpectedInput as err:
             raise ValueError(f"Could not parse '{value}' as an Islamic date") from err
+        except VisitError as err:
+            # invalid dates, e.g. a day or month that doesn't exist in that year
+            raise ValueError(
+                f"Could not parse '{value}' as an Islamic date: {err.orig_exc}"
+            ) from err
 
     # do we need to support conversion the other direction?
     # i.e., generate an Islamic Hijri date from an arbitrary undate or undate interval?
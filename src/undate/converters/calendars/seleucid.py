@@ -1,3 +1,8 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from undate.converters.base import IntArray
 from undate.converters.calendars import HebrewDateConverter
 from undate.undate import Calendar
 
@@ -10,12 +15,46 @@ class SeleucidDateConverter(HebrewDateConverter):
     name: str = "Seleucid"
     calendar_name: str = "Seleucid"
 
+    #: arbitrary known non-leap year (4816 Anno Mundi, with 353 days)
+    NON_LEAP_YEAR: int = HebrewDateConverter.NON_LEAP_YEAR - SELEUCID_OFFSET
+    #: arbitrary known leap year (4837 Anno Mundi, with 385 days)
+    LEAP_YEAR: int = HebrewDateConverter.LEAP_YEAR - SELEUCID_OFFSET
+
     def __init__(self):
         super().__init__()
         # override hebrew calendar to initialize undates with seleucid
         # calendar; this triggers Seleucid calendar to_gregorian method use
         self.transformer.calendar = Calendar.SELEUCID
 
+    def max_month(self, year: int) -> int:
+        """Maximum numeric month for the specified Seleucid year; 12 or 13
+        depending on whether it is a leap year."""
+        return super().max_month(year + self.SELEUCID_OFFSET)
+
+    def max_day(self, year: int, month: int) -> int:
+        """maximum numeric day for the specified year and month in this calendar"""
+        return super().max_day(year + self.SELEUCID_OFFSET, month)
+
+    def representative_years(self, years: Sequence[int] | None = None) -> list[int]:
+        """Takes a list of Seleucid years and returns a subset with all
+        possible variations in number of days, using the Hebrew calendar
+        with :attr:`SELEUCID_OFFSET`. If no years are specified, returns
+        a known leap year and non-leap year."""
+        if not years:
+            return [self.LEAP_YEAR, self.NON_LEAP_YEAR]
+        if isinstance(years, range):
+            am_years: Sequence[int] = range(
+                years.start + self.SELEUCID_OFFSET,
+                years.stop + self.SELEUCID_OFFSET,
+                years.step,
+            )
+        else:
+            am_years = [year + self.SELEUCID_OFFSET for year in years]
+        return [
+            year - self.SELEUCID_OFFSET
+            for year in super().representative_years(am_years)
+        ]
+
     def to_gregorian(self, year: int, month: int, day: int) -> tuple[int, int, int]:
         """Convert a Seleucid date, specified by year, month, and day,
         to the Gregorian equivalent date. Uses hebrew calendar conversion
@@ -23,6 +62,24 @@ class SeleucidDateConverter(HebrewDateConverter):
         """
         return super().to_gregorian(year + self.SELEUCID_OFFSET, month, day)
 
+    def to_jdn_array(
+        self, years: IntArray, months: IntArray, days: IntArray
+    ) -> np.ndarray:
+        """Julian day numbers for Seleucid dates, specified as integer arrays
+        (or scalars) of years, months and days; uses Hebrew calendar
+        conversion with :attr:`SELEUCID_OFFSET`."""
+        return super().to_jdn_array(
+            np.asarray(years, dtype=np.int64) + self.SELEUCID_OFFSET, months, days
+        )
+
+    def from_jdn_array(
+        self, jdns: IntArray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Seleucid dates for an integer array of Julian day numbers,
+        as arrays of years, months and days."""
+        years, months, days = super().from_jdn_array(jdns)
+        return years - self.SELEUCID_OFFSET, months, days
+
     def days_in_year(self, year: int) -> int:
         """the number of days in the specified year for this calendar"""
         return super().days_in_year(year + self.SELEUCID_OFFSET)
@@ -5,7 +5,7 @@ as EDTF in Gregorian calendar.
 """
 
 from lark import Lark
-from lark.exceptions import UnexpectedInput
+from lark.exceptions import UnexpectedInput, VisitError
 from lark.visitors import Transformer, merge_transformers
 
 from undate import Undate, UndateInterval
@@ -76,13 +76,15 @@ class OmnibusDateConverter(BaseDateConverter):
 
         # parse the input string, then transform to undate object
         try:
-            parsetree = parser.parse(value)
             # transform returns a list; we want the first item in the list
-            return self.transformer.transform(parsetree)[0]
+            return self._parse_tree(parser, value)[0]
         except UnexpectedInput as err:
             raise ValueError(
                 f"Parsing failed: '{value}' is not in a recognized date format"
             ) from err
+        except VisitError as err:
+            # invalid dates, e.g. a day or month that doesn't exist in that year
+            raise ValueError(f"Could not parse '{value}': {err.orig_exc}") from err
 
     def to_string(self, undate: Undate | UndateInterval) -> str:
         "Not supported by this converter. Will raise :class:`ValueError`"
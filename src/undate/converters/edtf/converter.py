@@ -1,4 +1,4 @@
-from lark.exceptions import UnexpectedInput
+from lark.exceptions import UnexpectedInput, VisitError
 
 from undate import Undate, UndateInterval
 from undate.converters.base import BaseDateConverter
@@ -35,12 +35,14 @@ class EDTFDateConverter(BaseDateConverter):
 
         # parse the input string, then transform to undate object
         try:
-            parsetree = edtf_parser.parse(value)
-            return self.transformer.transform(parsetree)
+            return self._parse_tree(edtf_parser, value)
         except UnexpectedInput as err:
             raise ValueError(
                 f"Parsing failed: '{value}' is not a supported EDTF date format"
             ) from err
+        except VisitError as err:
+            # invalid dates, e.g. a day or month that doesn't exist in that year
+            raise ValueError(f"Could not parse '{value}': {err.orig_exc}") from err
 
     def _convert_missing_digits(
         self, value: str | None, old_missing_digit: str
@@ -66,37 +68,38 @@ class EDTFDateConverter(BaseDateConverter):
     def _undate_to_string(self, undate: Undate) -> str:
         # in theory it's possible to use the parser and reconstruct using a tree,
         # but that seems much more complicated and would be harder to read
-        parts = []
+        parts = [
+            self.part_to_string(part, value, undate.precision)
+            for part, value in undate.initial_values.items()
+        ]
+        if any(parts):
+            return "-".join(part for part in parts if part)
 
-        if undate.precision >= DatePrecision.YEAR:
-            year = self._convert_missing_digits(undate.year, undate.MISSING_DIGIT)
-            # years with more than 4 digits should be prefixed with Y
-            # (don't count minus sign when checking digits)
-            if year and len(year.lstrip("-")) > 4:
-                year = f"Y{year}"
-
-            # TODO: handle uncertain / approximate
-            parts.append(year or EDTF_UNSPECIFIED_DIGIT * 4)
+        # how can we have an empty string? probably shouldn't get here
+        raise ValueError("Failed to generate an EDTF string from %r", undate)
 
+    def part_to_string(
+        self, part: str, value: int | str | None, precision: DatePrecision
+    ) -> str | None:
+        """
+        Convert the year, month, or day used to initialize an
+        :class:`~undate.undate.Undate` to EDTF format; parts that are
+        not included in the date precision are omitted.
+        """
         # beware when we add more date precisions,
         # week-level won't necessarily mean we know the month
-
-        if undate.precision >= DatePrecision.MONTH:
-            # TODO: handle uncertain / approximate
-            parts.append(
-                self._convert_missing_digits(undate.month, undate.MISSING_DIGIT)
-                or EDTF_UNSPECIFIED_DIGIT * 2
+        if precision < DatePrecision[part.upper()]:
+            return None
+        # TODO: handle uncertain / approximate
+        width = 4 if part == "year" else 2
+        string = (
+            self._convert_missing_digits(
+                Undate.part_string(part, value, precision), Undate.MISSING_DIGIT
             )
-
-        if undate.precision >= DatePrecision.DAY:
-            # TODO: handle uncertain / approximate
-            parts.append(
-                self._convert_missing_digits(undate.day, undate.MISSING_DIGIT)
-                or EDTF_UNSPECIFIED_DIGIT * 2
-            )
-
-        if parts:
-            return "-".join(parts)
-
-        # how can we have an empty string? probably shouldn't get here
-        raise ValueError("Failed to generate an EDTF string from %r", undate)
+            or EDTF_UNSPECIFIED_DIGIT * width
+        )
+        # years with more than 4 digits should be prefixed with Y
+        # (don't count minus sign when checking digits)
+        if part == "year" and len(string.lstrip("-")) > 4:
+            string = f"Y{string}"
+        return string
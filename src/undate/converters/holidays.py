@@ -3,8 +3,10 @@ Holiday date Converter: parse Christian liturgical dates and convert to Gregoria
 """
 
 import datetime
+import threading
+from collections.abc import Sequence
 
-from convertdate import holidays  # type: ignore[import-untyped]
+import numpy as np
 from lark import Lark, Token, Transformer, Tree
 from lark.exceptions import UnexpectedInput
 
@@ -40,10 +42,147 @@ MOVABLE_FEASTS = {
     "SHROVE_TUESDAY": -47,  # day before Ash Wednesday
 }
 
+#: initial span of years in the Easter date table; the table is
+#: extended as needed when dates outside this span are requested
+EASTER_TABLE_YEARS = (1500, 2100)
+#: maximum number of years the Easter date table will be extended to cover;
+#: dates for years beyond this span are calculated without being stored
+EASTER_TABLE_MAX_SPAN = 10000
+
+
+def computus(years: np.ndarray) -> np.ndarray:
+    """Calculate the date of (western) Easter for an array of years, as an
+    array of Gregorian ``datetime64[D]`` dates. Vectorized version of
+    the US Naval Observatory algorithm used by :mod:`convertdate.holidays`,
+    for years 1 and later."""
+    year = np.asarray(years, dtype=np.int64)
+
+    def trunc(a, b):
+        # integer division truncated toward zero, as the algorithm requires;
+        # all divisors are positive
+        return np.sign(a) * (np.abs(a) // b)
+
+    c = trunc(year, 100)
+    n = year - 19 * trunc(year, 19)
+    k = trunc(c - 17, 25)
+    i = c - trunc(c, 4) - trunc(c - k, 3) + 19 * n + 15
+    i = i - 30 * trunc(i, 30)
+    i = i - trunc(i, 28) * (1 - trunc(i, 28) * trunc(29, i + 1) * trunc(21 - n, 11))
+    j = year + trunc(year, 4) + i + 2 - c + trunc(c, 4)
+    j = j - 7 * trunc(j, 7)
+    offset = i - j
+    month = 3 + trunc(offset + 40, 44)
+    day = offset + 28 - 31 * trunc(month, 4)
+    return _to_datetime64(year, month, day)
+
+
+def _to_datetime64(year: np.ndarray, month, day) -> np.ndarray:
+    # combine numeric year, month, and day arrays into datetime64 dates
+    return (
+        (year - 1970).astype("datetime64[Y]").astype("datetime64[M]")
+        + (np.asarray(month) - 1).astype("timedelta64[M]")
+    ).astype("datetime64[D]") + (np.asarray(day) - 1).astype("timedelta64[D]")
+
+
+# table of Easter dates, as a tuple of first year and array of dates;
+# the tuple is replaced (not modified) when the table is extended,
+# so lookups never see a partially updated table
+_easter_table: tuple[int, np.ndarray] = (
+    EASTER_TABLE_YEARS[0],
+    computus(np.arange(*EASTER_TABLE_YEARS)),
+)
+# lock so that only one thread extends the table at a time
+_easter_table_lock = threading.Lock()
+
+
+def easter_dates(years: np.ndarray | Sequence[int]) -> np.ndarray:
+    """Easter dates for an array of years, as Gregorian ``datetime64[D]``
+    dates. Dates are looked up in a precomputed table, which is extended
+    as needed to cover the requested years. Raises :class:`ValueError`
+    for years before 1."""
+    global _easter_table
+    years = np.asarray(years, dtype=np.int64)
+    if not years.size:
+        return np.array([], dtype="datetime64[D]")
+    _check_years(years)
+    start, table = _easter_table
+    first, last = int(years.min()), int(years.max())
+    if first < start or last >= start + len(table):
+        if max(last + 1, start + len(table)) - min(first, start) > (
+            EASTER_TABLE_MAX_SPAN
+        ):
+            # too many years to store; calculate directly
+            return computus(years)
+        with _easter_table_lock:
+            # another thread may have extended the table while waiting for the lock
+            start, table = _easter_table
+            new_start = min(first, start)
+            new_end = max(last + 1, start + len(table))
+            # calculate dates for the missing years before and after the table
+            table = np.concatenate(
+                [
+                    computus(np.arange(new_start, start)),
+                    table,
+                    computus(np.arange(start + len(table), new_end)),
+                ]
+            )
+            start = new_start
+            _easter_table = (start, table)
+    return table[years - start]
+
+
+def _check_years(years: np.ndarray):
+    if years.size and years.min() < 1:
+        raise ValueError(
+            f"Holiday dates are not supported for years before 1: {years.min()}"
+        )
+
+
+def easter_date(year: int) -> datetime.date:
+    """Easter date for a single year, from the Easter date table."""
+    start, table = _easter_table
+    if start <= year < start + len(table):
+        return table[year - start].item()
+    return easter_dates([year])[0].item()
+
+
+def movable_feast_dates(feast: str, years: np.ndarray | Sequence[int]) -> np.ndarray:
+    """Gregorian dates for a movable feast (any key of :data:`MOVABLE_FEASTS`,
+    e.g. ``"PENTECOST"``) for an array of years, as ``datetime64[D]`` dates."""
+    try:
+        offset = MOVABLE_FEASTS[feast]
+    except KeyError as err:
+        raise ValueError(f"Unknown movable feast {feast}") from err
+    return easter_dates(years) + np.timedelta64(offset, "D")
+
+
+def holiday_dates(holiday: str, years: Sequence[int] | str) -> np.ndarray:
+    """Gregorian dates for a holiday (any key of :data:`FIXED_HOLIDAYS` or
+    :data:`MOVABLE_FEASTS`) in each of the specified years, as an array of
+    ``datetime64[D]`` dates. Years may be a sequence or range of years or a
+    partially known year such as ``"16XX"``, which is expanded to all
+    possible years (see :attr:`Undate.possible_years
+    <undate.undate.Undate.possible_years>`). Raises :class:`ValueError`
+    for years before 1."""
+    if isinstance(years, str):
+        years = Undate(years).possible_years
+    if holiday in MOVABLE_FEASTS:
+        return movable_feast_dates(holiday, years)
+    if holiday in FIXED_HOLIDAYS:
+        month, day = FIXED_HOLIDAYS[holiday]
+        year_array = np.asarray(years, dtype=np.int64)
+        _check_years(year_array)
+        return _to_datetime64(year_array, month, day)
+    raise ValueError(f"Unknown holiday {holiday}")
+
 
 parser = Lark.open(
     str(GRAMMAR_FILE_PATH / "holidays.lark"), rel_to=__file__, start="holiday_date"
 )
+#: parser for holiday names without a year
+name_parser = Lark.open(
+    str(GRAMMAR_FILE_PATH / "holidays.lark"), rel_to=__file__, start="holiday_name"
+)
 
 
 class HolidayTransformer(Transformer):
@@ -119,9 +258,7 @@ class HolidayTransformer(Transformer):
                 raise ValueError("Year is required for movable feasts") from err
             offset = MOVABLE_FEASTS[movable_feast]
 
-            holiday_date = datetime.date(*holidays.easter(year)) + datetime.timedelta(
-                days=offset
-            )
+            holiday_date = easter_date(int(year)) + datetime.timedelta(days=offset)
             parts.update({"month": holiday_date.month, "day": holiday_date.day})
 
         return parts
@@ -153,14 +290,34 @@ class HolidayDateConverter(BaseDateConverter):
             raise ValueError("Parsing empty string is not supported")
 
         try:
-            parsetree = parser.parse(value)
-            # transform the parse tree into an undate or undate interval
-            undate_obj = self.transformer.transform(parsetree)
+            # parse the string and transform the parse tree into an undate
+            undate_obj = self._parse_tree(parser, value)
             # set the input holiday text as a label on the undate object
             undate_obj.label = value
             return undate_obj
         except UnexpectedInput as err:
             raise ValueError(f"Could not parse '{value}' as a holiday date") from err
 
+    def candidate_dates(self, value: str, years: Sequence[int] | str) -> np.ndarray:
+        """Calculate Gregorian dates for a holiday name without a year (e.g.
+        "Pentecost" or "Ash Wednesday") across a range of years or
+        a partially known year like ``"16XX"``; returns an array of
+        ``datetime64[D]`` dates, one for each year.
+        See :func:`holiday_dates` for details.
+
+        Example usage::
+
+            converter.candidate_dates("Pentecost", range(1500, 1901))
+            converter.candidate_dates("Ash Wednesday", "16XX")
+
+        """
+        try:
+            parsetree = name_parser.parse(value)
+        except UnexpectedInput as err:
+            raise ValueError(f"Could not parse '{value}' as a holiday name") from err
+        # the holiday name is the type of the only token in the tree
+        holiday = next(parsetree.scan_values(lambda v: isinstance(v, Token)))
+        return holiday_dates(holiday.type, years)
+
     def to_string(self, undate: Undate) -> str:
         raise ValueError("Holiday converter does not support serialization")
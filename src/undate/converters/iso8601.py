@@ -2,6 +2,7 @@ from typing import ClassVar
 
 from undate import Undate, UndateInterval
 from undate.converters.base import BaseDateConverter
+from undate.date import DatePrecision
 
 
 class ISO8601DateFormat(BaseDateConverter):
@@ -70,40 +71,27 @@ class ISO8601DateFormat(BaseDateConverter):
 
     def _undate_to_string(self, undate: Undate) -> str:
         # serialize to iso format for simplicity, for now
-        date_parts: list[str | None] = []
-        # for each part of the date that is known, generate the string format
-        # then combine
         # TODO: should error if we have year and day but no month
-        # TODO: may want to refactor and take advantage of the year/month/day properties
-        # added for use in EDTF formatter code
-        for date_portion in self.iso_format:
-            # is known means fully known, means guaranteed integer
-            if undate.is_known(date_portion):
-                # NOTE: datetime strftime for %Y for 3-digit year
-                # results in leading zero in some environments
-                # and not others; force year to always be 4 digits
-                if date_portion == "year" and undate.year:
-                    try:
-                        date_parts.append(f"{undate.year:04}")
-                    except ValueError:
-                        # shouldn't happen because of is_known
-                        date_parts.append(undate.year)
-                elif date_portion == "month" and undate.month:
-                    try:
-                        date_parts.append(f"{undate.month:02}")
-                    except ValueError:
-                        # shouldn't happen because of is_known
-                        date_parts.append(undate.month)
-                elif date_portion == "day" and undate.day:
-                    try:
-                        date_parts.append(f"{undate.day:02}")
-                    except ValueError:
-                        # shouldn't happen because of is_known
-                        date_parts.append(undate.day)
+        date_parts = [
+            self.part_to_string(part, undate.initial_values[part], undate.precision)
+            for part in self.iso_format
+        ]
+        return "-".join(part for part in date_parts if part)
 
-            elif date_portion == "year":
-                # if year is not known, add '-' for year portion,
-                # to generate --MM-DD unknown year format
-                date_parts.append("-")
-        # TODO: fix type error: "list[str | None]" is incompatible with "Iterable[str]"
-        return "-".join(date_parts)  # type: ignore
+    def part_to_string(
+        self, part: str, value: int | str | None, precision: DatePrecision
+    ) -> str | None:
+        """
+        Convert the year, month, or day used to initialize an
+        :class:`~undate.undate.Undate` to ISO8601 format; only fully
+        known parts are included.
+        """
+        # is known means fully known, means guaranteed integer
+        if not isinstance(value, int):
+            # if year is not known, use '-' for year portion,
+            # to generate --MM-DD unknown year format
+            return "-" if part == "year" else None
+        # NOTE: datetime strftime for %Y for 3-digit year
+        # results in leading zero in some environments
+        # and not others; force year to always be 4 digits
+        return Undate.part_string(part, value, precision)
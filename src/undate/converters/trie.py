@@ -0,0 +1,39 @@
+"""
+Utility for building trie-structured regular expressions, used for
+matching large sets of words (e.g. month names) in parser grammars.
+"""
+
+import re
+from collections.abc import Iterable
+
+
+def trie_regex(words: Iterable[str]) -> str:
+    """Generate a regular expression that matches any of the specified words,
+    structured as a trie: words with a common prefix share a single branch, so
+    the regex engine only considers continuations of the text matched so far
+    instead of trying every word in turn. Longer words are matched in
+    preference to words that are a prefix of them (e.g. *janvier* over *jan*).
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        # empty key marks the end of a word
+        node[""] = {}
+
+    def node_regex(node: dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + node_regex(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        word_ends = "" in node
+        if len(branches) == 1 and not word_ends:
+            return branches[0]
+        # when a word ends here, continuations are optional (and greedy)
+        return f"(?:{'|'.join(branches)}){'?' if word_ends else ''}"
+
+    return node_regex(trie)
@@ -6,6 +6,20 @@ from enum import IntEnum
 # Pre 3.10 requires Union for multiple types, e.g. Union[int, None] instead of int | None
 import numpy as np
 
+from undate import profiling
+
+
+def _reduce_scalar(value: np.ndarray) -> tuple | None:
+    # pickle a single Date or Timedelta as its integer value and dtype,
+    # which is smaller and faster than the default for numpy arrays
+    if value.ndim:
+        return None
+    return (_restore_scalar, (value.__class__, str(value.dtype), int(value.view("i8"))))
+
+
+def _restore_scalar(cls: type, dtype: str, value: int) -> np.ndarray:
+    return np.asarray(value, dtype=dtype).view(cls)
+
 
 class Timedelta(np.ndarray):
     """Convenience class to make :class:`numpy.timedelta64` act
@@ -29,6 +43,12 @@ class Timedelta(np.ndarray):
         """number of days, as an integer"""
         return int(self.astype("datetime64[D]").astype("int"))
 
+    def __reduce__(self):
+        return _reduce_scalar(self) or super().__reduce__()
+
+    def __reduce_ex__(self, protocol):
+        return _reduce_scalar(self) or super().__reduce_ex__(protocol)
+
 
 @dataclass
 class UnInt:
@@ -146,6 +166,10 @@ class UnDelta:
         # specifies full UnInt initialization with upper and lower keywords
         return f"undate.{self.__class__.__name__}({self.days.lower},{self.days.upper})"
 
+    def __reduce__(self):
+        # pickle with the bounds only, rather than the UnInt instance
+        return (self.__class__, (self.days.lower, self.days.upper))
+
     def __eq__(self, other: object) -> bool:
         # is an uncertain duration ever *equal* another, even if the values are the same?
         # for now, make the assumption that we only want identity equality
@@ -183,6 +207,7 @@ class Date(np.ndarray):
     # extend np.datetime64 datatype
     # adapted from https://stackoverflow.com/a/27129510/9706217
 
+    @profiling.timed("date")
     def __new__(
         cls,
         year: int | np.datetime64,
@@ -278,6 +303,12 @@ class Date(np.ndarray):
 
     # NOTE: add should not be subclassed because we want to return a Date, not a delta
 
+    def __reduce__(self):
+        return _reduce_scalar(self) or super().__reduce__()
+
+    def __reduce_ex__(self, protocol):
+        return _reduce_scalar(self) or super().__reduce_ex__(protocol)
+
 
 class Weekday(IntEnum):
     """Weekday as an integer, compatible with :meth:`datetime.date.weekday`."""
@@ -291,6 +322,45 @@ class Weekday(IntEnum):
     SUNDAY = 6
 
 
+#: weekday of the numpy datetime epoch, 1970-01-01
+EPOCH_WEEKDAY = Weekday.THURSDAY
+
+#: Julian day number of the numpy datetime epoch, 1970-01-01
+EPOCH_JDN = 2440588
+
+
+def gregorian_days(years, months, days) -> np.ndarray:
+    """Number of days since the epoch (1970-01-01) for Gregorian dates
+    specified as integer arrays or scalars of years, months and days;
+    vectorized equivalent of converting each date to a :class:`Date`.
+    Days are not validated; days past the end of a month continue into
+    the next month."""
+    years = np.asarray(years, dtype=np.int64)
+    month_starts = (years - 1970).astype("datetime64[Y]").astype("datetime64[M]")
+    month_starts = month_starts + (np.asarray(months, dtype=np.int64) - 1)
+    return month_starts.astype("datetime64[D]").astype(np.int64) + (
+        np.asarray(days, dtype=np.int64) - 1
+    )
+
+
+def gregorian_from_days(days) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Gregorian years, months and days for an integer array of days since
+    the epoch (1970-01-01); inverse of :func:`gregorian_days`."""
+    dates = np.asarray(days, dtype=np.int64).astype("datetime64[D]")
+    month_starts = dates.astype("datetime64[M]")
+    year_starts = dates.astype("datetime64[Y]")
+    return (
+        year_starts.astype(np.int64) + 1970,
+        (month_starts - year_starts.astype("datetime64[M]")).astype(np.int64) + 1,
+        (dates - month_starts.astype("datetime64[D]")).astype(np.int64) + 1,
+    )
+
+
+def weekdays(days: np.ndarray) -> np.ndarray:
+    """Weekday (as :class:`Weekday` values) for an array of days since the epoch."""
+    return (np.asarray(days, dtype=np.int64) + EPOCH_WEEKDAY) % 7
+
+
 class DatePrecision(IntEnum):
     """date precision, to indicate date precision independent from how much
     of the date is known."""
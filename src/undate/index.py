@@ -0,0 +1,152 @@
+"""
+Month-day index for finding dates by month and day regardless of year,
+including dates with unknown years (e.g. letters dated only ``--03-12``).
+
+:class:`MonthDayIndex` records the range of possible months and days for
+each date in its original calendar, and finds dates whose range overlaps
+a month-day range in logarithmic time::
+
+    index = MonthDayIndex(dates)
+    index.search(Undate(month=3, day=12))  # positions of dates on 12 March
+    index.search(Undate(month=3, day=5), Undate(month=3, day=19))
+    # ranges that end before they start wrap around the end of the year
+    index.search(Undate(month=12, day=20), Undate(month=1, day=6))
+
+-------------------
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterable
+
+import numpy as np
+
+from undate.date import DatePrecision
+from undate.undate import Calendar, Undate
+
+#: number of day slots per month in month-day keys (``month * 32 + day``);
+#: larger than any month, so that every day has a distinct key
+DAY_SLOTS = 32
+
+
+def month_day_keys(undate: Undate) -> tuple[int, int]:
+    """Smallest and largest possible month-day key (``month * 32 + day``)
+    for a date, in its own calendar. Unknown months and days include
+    every month and day; a partially known month with a known day
+    (e.g. ``1X-05``) includes the days between the first and last
+    possible month."""
+    converter = undate.calendar_converter
+    month = undate.initial_values["month"]
+    if month is None or month == "XX":
+        min_month = converter.min_month()
+        max_month = converter.max_month(converter.LEAP_YEAR)
+    elif isinstance(month, int):
+        min_month = max_month = month
+    else:
+        min_month, max_month = undate._missing_digit_minmax(
+            month, converter.min_month(), converter.max_month(converter.LEAP_YEAR)
+        )
+
+    day = undate.initial_values["day"]
+    if day is None or day == "XX":
+        min_day, max_day = 1, DAY_SLOTS - 1
+    elif isinstance(day, int):
+        min_day = max_day = day
+    else:
+        min_day, max_day = undate._missing_digit_minmax(day, 1, DAY_SLOTS - 1)
+    return (min_month * DAY_SLOTS + min_day, max_month * DAY_SLOTS + max_day)
+
+
+class MonthDayIndex:
+    """Index of dates by month and day, regardless of year. Dates are
+    indexed by the range of their possible month-day keys (see
+    :func:`month_day_keys`), grouped by calendar and by the length of the
+    range, so that each group can be searched with a binary search.
+    Missing values and dates less precise than a month (e.g. ``1801``)
+    are not indexed.
+
+    :param undates: dates to index; search results are positions in
+        this sequence
+    """
+
+    def __init__(self, undates: Iterable[Undate | None]):
+        calendars, starts, ends, positions = [], [], [], []
+        for i, undate in enumerate(undates):
+            if undate is None or undate.precision < DatePrecision.MONTH:
+                continue
+            start, end = month_day_keys(undate)
+            calendars.append(undate.calendar)
+            starts.append(start)
+            ends.append(end)
+            positions.append(i)
+
+        # range length, sorted start keys and positions, by calendar
+        self._groups: dict[Calendar, list[tuple[int, np.ndarray, np.ndarray]]] = {}
+        if not positions:
+            return
+        codes = {calendar: i for i, calendar in enumerate(Calendar)}
+        calendar_codes = np.array([codes[calendar] for calendar in calendars])
+        start_keys = np.array(starts, dtype=np.int64)
+        lengths = np.array(ends, dtype=np.int64) - start_keys + 1
+        position_array = np.array(positions, dtype=np.int64)
+        # sort by calendar, range length, then start
+        order = np.lexsort((start_keys, lengths, calendar_codes))
+        groups = np.column_stack((calendar_codes, lengths))[order]
+        # boundaries where calendar or length changes
+        breaks = np.flatnonzero((groups[1:] != groups[:-1]).any(axis=1)) + 1
+        for group in np.split(order, breaks):
+            self._groups.setdefault(calendars[group[0]], []).append(
+                (int(lengths[group[0]]), start_keys[group], position_array[group])
+            )
+
+    def __len__(self) -> int:
+        return sum(
+            len(positions)
+            for groups in self._groups.values()
+            for _, _, positions in groups
+        )
+
+    def search(
+        self,
+        start: Undate | datetime.date,
+        end: Undate | datetime.date | None = None,
+    ) -> np.ndarray:
+        """Sorted positions of dates whose possible months and days overlap
+        the range from ``start`` to ``end`` (or only ``start``), ignoring
+        years. The range starts with the first possible day of ``start``
+        and ends with the last possible day of ``end``, so
+        ``search(Undate(month=3))`` finds any date in March; if the range
+        ends before it starts, it wraps around the end of the year, as for
+        :meth:`UndateInterval.duration <undate.interval.UndateInterval.duration>`
+        with unknown years. Only dates in the calendar of ``start`` are
+        searched."""
+        start = Undate.to_undate(start)
+        end = start if end is None else Undate.to_undate(end)
+        if start.calendar != end.calendar:
+            raise ValueError("Start and end must be in the same calendar")
+        if start.precision < DatePrecision.MONTH or end.precision < DatePrecision.MONTH:
+            raise ValueError("Month-day search requires dates with a month")
+
+        first, _ = month_day_keys(start)
+        _, last = month_day_keys(end)
+        if last < first:
+            # wrap around the end of the year
+            ranges = [(first, np.iinfo(np.int64).max), (0, last)]
+        else:
+            ranges = [(first, last)]
+
+        results = []
+        for length, starts, positions in self._groups.get(start.calendar, []):
+            for range_start, range_end in ranges:
+                # dates of this length overlap the range if they start
+                # at most length - 1 days before it, and not after it
+                low = np.searchsorted(starts, range_start - length + 1)
+                high = np.searchsorted(starts, range_end, side="right")
+                results.append(positions[low:high])
+        if not results:
+            return np.array([], dtype=np.int64)
+        if len(ranges) > 1:
+            # dates that span the whole year match both parts of a wrapped range
+            return np.unique(np.concatenate(results))
+        return np.sort(np.concatenate(results))
@@ -55,6 +55,13 @@ class UndateInterval:
         self.latest = latest
         self.label = label
 
+    def __getstate__(self) -> tuple:
+        # pickle as a tuple rather than a dictionary of attributes
+        return (self.earliest, self.latest, self.label)
+
+    def __setstate__(self, state: tuple):
+        self.earliest, self.latest, self.label = state
+
     def __str__(self) -> str:
         # using EDTF syntax for open ranges
         return f"{self.earliest or '..'}/{self.latest or ''}"
@@ -62,11 +69,11 @@ class UndateInterval:
     def format(self, format) -> str:
         """format this undate interval as a string using the specified format;
         for now, only supports named converters"""
-        converter_cls = BaseDateConverter.available_converters().get(format, None)
-        if converter_cls:
-            return converter_cls().to_string(self)
-
-        raise ValueError(f"Unsupported format '{format}'")
+        try:
+            converter = BaseDateConverter.get_converter(format)
+        except KeyError:
+            raise ValueError(f"Unsupported format '{format}'") from None
+        return converter.to_string(self)
 
     def __repr__(self) -> str:
         init_opts = {
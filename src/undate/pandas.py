@@ -0,0 +1,269 @@
+"""
+Optional `pandas <https://pandas.pydata.org/>`_ integration.
+
+Importing this module registers an ``undate`` extension dtype
+(:class:`UndateDtype`), backed by :class:`~undate.array.UndateArray`,
+and an ``undate`` accessor on :class:`pandas.Series`
+(:class:`UndateAccessor`) with vectorized methods. Requires pandas,
+which is not installed as a dependency of undate.
+
+Example usage::
+
+    import pandas as pd
+    import undate.pandas  # noqa: F401 (registers dtype and accessor)
+
+    dates = pd.Series([Undate(1801, 3), Undate("19XX"), None], dtype="undate")
+    dates.undate.known_year
+    dates[dates.undate.overlaps(Undate(1801))]
+    dates.undate.format("EDTF")
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    register_series_accessor,
+)
+from pandas.api.indexers import check_array_indexer
+
+from undate.array import UndateArray
+from undate.undate import Undate
+
+# datetime64 values in pandas use at least second resolution;
+# dates outside this range (in days) cannot be represented
+_MAX_SECONDS_DAYS = np.iinfo(np.int64).max // 86400
+
+
+@register_extension_dtype
+class UndateDtype(ExtensionDtype):
+    """pandas extension dtype for :class:`~undate.undate.Undate` values."""
+
+    name = "undate"
+    type = Undate
+    kind = "O"
+    na_value = pd.NA
+
+    @classmethod
+    def construct_array_type(cls):
+        return UndateExtensionArray
+
+
+class UndateExtensionArray(ExtensionArray):
+    """pandas extension array of :class:`~undate.undate.Undate` values,
+    stored as a columnar :class:`~undate.array.UndateArray`."""
+
+    def __init__(self, data: UndateArray):
+        self._data = data
+
+    @property
+    def dtype(self) -> UndateDtype:
+        return UndateDtype()
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        return cls(
+            UndateArray.from_undates(
+                None if pd.api.types.is_scalar(val) and pd.isna(val) else val
+                for val in scalars
+            )
+        )
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        # values are codes of unique values, as returned by
+        # _values_for_factorize, which index the first occurrence
+        # of each unique value; -1 is a missing value
+        values = np.asarray(values, dtype=np.intp)
+        first, _ = original._data._factorize()
+        positions = np.where(values == -1, -1, first[values])
+        return cls(original._data.take(positions, allow_fill=True))
+
+    def _values_for_factorize(self) -> tuple[np.ndarray, int]:
+        _, inverse = self._data._factorize()
+        codes = inverse.astype(np.int64)
+        codes[self._data.isna()] = -1
+        return codes, -1
+
+    def unique(self):
+        # undates are not hashable, so find unique values based on encoded values
+        first, _ = self._data._factorize()
+        return self.take(np.sort(first))
+
+    def duplicated(self, keep="first") -> np.ndarray:
+        codes, _ = self._values_for_factorize()
+        return pd.Series(codes).duplicated(keep=keep).to_numpy()
+
+    def value_counts(self, dropna: bool = True) -> pd.Series:
+        codes, _ = self._values_for_factorize()
+        counts = pd.Series(codes).value_counts(dropna=False)
+        if dropna:
+            counts = counts[counts.index != -1]
+        positions = pd.Series(np.arange(len(codes))).groupby(codes).first()
+        index = pd.Index(self.take(positions[counts.index].to_numpy()))
+        return pd.Series(counts.to_numpy(), index=index, name="count")
+
+    def _values_for_argsort(self) -> np.ndarray:
+        # position in the sort order of UndateArray.argsort, as a single column
+        ranks = np.empty(len(self), dtype=np.int64)
+        ranks[self._data.argsort()] = np.arange(len(self))
+        return ranks
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            value = self._data[item]
+            return self.dtype.na_value if value is None else value
+        item = check_array_indexer(self, item)
+        return self.__class__(self._data[item])
+
+    def __setitem__(self, key, value):
+        if not isinstance(key, (int, np.integer)):
+            key = check_array_indexer(self, key)
+        if isinstance(value, self.__class__):
+            value = value._data
+        elif pd.api.types.is_scalar(value) and pd.isna(value):
+            value = None
+        elif not isinstance(value, Undate):
+            if pd.api.types.is_scalar(value):
+                raise TypeError(
+                    f"Can only set Undate or missing values, got {type(value)}"
+                )
+            value = self._from_sequence(value)._data
+        self._data[key] = value
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other):  # type: ignore[override]
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        return self._data.equals(other)
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def isna(self) -> np.ndarray:
+        return self._data.isna()
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            raise ValueError("Only missing values are supported as fill value")
+        return self.__class__(self._data.take(indices, allow_fill=allow_fill))
+
+    def copy(self):
+        return self.__class__(self._data.copy())
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[UndateExtensionArray]):
+        return cls(UndateArray.concatenate([arr._data for arr in to_concat]))
+
+    def _formatter(self, boxed: bool = False):
+        return str
+
+
+@register_series_accessor("undate")
+class UndateAccessor:
+    """Vectorized methods for a :class:`pandas.Series` with ``undate`` dtype,
+    available as ``series.undate``."""
+
+    def __init__(self, series: pd.Series):
+        if not isinstance(series.dtype, UndateDtype):
+            # pandas expects AttributeError for accessors that don't apply
+            raise AttributeError(  # noqa: TRY004
+                "Can only use .undate accessor with undate dtype"
+            )
+        self._series = series
+        self._data: UndateArray = series.array._data
+
+    def _series_like(self, values, dtype=None) -> pd.Series:
+        return pd.Series(
+            values, index=self._series.index, name=self._series.name, dtype=dtype
+        )
+
+    @staticmethod
+    def _to_seconds(values: np.ndarray) -> np.ndarray:
+        # convert days to second-resolution datetimes, since pandas
+        # does not support day resolution; dates out of range become NaT
+        days = values.view(np.int64)
+        out_of_range = np.abs(days) > _MAX_SECONDS_DAYS
+        return np.where(out_of_range, np.datetime64("NaT", "D"), values).astype(
+            "datetime64[s]"
+        )
+
+    @property
+    def earliest(self) -> pd.Series:
+        """Earliest possible date (Gregorian). Dates that cannot be represented
+        by pandas (such as bounds of dates with an unknown year) are NaT."""
+        return self._series_like(self._to_seconds(self._data.earliest))
+
+    @property
+    def latest(self) -> pd.Series:
+        """Latest possible date (Gregorian). Dates that cannot be represented
+        by pandas (such as bounds of dates with an unknown year) are NaT."""
+        return self._series_like(self._to_seconds(self._data.latest))
+
+    @property
+    def precision(self) -> pd.Series:
+        """Date precision as integer values of :class:`~undate.date.DatePrecision`."""
+        return self._series_like(self._data.precision)
+
+    @property
+    def known_year(self) -> pd.Series:
+        """Whether the year is fully known."""
+        return self._series_like(self._data.known_year)
+
+    def duration(self) -> pd.DataFrame:
+        """Inclusive duration in days, as a data frame with columns
+        ``min_days`` and ``max_days``, which differ when the duration is uncertain."""
+        min_days, max_days = self._data.duration()
+        missing = self._data.isna()
+        return pd.DataFrame(
+            {
+                "min_days": pd.arrays.IntegerArray(min_days, missing),
+                "max_days": pd.arrays.IntegerArray(max_days, missing),
+            },
+            index=self._series.index,
+        )
+
+    def contains(self, other: object) -> pd.Series:
+        """Whether each date contains the specified date;
+        see :meth:`UndateArray.contains <undate.array.UndateArray.contains>`."""
+        return self._series_like(self._data.contains(other))
+
+    def overlaps(self, other: object) -> pd.Series:
+        """Whether each date overlaps the specified date or interval;
+        see :meth:`UndateArray.overlaps <undate.array.UndateArray.overlaps>`."""
+        return self._series_like(self._data.overlaps(other))
+
+    def before(self, other: object) -> pd.Series:
+        """Tri-state comparison ``date < other``;
+        see :meth:`UndateArray.before <undate.array.UndateArray.before>`."""
+        return self._series_like(self._data.before(other))
+
+    def after(self, other: object) -> pd.Series:
+        """Tri-state comparison ``date > other``;
+        see :meth:`UndateArray.after <undate.array.UndateArray.after>`."""
+        return self._series_like(self._data.after(other))
+
+    def equal(self, other: object) -> pd.Series:
+        """Tri-state comparison ``date == other``;
+        see :meth:`UndateArray.equal <undate.array.UndateArray.equal>`."""
+        return self._series_like(self._data.equal(other))
+
+    def includes(self, other: object) -> pd.Series:
+        """Tri-state comparison ``other in date``;
+        see :meth:`UndateArray.includes <undate.array.UndateArray.includes>`."""
+        return self._series_like(self._data.includes(other))
+
+    def format(self, format: str) -> pd.Series:
+        """Format each date as a string using the named converter, e.g. ``"EDTF"``."""
+        return self._series_like(self._data.format(format), dtype=object)
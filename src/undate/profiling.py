@@ -0,0 +1,217 @@
+"""
+Opt-in instrumentation for finding where time is spent when parsing
+and constructing dates.
+
+When profiling is enabled, calls to each stage of the parse and construct
+pipeline are counted and timed, by stage and converter name:
+
+- ``parse``: :meth:`~undate.converters.BaseDateConverter.parse` for each converter
+- ``lark``: parsing a string with a Lark grammar
+- ``transform``: transforming a Lark parse tree into undate objects
+- ``undate``: :class:`~undate.undate.Undate` initialization
+- ``earliest_latest``: :meth:`Undate.calculate_earliest_latest
+  <undate.undate.Undate.calculate_earliest_latest>`, which determines and
+  validates the bounds of a date in its own calendar
+- ``to_gregorian``: calendar conversion, by calendar converter name; happens
+  when :attr:`Undate.earliest <undate.undate.Undate.earliest>` or
+  :attr:`~undate.undate.Undate.latest` is first used
+- ``date``: :class:`~undate.date.Date` construction
+
+Stages other than ``to_gregorian`` are attributed to the converter that is
+parsing, if any. Times are cumulative and include nested stages (e.g.,
+``transform`` includes the ``undate`` objects it creates)::
+
+    from undate import profiling
+
+    with profiling.profile():
+        dates = [Undate.parse(value, "omnibus") for value in values]
+    print(profiling.report())
+    profiling.stats()[("lark", "omnibus")].total
+
+The timing hooks are part of the methods they time and check a
+module-level flag before doing anything else, so they cost a single check
+per call when profiling is disabled. Hooks for converter ``parse`` and
+``to_gregorian`` methods are added when a converter class is defined (see
+:class:`~undate.converters.base.BaseDateConverter`), so converters defined
+outside of undate are profiled too.
+
+-------------------
+"""
+
+import contextlib
+import contextvars
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+
+@dataclass
+class StageStats:
+    """Number of calls and cumulative time for one stage and converter."""
+
+    #: number of calls
+    calls: int = 0
+    #: cumulative time, in seconds
+    total: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean time per call, in seconds."""
+        return self.total / self.calls if self.calls else 0.0
+
+
+#: key used for stages that run outside of any converter
+NO_CONVERTER = "-"
+
+# statistics keyed on (stage, converter name)
+_stats: dict[tuple[str, str], StageStats] = {}
+_stats_lock = threading.Lock()
+# name of the converter currently parsing, for attributing nested stages
+_current_converter: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "current_converter", default=NO_CONVERTER
+)
+#: True while profiling is enabled; checked by every timing hook
+enabled = False
+
+F = TypeVar("F", bound=Callable)
+
+
+def _record(stage: str, name: str, elapsed: float):
+    with _stats_lock:
+        stage_stats = _stats.get((stage, name))
+        if stage_stats is None:
+            stage_stats = _stats[(stage, name)] = StageStats()
+        stage_stats.calls += 1
+        stage_stats.total += elapsed
+
+
+@contextlib.contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block of code as a stage, attributed to the converter
+    currently parsing. Callers should only use this when profiling
+    is :data:`enabled`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, _current_converter.get(), time.perf_counter() - start)
+
+
+def timed(stage: str) -> Callable[[F], F]:
+    """Decorator to time calls to a function as a stage, attributed
+    to the converter currently parsing, when profiling is enabled."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(stage, _current_converter.get(), time.perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def timed_parse(func: F) -> F:
+    """Decorator to time a converter parse method, attributing
+    nested stages to the converter, when profiling is enabled."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        # parse methods that call an inherited parse method are timed once
+        if not enabled or _current_converter.get() == self.name:
+            return func(self, *args, **kwargs)
+        token = _current_converter.set(self.name)
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _record("parse", self.name, time.perf_counter() - start)
+            _current_converter.reset(token)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def timed_conversion(func: F) -> F:
+    """Decorator to time calendar conversion, attributed to the
+    calendar converter, when profiling is enabled."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not enabled:
+            return func(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _record("to_gregorian", self.name, time.perf_counter() - start)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def is_enabled() -> bool:
+    """Check whether profiling is enabled."""
+    return enabled
+
+
+def enable():
+    """Start counting and timing stages; statistics accumulate until
+    :meth:`reset` is called."""
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Stop profiling; collected statistics are kept."""
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Clear collected statistics."""
+    with _stats_lock:
+        _stats.clear()
+
+
+@contextlib.contextmanager
+def profile() -> Iterator[None]:
+    """Context manager to profile a block of code, starting
+    with empty statistics."""
+    reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def stats() -> dict[tuple[str, str], StageStats]:
+    """Statistics collected so far, keyed on stage and converter name."""
+    with _stats_lock:
+        return {
+            key: StageStats(stage_stats.calls, stage_stats.total)
+            for key, stage_stats in _stats.items()
+        }
+
+
+def report() -> str:
+    """Report of collected statistics as a text table, sorted by
+    cumulative time."""
+    rows = sorted(stats().items(), key=lambda item: item[1].total, reverse=True)
+    lines = [
+        f"{'stage':<16} {'converter':<12} {'calls':>9} {'total ms':>10} {'mean µs':>10}"
+    ]
+    lines.extend(
+        f"{stage:<16} {name:<12} {stage_stats.calls:>9} "
+        f"{stage_stats.total * 1000:>10.2f} {stage_stats.mean * 1e6:>10.2f}"
+        for (stage, name), stage_stats in rows
+    )
+    return "\n".join(lines)
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import datetime
 import re
+from collections.abc import Iterable
 from enum import auto
+from functools import cache, cached_property
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from undate.interval import UndateInterval
 
@@ -17,8 +21,18 @@ except ImportError:
 
 # Pre 3.10 requires Union for multiple types, e.g. Union[int, None] instead of int | None
 
+from undate import cache as parse_cache
+from undate import profiling
 from undate.converters.base import BaseCalendarConverter, BaseDateConverter
-from undate.date import ONE_DAY, Date, DatePrecision, Timedelta, UnDelta
+from undate.date import ONE_DAY, Date, DatePrecision, Timedelta, UnDelta, Weekday
+
+#: ordinal of the numpy datetime epoch (1970-01-01), for converting
+#: :meth:`datetime.date.toordinal` to days since the epoch
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+#: numpy datetime units of a day or less
+DAY_OR_FINER_UNITS = {"D", "h", "m", "s", "ms", "us", "ns", "ps", "fs", "as"}
+#: numpy datetime dtype with a unit of days
+DAY_DTYPE = np.dtype("datetime64[D]")
 
 
 class Calendar(StrEnum):
@@ -34,16 +48,64 @@ class Calendar(StrEnum):
         # calendar converter must be available with a name matching
         # the title-case name of the calendar enum entry
         try:
-            converter_cls = BaseDateConverter.available_converters()[
-                calendar.value.title()
-            ]
+            converter = BaseDateConverter.get_converter(calendar.value.title())
         except KeyError as err:
             raise ValueError(f"Unknown calendar '{calendar}'") from err
-        if not issubclass(converter_cls, BaseCalendarConverter):
+        if not isinstance(converter, BaseCalendarConverter):
             raise TypeError(
                 f"Requested converter '{calendar.value.title()}' is not a CalendarConverter"
             )
-        return converter_cls()
+        return converter
+
+
+def day_number(value: object) -> int | None:
+    """Number of days since the epoch (1970-01-01) for a single Gregorian
+    day: a :class:`datetime.date`, :class:`datetime.datetime` (ignoring time
+    of day), :class:`numpy.datetime64` with a unit of a day or smaller, or a
+    day-precision :class:`~undate.date.Date`. Returns None for any other value."""
+    if isinstance(value, datetime.date):
+        return value.toordinal() - EPOCH_ORDINAL
+    if isinstance(value, (np.datetime64, Date)):
+        if np.datetime_data(value.dtype)[0] not in DAY_OR_FINER_UNITS:
+            return None
+        if value.dtype != DAY_DTYPE:
+            value = value.astype(DAY_DTYPE)
+        # converting to a python date is faster than casting to an integer;
+        # dates outside the range of datetime.date are returned as
+        # days since the epoch, and not-a-time as None
+        day = value.item()
+        if isinstance(day, datetime.date):
+            return day.toordinal() - EPOCH_ORDINAL
+        return day
+    return None
+
+
+@cache
+def _unknown_year_bound(calendar: Calendar, parts: tuple[int, int, int]) -> Date:
+    # bounds of dates with unknown years use the same extreme years for every
+    # date in a calendar, so there are only a few distinct values; convert each
+    # once instead of converting extreme years for every date
+    return Date(*Calendar.get_converter(calendar).to_gregorian(*parts))
+
+
+class Relation(StrEnum):
+    """How one date relates to another, as returned by :meth:`Undate.compare`."""
+
+    #: ends before the other date starts
+    BEFORE = auto()
+    #: starts after the other date ends
+    AFTER = auto()
+    #: the same fully known date
+    EQUAL = auto()
+    #: the other date falls within this one (e.g., a day within a year)
+    CONTAINS = auto()
+    #: this date falls within the other one
+    WITHIN = auto()
+    #: dates overlap, but neither contains the other; includes
+    #: partially known dates with the same possible range
+    OVERLAPS = auto()
+    #: can't be determined, because the year of either date is unknown
+    INDETERMINATE = auto()
 
 
 class Undate:
@@ -54,8 +116,6 @@ class Undate:
     #: symbol for unknown digits within a date value
     MISSING_DIGIT: str = "X"
 
-    earliest: Date
-    latest: Date
     #: A string to label a specific undate, e.g. "German Unity Date 2022" for Oct. 3, 2022.
     #: Labels are not taken into account when comparing undate objects.
     label: str | None = None
@@ -73,6 +133,7 @@ class Undate:
     MIN_ALLOWABLE_YEAR = int(-2.5e16) + 1
     MAX_ALLOWABLE_YEAR = int(2.5e16)
 
+    @profiling.timed("undate")
     def __init__(
         self,
         year: int | str | None = None,
@@ -107,13 +168,52 @@ class Undate:
         self.calculate_earliest_latest(year, month, day)
 
         if converter is None:
-            #  import all subclass definitions; initialize the default
-            converter_cls = BaseDateConverter.available_converters()[
-                self.DEFAULT_CONVERTER
-            ]
-            converter = converter_cls()
+            # use a shared instance of the default converter
+            converter = BaseDateConverter.get_converter(self.DEFAULT_CONVERTER)
         self.converter = converter
 
+    def __getstate__(self) -> tuple:
+        # pickle initial values and the bounds in the original calendar,
+        # which are enough to restore this undate without validating it again;
+        # converters are shared, and Gregorian dates are calculated on first use
+        converter: BaseDateConverter | None = self.converter
+        if converter is BaseDateConverter.get_converter(self.DEFAULT_CONVERTER):
+            converter = None
+        precision = getattr(self, "precision", None)
+        return (
+            *self.initial_values.values(),
+            int(precision) if precision is not None else None,
+            self.label,
+            self.calendar.value,
+            self._earliest_parts,
+            self._latest_parts,
+            converter,
+        )
+
+    def __setstate__(self, state: tuple | dict):
+        if isinstance(state, dict):
+            # pickled by an earlier version, with the full instance dictionary;
+            # recalculate bounds in the original calendar, which it did not include
+            self.__dict__.update(state)
+            self.calculate_earliest_latest(**self.initial_values)
+            return
+        (year, month, day, precision, label, calendar, earliest, latest, converter) = (
+            state
+        )
+        self.initial_values = {"year": year, "month": month, "day": day}
+        if precision is not None:
+            self.precision = DatePrecision(precision)
+        self.label = label
+        if calendar != self.calendar:
+            self.calendar = Calendar(calendar)
+        self.calendar_converter = Calendar.get_converter(self.calendar)
+        self._earliest_parts = earliest
+        self._latest_parts = latest
+        self.converter = converter or BaseDateConverter.get_converter(
+            self.DEFAULT_CONVERTER
+        )
+
+    @profiling.timed("earliest_latest")
     def calculate_earliest_latest(self, year, month, day):
         # special case: treat year = XXXX as unknown/none
         if year == "XXXX":
@@ -185,20 +285,116 @@ class Undate:
             if day is not None:
                 min_day, max_day = self._missing_digit_minmax(day, min_day, max_day)
 
-        # TODO: special case, if we get a Feb 29 date with unknown year,
-        # should switch the min/max years to known leap years!
-
         # for unknowns, assume smallest possible value for earliest and
-        # largest valid for latest
-        # convert to Gregorian calendar so earliest/latest can always
-        # be used for comparison
-        self.earliest = Date(
-            *self.calendar_converter.to_gregorian(min_year, earliest_month, min_day)
-        )
-        self.latest = Date(
-            *self.calendar_converter.to_gregorian(max_year, latest_month, max_day)
+        # largest valid for latest; validate now, but wait to convert
+        # to Gregorian until earliest or latest is used
+        if isinstance(year, int):
+            self._validate_parts(year, earliest_month, min_day)
+            self._validate_parts(year, latest_month, max_day)
+        else:
+            # when the year is not known, the month and day only need to exist
+            # in some possible year (e.g. February 29 or Adar II in a leap year);
+            # use the nearest possible years where they do
+            year_pattern = None
+            if year is not None:
+                year_pattern = re.compile(str(year).replace(self.MISSING_DIGIT, "."))
+            min_year = self._bound_year(
+                range(min_year, max_year + 1), year_pattern, earliest_month, min_day
+            )
+            max_year = self._bound_year(
+                range(max_year, min_year - 1, -1), year_pattern, latest_month, max_day
+            )
+        self._earliest_parts = (min_year, earliest_month, min_day)
+        self._latest_parts = (max_year, latest_month, max_day)
+
+    def _is_valid_date(self, year: int, month: int, day: int) -> bool:
+        converter = self.calendar_converter
+        return converter.min_month() <= month <= converter.max_month(
+            year
+        ) and 1 <= day <= converter.max_day(year, month)
+
+    def _validate_parts(self, year: int, month: int, day: int):
+        # ensure month and day are valid for a known year in this calendar,
+        # so that invalid dates are reported on initialization
+        if not (
+            self.calendar_converter.min_month()
+            <= month
+            <= self.calendar_converter.max_month(year)
+        ):
+            raise ValueError(
+                f"Month {month} is out of range for year {year} in {self.calendar.value.title()} calendar"
+            )
+        if not 1 <= day <= self.calendar_converter.max_day(year, month):
+            raise ValueError(
+                f"Day {day} is out of range for {year}-{month:02d} in {self.calendar.value.title()} calendar"
+            )
+
+    def _bound_year(
+        self, years: range, pattern: re.Pattern | None, month: int, day: int
+    ) -> int:
+        # first of the possible years (in the order given) in which the month
+        # and day exist; raises ValueError if they don't exist in any year
+        converter = self.calendar_converter
+        calendar_name = self.calendar.value.title()
+        # check against the whole calendar first, so that searching
+        # a completely unknown year always ends quickly
+        if (
+            not converter.min_month()
+            <= month
+            <= converter.max_month(converter.LEAP_YEAR)
+        ):
+            raise ValueError(
+                f"Month {month} is out of range for {calendar_name} calendar"
+            )
+        if (
+            not 1
+            <= day
+            <= max(
+                converter.max_day(year, month)
+                for year in (converter.LEAP_YEAR, converter.NON_LEAP_YEAR)
+            )
+        ):
+            raise ValueError(
+                f"Day {day} is out of range for month {month} in {calendar_name} calendar"
+            )
+        for year in years:
+            if (
+                # partially known years may have leading zeros, e.g. 00XX
+                pattern is None
+                or pattern.fullmatch(str(year).zfill(len(pattern.pattern)))
+            ) and self._is_valid_date(year, month, day):
+                return year
+        raise ValueError(
+            f"Day {day} is out of range for {self.year}-{month:02d} in {calendar_name} calendar"
         )
 
+    # earliest and latest are calculated on first use and cached,
+    # since converting to Gregorian is relatively expensive and not needed
+    # for all uses (e.g. converting from one format to another)
+
+    @cached_property
+    def earliest(self) -> Date:
+        """Earliest possible date, converted to the Gregorian calendar so
+        that dates in different calendars can be compared."""
+        return self._to_gregorian(self._earliest_parts)
+
+    @cached_property
+    def latest(self) -> Date:
+        """Latest possible date, converted to the Gregorian calendar so
+        that dates in different calendars can be compared."""
+        return self._to_gregorian(self._latest_parts)
+
+    def _to_gregorian(self, parts: tuple[int, int, int]) -> Date:
+        converter = self.calendar_converter
+        if parts[0] in (
+            converter.MIN_YEAR or self.MIN_ALLOWABLE_YEAR,
+            converter.MAX_YEAR or self.MAX_ALLOWABLE_YEAR,
+        ):
+            # year is unknown; use the cached conversion for these parts,
+            # copied since dates are mutable arrays
+            return _unknown_year_bound(self.calendar, parts).copy()
+        return Date(*converter.to_gregorian(*parts))
+
     def set_calendar(self, calendar: str | Calendar):
         """Find calendar by name if passed as string and set on the object.
         Only intended for use at initialization time; use :meth:`as_calendar`
@@ -261,114 +457,151 @@ class Undate:
     @classmethod
     def parse(cls, date_string, format) -> Undate | UndateInterval:
         """parse a string to an undate or undate interval using the specified format;
-        for now, only supports named converters"""
-        converter_cls = BaseDateConverter.available_converters().get(format, None)
-        if converter_cls:
-            # NOTE: some parsers may return intervals; is that ok here?
-            return converter_cls().parse(date_string)
-
-        raise ValueError(f"Unsupported format '{format}'")
+        for now, only supports named converters. Uses the parse cache, if
+        enabled (see :mod:`undate.cache`)."""
+        try:
+            converter = BaseDateConverter.get_converter(format)
+        except KeyError:
+            raise ValueError(f"Unsupported format '{format}'") from None
+        # NOTE: some parsers may return intervals; is that ok here?
+        return parse_cache.parse(converter, date_string)
 
     def format(self, format) -> str:
         """format this undate as a string using the specified format;
         for now, only supports named converters"""
-        converter_cls = BaseDateConverter.available_converters().get(format, None)
-        if converter_cls is not None:
-            # NOTE: some parsers may return intervals; is that ok here?
-            return converter_cls().to_string(self)
-
-        raise ValueError(f"Unsupported format '{format}'")
+        try:
+            converter = BaseDateConverter.get_converter(format)
+        except KeyError:
+            raise ValueError(f"Unsupported format '{format}'") from None
+        return converter.to_string(self)
 
     @classmethod
-    def _comparison_type(cls, other: object) -> Undate:
-        """Common logic for type handling in comparison methods.
-        Converts to Undate object if possible, otherwise raises
-        NotImplementedError exception.  Uses :meth:`to_undate` for conversion.
-        """
-        # convert if possible; return NotImplemented if not
+    def format_many(
+        cls, undates: Iterable[Undate | UndateInterval], format
+    ) -> list[str]:
+        """format a sequence of undates or undate intervals as strings using
+        the specified format. For large collections, formatting an
+        :class:`~undate.array.UndateArray` is faster."""
         try:
-            return cls.to_undate(other)
-        except TypeError:
-            # recommended to support comparison with arbitrary objects
-            return NotImplemented
-
-    def __eq__(self, other: object) -> bool:
-        # Note: assumes label differences don't matter for comparing dates
-
-        # only a day-precision fully known undate can be equal to a datetime.date
-        if isinstance(other, datetime.date):
-            return self.earliest == other and self.latest == other
-
-        other = self._comparison_type(other)
-        if other is NotImplemented:
-            # return NotImplemented to indicate comparison is not supported
-            # with this type
-            return NotImplemented
-
-        # if either date has an unknown year, then not equal
-        if not self.known_year or not other.known_year:
-            return False
+            converter = BaseDateConverter.get_converter(format)
+        except KeyError:
+            raise ValueError(f"Unsupported format '{format}'") from None
+        return [converter.to_string(undate) for undate in undates]
+
+    def compare(self, other: object) -> Relation:
+        """Determine how this date relates to another date (an
+        :class:`Undate` or another type supported by :meth:`to_undate`),
+        in a single pass; rich comparison operators are based on this.
+        Raises :class:`TypeError` if the other date can't be converted."""
+        day = day_number(other)
+        if day is not None:
+            # compare a single day directly, without converting to Undate
+            return self._relation_to_bounds(day, day, DatePrecision.DAY)
+        return self._relation(self.to_undate(other))
+
+    def _relation(self, other: Undate) -> Relation:
+        # if either date has a completely unknown year, then we can't compare
+        if other.unknown_year:
+            return Relation.INDETERMINATE
+        return self._relation_to_bounds(*other._day_bounds, other.precision, other)
 
+    def _relation_to_bounds(
+        self,
+        other_earliest: int,
+        other_latest: int,
+        other_precision: DatePrecision,
+        other: Undate | None = None,
+    ) -> Relation:
+        # relation to a date with the specified bounds (in days since the epoch)
+        # and precision; other is None for a single, fully known day
+        if self.unknown_year:
+            return Relation.INDETERMINATE
+
+        # compare bounds as integer days, since comparing numpy dates is slower
+        earliest, latest = self._day_bounds
+        if latest < other_earliest:
+            return Relation.BEFORE
+        if other_latest < earliest:
+            return Relation.AFTER
+
+        same_bounds = earliest == other_earliest and latest == other_latest
         # if both dates are fully known, then earliest/latest check
         # is sufficient (and will work across calendars!)
+        if (
+            same_bounds
+            and self.precision == other_precision
+            and self._is_exact()
+            and (other is None or other._is_exact())
+        ):
+            return Relation.EQUAL
 
-        # check for apparent equality
-        # - earliest/latest match and both have the same precision
-        looks_equal = (
-            self.earliest == other.earliest
-            and self.latest == other.latest
-            and self.precision == other.precision
-        )
-        # if everything looks the same, check for any unknowns in initial values
-        # the same unknown date should NOT be considered equal
-        # (but do we need a different equivalence check for this?)
+        # is precision sufficient for comparing partially known dates?
+        # checking based on less precise /less granular time unit,
+        # e.g. a day or month could be contained in a year
+        # but not the reverse
+        if (
+            earliest <= other_earliest
+            and latest >= other_latest
+            and self.precision < other_precision
+        ):
+            return Relation.CONTAINS
+        if (
+            other_earliest <= earliest
+            and other_latest >= latest
+            and other_precision < self.precision
+        ):
+            return Relation.WITHIN
+        return Relation.OVERLAPS
 
+    def _is_exact(self) -> bool:
+        # year is fully known and no part of the date is partially known
         # NOTE: assumes that partially known values can only be written
         # in one format (i.e. X for missing digits).
         # If we support other formats, will need to normalize to common
         # internal format for comparison
-        if looks_equal and (
-            # if any part of either date that is known is _partially_ known,
-            # then these dates are not equal
-            any(self.is_partially_known(p) for p in self.initial_values)
-            or any(other.is_partially_known(p) for p in other.initial_values)
-        ):
-            return False
+        # (the same unknown date should NOT be considered equal)
+        return self.known_year and not any(
+            self.is_partially_known(part) for part in self.initial_values
+        )
 
-        return looks_equal
+    @cached_property
+    def _day_bounds(self) -> tuple[int, int]:
+        # earliest and latest dates as integer days since the epoch
+        return (
+            int(self.earliest.astype("datetime64[D]").astype("int64")),
+            int(self.latest.astype("datetime64[D]").astype("int64")),
+        )
+
+    def _check_comparable(self, other: object, relation: Relation):
+        # comparison for dates where one is included within the other
+        # (e.g., single date within the same year) is not currently supported
+        if relation in (Relation.CONTAINS, Relation.WITHIN):
+            # most precise first
+            inner, outer = (
+                (other, self) if relation == Relation.CONTAINS else (self, other)
+            )
+            raise NotImplementedError(
+                f"Can't compare when one date ({inner}) falls within the other ({outer})"
+            )
+
+    def __eq__(self, other: object) -> bool:
+        # Note: assumes label differences don't matter for comparing dates
+        try:
+            return self.compare(other) == Relation.EQUAL
+        except TypeError:
+            # return NotImplemented to indicate comparison is not supported
+            # with this type
+            return NotImplemented
 
     def __lt__(self, other: object) -> bool:
-        other = self._comparison_type(other)
-        if other is NotImplemented:
+        try:
+            relation = self.compare(other)
+        except TypeError:
             # return NotImplemented to indicate comparison is not supported
             # with this type
             return NotImplemented
 
-        # if either date has a completely unknown year, then we can't compare
-        if self.unknown_year or other.unknown_year:
-            return False
-
-        # if this date ends before the other date starts,
-        # return true (this date is earlier, so it is less)
-        if self.latest < other.earliest:
-            return True
-
-        # if the other one ends before this one starts,
-        # return false (this date is later, so it is not less)
-        if other.latest < self.earliest:
-            return False
-
-        # if it does not, check if one is included within the other
-        # (e.g., single date within the same year)
-        # comparison for those cases is not currently supported
-        elif other in self or self in other:
-            # sort by precision, most precise first
-            by_precision = sorted(
-                [self, other], key=lambda x: x.precision, reverse=True
-            )
-            raise NotImplementedError(
-                f"Can't compare when one date ({by_precision[0]}) falls within the other ({by_precision[1]})"
-            )
+        self._check_comparable(other, relation)
         # NOTE: unsupported comparisons are supposed to return NotImplemented
         # However, doing that in this case results in a confusing TypeError!
         #   TypeError: '<' not supported between instances of 'Undate' and 'Undate'
@@ -376,57 +609,60 @@ class Undate:
         # we may need a tribool / ternary type (true, false, unknown),
         # but not sure what python builtin methods will do with it (unknown = false?)
 
-        # for any other case (i.e., self == other), return false
-        return False
+        # unknown years, equal or overlapping dates are not less
+        return relation == Relation.BEFORE
+
+    def sort_key(self) -> tuple[bool, int, int, int]:
+        """Key for sorting undates in a consistent order with :func:`sorted`
+        (e.g. ``sorted(dates, key=Undate.sort_key)``), which works for dates
+        that can't be compared with ``<`` because one falls within the other
+        or the year is unknown. Dates are sorted by earliest date, then by
+        latest date (so a shorter date sorts before a longer one that starts on
+        the same day), then by precision, most precise first. Dates with
+        a completely unknown year sort after all other dates, ordered
+        by the same rules. :meth:`UndateArray.argsort
+        <undate.array.UndateArray.argsort>` sorts in the same order."""
+        year = self.initial_values["year"]
+        unknown_year = year is None or (
+            isinstance(year, str) and not year.replace(self.MISSING_DIGIT, "")
+        )
+        return (unknown_year, *self._day_bounds, -self.precision)
 
     def __gt__(self, other: object) -> bool:
-        # define gt ourselves so we can support > comparison with datetime.date,
-        # but rely on existing less than implementation.
-        # strictly greater than must rule out equals
+        # define gt ourselves so we can support > comparison with datetime.date
+        try:
+            relation = self.compare(other)
+        except TypeError:
+            # return NotImplemented to indicate comparison is not supported
+            # with this type
+            return NotImplemented
 
-        # if either date has a completely unknown year, then we can't compare
+        self._check_comparable(other, relation)
         # NOTE: this means that gt and lt will both be false when comparing
         # with a date with an unknown year...
-        if self.unknown_year or (isinstance(other, Undate) and other.unknown_year):
-            return False
-
-        return not (self < other or self == other)
+        return relation == Relation.AFTER
 
     def __le__(self, other: object) -> bool:
-        # if either date has a completely unknown year, then we can't compare
-        if self.unknown_year or (isinstance(other, Undate) and other.unknown_year):
-            return False
+        try:
+            relation = self.compare(other)
+        except TypeError:
+            # return NotImplemented to indicate comparison is not supported
+            # with this type
+            return NotImplemented
 
-        return self == other or self < other
+        self._check_comparable(other, relation)
+        return relation in (Relation.BEFORE, Relation.EQUAL)
 
     def __contains__(self, other: object) -> bool:
         # if the two dates are strictly equal, don't consider
         # either one as containing the other
-        other = self._comparison_type(other)
-        if other is NotImplemented:
+        try:
+            return self.compare(other) == Relation.CONTAINS
+        except TypeError:
             # return NotImplemented to indicate comparison is not supported
             # with this type
             return NotImplemented
 
-        if self == other:
-            return False
-
-        # if either date has a completely unknown year, then we can't determine
-        if self.unknown_year or other.unknown_year:
-            return False
-
-        return all(
-            [
-                self.earliest <= other.earliest,
-                self.latest >= other.latest,
-                # is precision sufficient for comparing partially known dates?
-                # checking based on less precise /less granular time unit,
-                # e.g. a day or month could be contained in a year
-                # but not the reverse
-                self.precision < other.precision,
-            ]
-        )
-
     @classmethod
     def to_undate(cls, other: object) -> Undate:
         """Convert arbitrary object to Undate, if possible. Raises TypeError
@@ -435,6 +671,7 @@ class Undate:
         Currently supports:
             - :class:`datetime.date` or :class:`datetime.datetime`
             - :class:`undate.date.Date`
+            - :class:`numpy.datetime64` with year, month, day or smaller units
 
         """
         match other:
@@ -445,6 +682,22 @@ class Undate:
             case Date():
                 # handle conversion from internal Date class
                 return Undate(other.year, other.month, other.day)
+            case np.datetime64() if not np.isnat(other):
+                unit = np.datetime_data(other.dtype)[0]
+                year = int(other.astype("datetime64[Y]").astype("int64")) + 1970
+                if unit == "Y":
+                    return Undate(year)
+                month_start = other.astype("datetime64[M]")
+                month = int(month_start.astype("int64")) % 12 + 1
+                if unit == "M":
+                    return Undate(year, month)
+                if unit in DAY_OR_FINER_UNITS:
+                    # ignore time of day
+                    day = int(
+                        (other.astype("datetime64[D]") - month_start).astype("int64")
+                    )
+                    return Undate(year, month, day + 1)
+                raise TypeError(f"Conversion from {other.dtype} is not supported")
 
             case _:
                 raise TypeError(f"Conversion from {type(other)} is not supported")
@@ -481,42 +734,36 @@ class Undate:
     @property
     def year(self) -> str | None:
         "year as string (minimum 4 characters), if year is known"
-        year = self._get_date_part("year")
-        if year:
-            return f"{year:0>4}"
-        # if value is unset but date precision is year or greater, return unknown year
-        elif self.precision >= DatePrecision.YEAR:
-            return self.MISSING_DIGIT * 4
-        return None
+        return self.part_string("year", self.initial_values["year"], self.precision)
 
     @property
     def month(self) -> str | None:
         "month as 2-character string, or None if unknown/unset"
         # TODO: do we allow None for unknown month with day-level granularity?
         # TODO: need to distinguish between unknown (XX) and unset/not part of the date due to granularity
-        month = self._get_date_part("month")
-        if month:
-            return f"{month:0>2}"
-        # if value is unset but date precision is month or greater, return unknown month
-        elif self.precision >= DatePrecision.MONTH:
-            return self.MISSING_DIGIT * 2
-        return None
+        return self.part_string("month", self.initial_values["month"], self.precision)
 
     @property
     def day(self) -> str | None:
         "day as 2-character string or None if unset"
-        day = self._get_date_part("day")
-        if day:
-            return f"{day:0>2}"
-        # if value is unset but date precision is day, return unknown day
-        # (may not be possible to have day precision with day part set in normal use)
-        elif self.precision == DatePrecision.DAY:
-            return self.MISSING_DIGIT * 2
-        return None
+        return self.part_string("day", self.initial_values["day"], self.precision)
 
-    def _get_date_part(self, part: str) -> str | None:
-        value = self.initial_values.get(part)
-        return str(value) if value else None
+    @classmethod
+    def part_string(
+        cls, part: str, value: int | str | None, precision: DatePrecision
+    ) -> str | None:
+        """String for a single part of a date (``year``, ``month``, or ``day``)
+        as used to initialize an undate with the specified precision, as returned
+        by the :attr:`year`, :attr:`month`, and :attr:`day` properties."""
+        # years are padded to 4 characters, months and days to 2
+        width = 4 if part == "year" else 2
+        if value:
+            return f"{value!s:0>{width}}"
+        # if value is unset but date precision includes this part, return unknown digits
+        # (may not be possible to have day precision with day part unset in normal use)
+        elif precision >= DatePrecision[part.upper()]:
+            return cls.MISSING_DIGIT * width
+        return None
 
     @property
     def possible_years(self) -> list[int] | range:
@@ -552,15 +799,53 @@ class Undate:
         # based on the smallest missing digit
         return range(earliest_year, latest_year + 1, step)
 
+    def resolve_weekday(self, weekday: Weekday | int) -> list[Undate]:
+        """Fully known dates that this date could be and that fall on the
+        specified weekday, in order; e.g., for "Tuesday, 12 March 17XX",
+        ``Undate("17XX", 3, 12).resolve_weekday(Weekday.TUESDAY)`` returns
+        12 March of each year from 1700 to 1799 when it was a Tuesday.
+        Months and days may be partially known. Weekdays are calculated
+        for all possible years at once. Raises :class:`ValueError` for dates
+        that are not day-precision or have a completely unknown year."""
+        if self.precision != DatePrecision.DAY:
+            raise ValueError("Weekday can only be resolved for day-precision dates")
+        # raises ValueError if year is completely unknown
+        years = np.asarray(self.possible_years, dtype=np.int64)
+        converter = self.calendar_converter
+        months = self._possible_part_values(
+            "month", converter.min_month(), converter.max_month(converter.LEAP_YEAR)
+        )
+        days = self._possible_part_values("day", 1, 31)
+        candidates: list[tuple[int, int, int]] = []
+        for month in months:
+            for day in days:
+                matches = years[converter.weekdays(years, month, day) == weekday]
+                candidates.extend((int(year), month, day) for year in matches)
+        return [
+            Undate(year, month, day, calendar=self.calendar)
+            for year, month, day in sorted(candidates)
+        ]
+
+    def _possible_part_values(self, part: str, min_val: int, max_val: int) -> list[int]:
+        # all values from min to max that match a known or partially known part
+        value = self.initial_values[part]
+        if isinstance(value, int):
+            return [value]
+        values = range(min_val, max_val + 1)
+        if value is None:
+            return list(values)
+        pattern = re.compile(f"{value:>2}".replace(self.MISSING_DIGIT, "."))
+        return [n for n in values if pattern.fullmatch(f"{n:02}")]
+
     @property
     def representative_years(self) -> list[int]:
         """A list of representative years for this date."""
         try:
             # todo: filter by calendar to minimum needed
             try:
-                return self.calendar_converter.representative_years(
-                    list(self.possible_years)
-                )
+                # pass possible years as a range when the year is partially known,
+                # so converters can cache results by year pattern
+                return self.calendar_converter.representative_years(self.possible_years)
             except NotImplementedError:
                 # if calendar converter does not support representative years, return all years
                 return list(self.possible_years)
@@ -577,7 +862,9 @@ class Undate:
         parts of the date are known. Note that durations are inclusive
         (i.e., a closed interval)  and include both the earliest and latest
         date rather than the difference between them.  Returns a :class:`undate.date.Timedelta` when
-        possible, and an :class:`undate.date.UnDelta` when the duration is uncertain."""
+        possible, and an :class:`undate.date.UnDelta` when the duration is uncertain.
+        To calculate durations for many dates at once, use
+        :meth:`UndateArray.duration <undate.array.UndateArray.duration>`."""
 
         # if precision is a single day, duration is one day
         # no matter when it is or what else is known
@@ -623,8 +910,9 @@ class Undate:
                 )
                 possible_months = range(earliest_month, latest_month + 1)
 
+            representative_years = self.representative_years
             for month in possible_months:
-                for year in self.representative_years:
+                for year in representative_years:
                     possible_max_days.add(self.calendar_converter.max_day(year, month))
 
         # if precision is year but year is unknown, return an uncertain delta
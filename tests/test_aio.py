@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from undate import Undate, UndateInterval, aio
+
+VALUES = ["2001-XX", "1984?", "18 June 1900", "Easter 1612", "1800/1805"]
+
+
+def test_parse_batch():
+    results = aio.parse_batch([("1984", "EDTF"), ("nonsense", "EDTF")])
+    assert results[0] == Undate(1984)
+    assert isinstance(results[1], ValueError)
+
+
+def test_get_converter():
+    assert aio.get_converter("EDTF") is aio.get_converter("EDTF")
+    with pytest.raises(ValueError, match="Unsupported format 'foo'"):
+        aio.get_converter("foo")
+
+
+def test_parse():
+    async def main():
+        return await aio.parse("18 June 1900", "omnibus")
+
+    assert asyncio.run(main()) == Undate(1900, 6, 18)
+
+
+def test_parse_many():
+    async def main():
+        return await aio.parse_many(VALUES, "omnibus")
+
+    expected = [Undate.parse(value, "omnibus") for value in VALUES]
+    results = asyncio.run(main())
+    assert [repr(date) for date in results] == [repr(date) for date in expected]
+    assert isinstance(results[-1], UndateInterval)
+
+
+def test_parse_errors():
+    async def main():
+        parser = aio.AsyncParser()
+        with pytest.raises(ValueError, match="Unsupported format"):
+            await parser.parse("1984", "foo")
+        with pytest.raises(ValueError, match="not in a recognized date format"):
+            await parser.parse("nonsense", "omnibus")
+        return await parser.parse_many(
+            ["1984", "nonsense"], "EDTF", return_exceptions=True
+        )
+
+    date, error = asyncio.run(main())
+    assert date == Undate(1984)
+    assert isinstance(error, ValueError)
+
+
+def test_batching():
+    async def main():
+        parser = aio.AsyncParser(max_batch_size=10, max_batch_delay=0.005)
+        dates = await parser.parse_many(
+            [str(year) for year in range(1900, 1925)], "ISO8601"
+        )
+        return parser, dates
+
+    parser, dates = asyncio.run(main())
+    assert dates == [Undate(year) for year in range(1900, 1925)]
+    # two full batches, and one sent after the delay
+    assert parser.batch_count == 3
+    assert len(parser.latencies) == 25
+
+
+def test_backpressure(monkeypatch):
+    parse_batch = aio.parse_batch
+    lock = threading.Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+
+    def track_parse_batch(requests):
+        # count requests being parsed at the same time
+        with lock:
+            in_flight[0] += len(requests)
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.02)
+        try:
+            return parse_batch(requests)
+        finally:
+            with lock:
+                in_flight[0] -= len(requests)
+
+    monkeypatch.setattr(aio, "parse_batch", track_parse_batch)
+
+    def run(max_pending):
+        max_in_flight[0] = 0
+        years = [str(year) for year in range(1900, 1920)]
+
+        async def main():
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                parser = aio.AsyncParser(
+                    executor,
+                    max_batch_size=3,
+                    max_batch_delay=0.005,
+                    max_pending=max_pending,
+                )
+                return await parser.parse_many(years, "ISO8601")
+
+        assert asyncio.run(main()) == [Undate(int(year)) for year in years]
+        return max_in_flight[0]
+
+    # never more requests in flight than the pending limit
+    assert run(max_pending=4) <= 4
+    # without a low limit, batches are parsed concurrently
+    assert run(max_pending=20) > 4
+
+
+def test_cancelled_request():
+    async def main():
+        parser = aio.AsyncParser(max_batch_delay=0.01)
+        task = asyncio.create_task(parser.parse("1984", "EDTF"))
+        other = asyncio.create_task(parser.parse("1985", "EDTF"))
+        await asyncio.sleep(0)
+        task.cancel()
+        return await other, await asyncio.gather(task, return_exceptions=True)
+
+    date, (cancelled,) = asyncio.run(main())
+    assert date == Undate(1985)
+    assert isinstance(cancelled, asyncio.CancelledError)
+
+
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_executor(executor_cls):
+    async def main(executor):
+        parser = aio.AsyncParser(executor=executor, max_batch_size=2)
+        return await parser.parse_many(VALUES, "omnibus")
+
+    with executor_cls(max_workers=2) as executor:
+        results = asyncio.run(main(executor))
+    # results are the same when parsed in other threads or processes
+    assert [repr(date) for date in results] == [
+        repr(Undate.parse(value, "omnibus")) for value in VALUES
+    ]
+
+
+def test_latency_percentiles():
+    parser = aio.AsyncParser()
+    assert parser.latency_percentiles() == {}
+    parser.latencies.extend([0.1 * i for i in range(1, 11)])
+    percentiles = parser.latency_percentiles([50, 100])
+    assert percentiles[50] == pytest.approx(0.55)
+    assert percentiles[100] == pytest.approx(1.0)
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError, match="at least 1"):
+        aio.AsyncParser(max_batch_size=0)
+
+
+def test_default_parser():
+    async def main():
+        return aio.default_parser(), aio.default_parser()
+
+    first, second = asyncio.run(main())
+    assert first is second
+    # each event loop has its own default parser
+    assert asyncio.run(main())[0] is not first
@@ -0,0 +1,332 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from undate import Calendar, Undate, UndateInterval
+from undate.array import TriState, UndateArray, decode_part, encode_part
+from undate.date import DatePrecision, UnDelta
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, (0, 0, 0, False)),
+        (1801, (1801, 0, 0, True)),
+        ("19XX", (1900, 0b11, 4, False)),
+        ("1X05", (1005, 0b100, 4, False)),
+        ("XXXX", (0, 0b1111, 4, False)),
+        ("X1", (1, 0b10, 2, False)),
+        ("3X", (30, 0b1, 2, False)),
+    ],
+)
+def test_encode_decode_part(value, expected):
+    assert encode_part(value) == expected
+    assert decode_part(*expected) == value
+
+
+class TestUndateArray:
+    undates = [
+        Undate(1801, 3),
+        Undate("19XX"),
+        Undate(month=5, day=1),
+        None,
+        Undate(1801, 3, 12, label="a special day"),
+        Undate(4812, 4, calendar="Hebrew"),
+        Undate(1801, 3),
+    ]
+
+    def test_from_undates(self):
+        dates = UndateArray.from_undates(self.undates)
+        assert len(dates) == len(self.undates)
+        assert dates.values[0].tolist() == [1801, 3, 0]
+        assert dates.known[0].tolist() == [True, True, False]
+        assert dates.masks[1].tolist() == [0b11, 0, 0]
+        assert dates.precision[0] == DatePrecision.MONTH
+        assert dates.calendar[5] == list(Calendar).index(Calendar.HEBREW)
+        assert dates.earliest[0] == np.datetime64("1801-03-01")
+        assert dates.latest[1] == np.datetime64("1999-12-31")
+        assert dates.labels[4] == "a special day"
+        assert dates.isna().tolist() == [False, False, False, True] + [False] * 3
+
+        with pytest.raises(TypeError, match="Expected Undate"):
+            UndateArray.from_undates(["1801"])
+
+    def test_getitem(self):
+        dates = UndateArray.from_undates(self.undates)
+        for i, undate in enumerate(self.undates):
+            if undate is None:
+                assert dates[i] is None
+            else:
+                assert repr(dates[i]) == repr(undate)
+        assert dates.to_undates()[3] is None
+        subset = dates[1:3]
+        assert isinstance(subset, UndateArray)
+        assert len(subset) == 2
+        assert len(dates[dates.known_year]) == 4
+
+    def test_setitem(self):
+        dates = UndateArray.from_undates(self.undates)
+        dates[0] = Undate("18XX", label="century")
+        assert not dates.known_year[0]
+        assert dates.labels[0] == "century"
+        assert dates.earliest[0] == np.datetime64("1800-01-01")
+        dates[1] = None
+        assert dates[1] is None
+        dates[dates.isna()] = Undate(1900, 5, calendar="Hebrew")
+        assert not dates.isna().any()
+        assert dates[3] == Undate(1900, 5, calendar="Hebrew")
+        dates[4:6] = UndateArray.from_undates([Undate(1801), None])
+        assert dates.isna().tolist()[4:6] == [False, True]
+        with pytest.raises(ValueError):
+            dates[0] = [Undate(1801), Undate(1802)]
+
+    def test_take(self):
+        dates = UndateArray.from_undates(self.undates)
+        taken = dates.take([4, -1, 0], allow_fill=True)
+        assert taken.isna().tolist() == [False, True, False]
+        assert taken[2] == Undate(1801, 3)
+        assert dates.take([-1]).labels[0] is None
+        assert UndateArray.missing(2).isna().all()
+        assert dates.take([-1, -1], allow_fill=True).isna().all()
+
+    def test_copy_concatenate(self):
+        dates = UndateArray.from_undates(self.undates)
+        copy = dates.copy()
+        copy.precision[0] = DatePrecision.YEAR
+        assert dates.precision[0] == DatePrecision.MONTH
+        combined = UndateArray.concatenate([dates, copy])
+        assert len(combined) == len(dates) * 2
+        assert combined.nbytes > dates.nbytes
+
+    def test_known_year(self):
+        dates = UndateArray.from_undates(self.undates)
+        assert dates.known_year.tolist() == [
+            True,
+            False,
+            False,
+            False,
+            True,
+            True,
+            True,
+        ]
+        assert dates.unknown_year.tolist() == [False, False, True] + [False] * 4
+        assert dates.fully_known.tolist() == [True, False, False, False] + [True] * 3
+
+    def test_equals(self):
+        dates = UndateArray.from_undates(self.undates)
+        assert dates.equals(Undate(1801, 3)).tolist() == [
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert dates.equals(datetime.date(1801, 3, 12))[4]
+        # unknown and partially known dates are never equal
+        assert not dates.equals(Undate("19XX")).any()
+        assert not dates.equals(Undate(month=5, day=1)).any()
+        with pytest.raises(TypeError):
+            dates.equals(dates)
+
+    def test_contains(self):
+        dates = UndateArray.from_undates(self.undates)
+        day = Undate(1801, 3, 12)
+        expected = [date is not None and day in date for date in self.undates]
+        assert dates.contains(day).tolist() == expected
+        assert dates.contains(datetime.date(1950, 1, 1)).tolist() == [
+            False,
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+        ]
+        assert not dates.contains(Undate(month=3)).any()
+
+    def test_overlaps(self):
+        dates = UndateArray.from_undates(self.undates)
+        assert dates.overlaps(Undate(1801)).tolist() == [
+            True,
+            False,
+            False,
+            False,
+            True,
+            False,
+            True,
+        ]
+        assert dates.overlaps(UndateInterval(Undate(1990))).tolist() == [
+            False,
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+        ]
+        # only the Hebrew date is before 1800
+        assert dates.overlaps(UndateInterval(latest=Undate(1800))).sum() == 1
+        assert not dates.overlaps(Undate(month=5)).any()
+
+    def test_before_after(self):
+        dates = UndateArray.from_undates(self.undates)
+        day = Undate(1801, 3, 12)
+        # overlapping dates and unknown years are possibly before or after;
+        # missing values are false
+        assert dates.before(day).tolist() == [1, 0, 1, 0, 0, 2, 1]
+        assert dates.after(day).tolist() == [1, 2, 1, 0, 0, 0, 1]
+        assert dates.before(datetime.date(1950, 1, 1)).tolist() == [2, 1, 1, 0, 2, 2, 2]
+        assert dates.before(day).dtype == np.int8
+        with pytest.raises(TypeError):
+            dates.before(dates)
+
+    def test_equal(self):
+        dates = UndateArray.from_undates(self.undates)
+        assert dates.equal(Undate(1801, 3)).tolist() == [2, 0, 0, 0, 0, 0, 2]
+        # same precision and overlapping, but partially known or unknown year
+        assert dates.equal(Undate(1950)).tolist() == [0, 1, 0, 0, 0, 0, 0]
+        assert dates.equal(Undate(1801, 3, 12))[2] == TriState.POSSIBLY
+
+    def test_includes(self):
+        dates = UndateArray.from_undates(self.undates)
+        assert dates.includes(Undate(1801, 3, 12)).tolist() == [2, 0, 0, 0, 0, 0, 2]
+        # a partially known year possibly includes a month in that range
+        assert dates.includes(Undate(1950, 5)).tolist() == [0, 1, 0, 0, 0, 0, 0]
+
+    def test_tristate_matches_undate(self):
+        # definite results agree with comparisons of individual dates
+        dates = UndateArray.from_undates(self.undates)
+        for other in [Undate(1801, 3, 12), Undate(1801, 4), Undate(1950)]:
+            before, after = dates.before(other), dates.after(other)
+            equal, includes = dates.equal(other), dates.includes(other)
+            for i, undate in enumerate(self.undates):
+                if undate is None:
+                    continue
+                if before[i] != TriState.POSSIBLY:
+                    assert (undate < other) == (before[i] == TriState.TRUE)
+                if after[i] != TriState.POSSIBLY:
+                    assert (undate > other) == (after[i] == TriState.TRUE)
+                if equal[i] == TriState.TRUE:
+                    assert undate == other
+                if includes[i] == TriState.TRUE:
+                    assert other in undate
+
+    def test_duration(self):
+        dates = UndateArray.from_undates(self.undates)
+        min_days, max_days = dates.duration()
+        assert min_days.tolist() == [31, 365, 1, 0, 1, 29, 31]
+        assert max_days.tolist() == [31, 366, 1, 0, 1, 29, 31]
+
+    def test_duration_matches_undate(self):
+        undates = [
+            Undate(month=2),
+            Undate(month=2, label="same case, different label"),
+            Undate(month="1X"),
+            Undate(month="X2"),
+            Undate("19XX", 2),
+            Undate("190X", 2),
+            Undate(1900, "X2"),
+            Undate(1904, "X2"),
+            Undate("180X"),
+            Undate(month=6, calendar="Hebrew"),
+            Undate("48XX", calendar="Hebrew"),
+            Undate(year="14XX", month=12, calendar="Islamic"),
+            Undate(1801, 3),
+            Undate(month=2, day=28),
+        ]
+        min_days, max_days = UndateArray.from_undates(undates).duration()
+        for undate, lower, upper in zip(undates, min_days, max_days, strict=True):
+            duration = undate.duration()
+            if isinstance(duration, UnDelta):
+                assert (lower, upper) == (duration.days.lower, duration.days.upper)
+            else:
+                assert lower == upper == duration.days
+
+    def test_resolve_weekday(self):
+        dates = UndateArray.from_undates(
+            [
+                Undate("17XX", 3, 12),
+                None,
+                Undate(1801, 3),
+                Undate("17XX", 3, 12, label="same date"),
+                Undate("180X", 3, 12),
+                Undate("180X", 3, 12),
+            ]
+        )
+        positions, candidates = dates.resolve_weekday([1, 1, 1, 1, -1, 3])
+        tuesdays = Undate("17XX", 3, 12).resolve_weekday(1)
+        assert positions.tolist() == [0] * len(tuesdays) + [3] * len(tuesdays) + [
+            5,
+            5,
+        ]
+        assert candidates.to_undates() == tuesdays + tuesdays + [
+            Undate(1801, 3, 12),
+            Undate(1807, 3, 12),
+        ]
+        # no weekdays
+        positions, candidates = dates.resolve_weekday([-1] * len(dates))
+        assert len(positions) == len(candidates) == 0
+        with pytest.raises(ValueError, match="same length"):
+            dates.resolve_weekday([1])
+
+    def test_argsort(self):
+        undates = [
+            Undate(1991, 2),
+            Undate(month=5),
+            None,
+            Undate("19XX"),
+            Undate("XXXX", 4),
+            Undate(1991),
+            Undate(1991, 2, 1),
+            Undate(5779, 13, calendar="Hebrew"),
+            Undate(1991, 2),
+        ]
+        order = UndateArray.from_undates(undates).argsort()
+        # same order as sort key, with missing values last
+        expected = sorted(
+            (i for i, undate in enumerate(undates) if undate is not None),
+            key=lambda i: undates[i].sort_key(),
+        )
+        assert order.tolist() == [*expected, 2]
+        assert order.tolist() == [3, 5, 6, 0, 8, 7, 4, 1, 2]
+        assert len(UndateArray.from_undates([]).argsort()) == 0
+
+    def test_format(self):
+        dates = UndateArray.from_undates(self.undates)
+        assert dates.format("EDTF").tolist() == [
+            "1801-03",
+            "19XX",
+            "XXXX-05-01",
+            None,
+            "1801-03-12",
+            "4812-04",
+            "1801-03",
+        ]
+        assert len(UndateArray.from_undates([]).format("EDTF")) == 0
+
+    @pytest.mark.parametrize("format", ["EDTF", "ISO8601"])
+    def test_format_parts(self, format):
+        # formatting from stored columns matches formatting each undate
+        undates = [
+            Undate(year, month, day)
+            for year in [1801, "18XX", "XXXX", "1X", -5, 33, 12345, None]
+            for month in [None, 3, "1X", "XX"]
+            for day in [None, 5, "XX", "2X"]
+            if (year, month, day) != (None, None, None)
+        ]
+        undates += [
+            Undate(5000, 3, calendar="Hebrew"),
+            Undate("14XX", calendar="Islamic"),
+        ]
+        dates = UndateArray.from_undates([*undates, None])
+        assert dates.format(format).tolist() == [
+            *Undate.format_many(undates, format),
+            None,
+        ]
+
+    def test_format_unsupported(self):
+        with pytest.raises(ValueError, match="Unsupported format"):
+            UndateArray.from_undates(self.undates).format("foobar")
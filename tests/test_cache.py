@@ -0,0 +1,216 @@
+import pytest
+
+from undate import Undate, UndateInterval, cache
+from undate.cache import CacheInfo, DiskParseCache, ParseCache, cache_version
+from undate.converters.base import BaseDateConverter
+from undate.converters.calendars import GregorianDateConverter
+
+
+@pytest.fixture(autouse=True)
+def disable_cache():
+    yield
+    cache.disable()
+
+
+class TestParseCache:
+    def test_parse(self):
+        parse_cache = ParseCache(maxsize=10)
+        converter = BaseDateConverter.get_converter("EDTF")
+        assert parse_cache.parse(converter, "1984-05") == Undate(1984, 5)
+        assert parse_cache.parse(converter, "1984-05") == Undate(1984, 5)
+        assert parse_cache.info() == CacheInfo(hits=1, misses=1, maxsize=10, currsize=1)
+        assert parse_cache.info().hit_rate == 0.5
+        # keyed on converter name as well as value
+        iso_converter = BaseDateConverter.get_converter("ISO8601")
+        parse_cache.parse(iso_converter, "1984-05")
+        assert parse_cache.info().misses == 2
+
+    def test_converter_configuration(self):
+        parse_cache = ParseCache()
+        assert parse_cache.parse(GregorianDateConverter(), "18 avril 2025") == Undate(
+            2025, 4, 18
+        )
+        # keyed on converter configuration as well as name
+        with pytest.raises(ValueError):
+            parse_cache.parse(GregorianDateConverter(languages=["en"]), "18 avril 2025")
+        assert parse_cache.parse(
+            GregorianDateConverter(languages=["fr"]), "18 avril 2025"
+        ) == Undate(2025, 4, 18)
+        assert parse_cache.info().hits == 0
+
+    def test_results_are_copies(self):
+        parse_cache = ParseCache()
+        converter = BaseDateConverter.get_converter("Hebrew")
+        # hebrew converter sets the input as the label
+        first = parse_cache.parse(converter, "26 Tammuz 4816")
+        first.label = "changed"
+        second = parse_cache.parse(converter, "26 Tammuz 4816")
+        assert second.label == "26 Tammuz 4816 Anno Mundi"
+        second.label = "changed again"
+        assert parse_cache.parse(converter, "26 Tammuz 4816").label == (
+            "26 Tammuz 4816 Anno Mundi"
+        )
+
+        converter = BaseDateConverter.get_converter("EDTF")
+        interval = parse_cache.parse(converter, "1900/1910")
+        interval.earliest.label = "changed"
+        cached = parse_cache.parse(converter, "1900/1910")
+        assert isinstance(cached, UndateInterval)
+        assert cached.earliest.label is None
+
+    def test_least_recently_used(self):
+        parse_cache = ParseCache(maxsize=2)
+        converter = BaseDateConverter.get_converter("EDTF")
+        parse_cache.parse(converter, "1901")
+        parse_cache.parse(converter, "1902")
+        parse_cache.parse(converter, "1901")
+        # adding a third value removes the least recently used
+        parse_cache.parse(converter, "1903")
+        assert parse_cache.info().currsize == 2
+        parse_cache.parse(converter, "1901")
+        assert parse_cache.info().hits == 2
+        parse_cache.parse(converter, "1902")
+        assert parse_cache.info().misses == 4
+
+    def test_errors_not_cached(self):
+        parse_cache = ParseCache()
+        converter = BaseDateConverter.get_converter("EDTF")
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_cache.parse(converter, "foo")
+        assert parse_cache.info().misses == 2
+        assert parse_cache.info().currsize == 0
+
+    def test_clear(self):
+        parse_cache = ParseCache()
+        parse_cache.parse(BaseDateConverter.get_converter("EDTF"), "1901")
+        parse_cache.clear()
+        assert parse_cache.info() == CacheInfo(maxsize=parse_cache.maxsize)
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            ParseCache(maxsize=0)
+
+
+def test_enable_disable():
+    assert not cache.is_enabled()
+    assert cache.info().maxsize == 0
+    Undate.parse("1984", "EDTF")
+    assert cache.info().misses == 0
+
+    cache.enable(maxsize=100)
+    assert cache.is_enabled()
+    assert Undate.parse("1984", "EDTF") == Undate(1984)
+    assert Undate.parse("1984", "EDTF") == Undate(1984)
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=100, currsize=1)
+    # enabling again with the same size keeps the cache
+    cache.enable(maxsize=100)
+    assert cache.info().currsize == 1
+    cache.clear()
+    assert cache.info().currsize == 0
+
+    cache.disable()
+    assert not cache.is_enabled()
+    assert cache.info().currsize == 0
+
+
+class TestDiskParseCache:
+    def test_parse_many(self, tmp_path):
+        converter = BaseDateConverter.get_converter("EDTF")
+        with DiskParseCache(tmp_path / "cache.sqlite") as disk_cache:
+            results = disk_cache.parse_many(converter, ["1900", "1901-05", "1900"])
+            assert results == [Undate(1900), Undate(1901, 5), Undate(1900)]
+            # repeated values are parsed once, but return separate objects
+            assert results[0] is not results[2]
+            assert disk_cache.info() == CacheInfo(
+                hits=0, misses=3, maxsize=0, currsize=2
+            )
+            assert disk_cache.parse(converter, "1901-05") == Undate(1901, 5)
+            assert disk_cache.info().hits == 1
+
+        # results persist when the cache is opened again
+        with DiskParseCache(tmp_path / "cache.sqlite") as disk_cache:
+            assert disk_cache.info().currsize == 2
+            assert disk_cache.parse_many(converter, ["1900", "1902"]) == [
+                Undate(1900),
+                Undate(1902),
+            ]
+            assert disk_cache.info().hits == 1
+            # keyed on converter name
+            iso_converter = BaseDateConverter.get_converter("ISO8601")
+            disk_cache.parse(iso_converter, "1900")
+            assert disk_cache.info().misses == 2
+
+    def test_converter_configuration(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        with DiskParseCache(path) as disk_cache:
+            assert disk_cache.parse(
+                GregorianDateConverter(), "18 avril 2025"
+            ) == Undate(2025, 4, 18)
+        # keyed on converter configuration as well as name, across runs
+        with DiskParseCache(path) as disk_cache:
+            with pytest.raises(ValueError):
+                disk_cache.parse(
+                    GregorianDateConverter(languages=["en"]), "18 avril 2025"
+                )
+            assert disk_cache.parse(
+                GregorianDateConverter(languages=["fr"]), "18 avril 2025"
+            ) == Undate(2025, 4, 18)
+            assert disk_cache.info().hits == 0
+            assert disk_cache.info().currsize == 2
+
+    def test_results_are_copies(self, tmp_path):
+        converter = BaseDateConverter.get_converter("Hebrew")
+        with DiskParseCache(tmp_path / "cache.sqlite") as disk_cache:
+            disk_cache.parse(converter, "26 Tammuz 4816").label = "changed"
+            assert disk_cache.parse(converter, "26 Tammuz 4816").label == (
+                "26 Tammuz 4816 Anno Mundi"
+            )
+
+    def test_errors(self, tmp_path):
+        converter = BaseDateConverter.get_converter("EDTF")
+        with DiskParseCache(tmp_path / "cache.sqlite") as disk_cache:
+            with pytest.raises(ValueError):
+                disk_cache.parse_many(converter, ["1900", "foo", "1901"])
+            # results parsed before the error are cached
+            assert disk_cache.info().currsize == 1
+            results = disk_cache.parse_many(
+                converter, ["1900", "foo", "1901"], return_exceptions=True
+            )
+            assert isinstance(results[1], ValueError)
+            assert results[2] == Undate(1901)
+            assert disk_cache.info().currsize == 2
+
+    def test_version(self, tmp_path):
+        converter = BaseDateConverter.get_converter("EDTF")
+        path = tmp_path / "cache.sqlite"
+        with DiskParseCache(path) as disk_cache:
+            assert disk_cache.version == cache_version()
+            disk_cache.parse(converter, "1900")
+        with DiskParseCache(path, version=cache_version()) as disk_cache:
+            assert disk_cache.info().currsize == 1
+        # results for a different version are discarded
+        with DiskParseCache(path, version="other") as disk_cache:
+            assert disk_cache.info().currsize == 0
+        # results stored with converter names as keys are discarded
+        with DiskParseCache(path) as disk_cache:
+            disk_cache.parse(converter, "1900")
+            with disk_cache._db:
+                disk_cache._db.execute(
+                    "UPDATE metadata SET value = ? WHERE key = 'version'",
+                    (cache_version(),),
+                )
+        with DiskParseCache(path) as disk_cache:
+            assert disk_cache.info().currsize == 0
+
+    def test_clear(self, tmp_path):
+        with DiskParseCache(tmp_path / "cache.sqlite") as disk_cache:
+            disk_cache.parse(BaseDateConverter.get_converter("EDTF"), "1900")
+            disk_cache.clear()
+            assert disk_cache.info() == CacheInfo(maxsize=0)
+
+
+def test_cache_version():
+    version = cache_version()
+    assert len(version) == 64
+    assert cache_version() == version
@@ -8,6 +8,7 @@ from undate.converters.calendars import (
     HebrewDateConverter,
     IslamicDateConverter,
 )
+from undate.date import DatePrecision
 
 
 class TestBaseDateConverter:
@@ -35,6 +36,32 @@ class TestBaseDateConverter:
         with pytest.raises(NotImplementedError):
             BaseDateConverter().to_string(1991)
 
+    def test_get_converter(self):
+        from undate.converters.edtf import EDTFDateConverter
+
+        converter = BaseDateConverter.get_converter("EDTF")
+        assert isinstance(converter, EDTFDateConverter)
+        # instance is shared
+        assert BaseDateConverter.get_converter("EDTF") is converter
+        with pytest.raises(KeyError):
+            BaseDateConverter.get_converter("foobar")
+
+    def test_get_converter_new_subclass(self):
+        converter = BaseDateConverter.get_converter("Islamic")
+
+        # defining a new converter clears the cache
+        class NewConverter(BaseDateConverter):
+            name = "New Converter"
+
+        assert isinstance(
+            BaseDateConverter.get_converter("New Converter"), NewConverter
+        )
+        assert BaseDateConverter.get_converter("Islamic") is not converter
+
+    def test_part_to_string_not_implemented(self):
+        with pytest.raises(NotImplementedError):
+            BaseDateConverter().part_to_string("year", 1991, DatePrecision.YEAR)
+
     def test_subclasses(self):
         # define a nested subclass
         class SubSubConverter(IslamicDateConverter):
@@ -94,3 +121,40 @@ class TestBaseCalendarConverter:
             BaseCalendarConverter().to_gregorian(1900, 12, 31)
         with pytest.raises(NotImplementedError):
             BaseCalendarConverter().representative_years([1900, 1901])
+        with pytest.raises(NotImplementedError):
+            BaseCalendarConverter().from_jdn(2415385)
+        with pytest.raises(NotImplementedError):
+            BaseCalendarConverter().from_gregorian(1900, 12, 31)
+
+    def test_jdn_default(self):
+        # calendar that only implements conversion to gregorian
+        class ShiftedCalendar(BaseCalendarConverter):
+            name = "Shifted"
+
+            def min_month(self):
+                return 1
+
+            def max_month(self, year):
+                return 12
+
+            def max_day(self, year, month):
+                return 30
+
+            def to_gregorian(self, year, month, day):
+                return (year + 100, month, 1)
+
+        converter = ShiftedCalendar()
+        gregorian = GregorianDateConverter()
+        assert converter.to_jdn(1800, 12, 15) == gregorian.to_jdn(1900, 12, 1)
+        assert converter.to_jdn_array([1800, 1801], 12, [1, 2]).tolist() == [
+            gregorian.to_jdn(1900, 12, 1),
+            gregorian.to_jdn(1901, 12, 1),
+        ]
+        # array variants call scalar methods for each value
+        assert converter.max_day_array([1800, 1801], 2).tolist() == [30, 30]
+        assert converter.days_in_year_array([1800]).tolist() == [
+            converter.days_in_year(1800)
+        ]
+        # weekdays check each year with max month and day
+        assert converter.weekdays([1800, 1801], 12, 30).tolist() == [5, 6]
+        assert converter.weekdays([1800, 1801], 12, 31).tolist() == [-1, -1]
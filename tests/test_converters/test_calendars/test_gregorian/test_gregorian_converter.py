@@ -1,4 +1,10 @@
+import calendar
+import datetime
+import pickle
+
+import numpy as np
 import pytest
+from convertdate import gregorian
 
 from undate.converters.calendars import GregorianDateConverter
 from undate.date import DatePrecision
@@ -23,6 +29,61 @@ class TestGregorianDateConverter:
         assert converter.max_day(2025, 2) == 28
         assert converter.max_day(converter.LEAP_YEAR, 2) == 29
         assert converter.max_day(2025, 12) == 31
+        # unknown month or year
+        assert converter.max_day(2025, None) == 31
+        assert converter.max_day(None, 2) == 28
+        with pytest.raises(ValueError, match="out of range"):
+            converter.max_day(2025, 13)
+
+    def test_max_day_array(self):
+        converter = GregorianDateConverter()
+        years = np.arange(1600, 2101)
+        for month in range(1, 13):
+            assert converter.max_day_array(years, month).tolist() == [
+                calendar.monthrange(year, month)[1] for year in years
+            ]
+        assert converter.max_day_array([1900, 2000], [2, 12]).tolist() == [28, 31]
+        with pytest.raises(ValueError, match="between 1 and 12"):
+            converter.max_day_array(years, 0)
+
+    def test_leap_years(self):
+        converter = GregorianDateConverter()
+        years = np.arange(1600, 2101)
+        expected = [calendar.isleap(year) for year in years]
+        assert [converter.is_leap_year(year) for year in years] == expected
+        assert converter.is_leap_year_array(years).tolist() == expected
+        assert converter.days_in_year(1900) == 365
+        assert converter.days_in_year(2000) == 366
+        assert converter.days_in_year_array(years).tolist() == [
+            366 if leap else 365 for leap in expected
+        ]
+
+    def test_jdn(self):
+        converter = GregorianDateConverter()
+        assert converter.to_jdn(2000, 1, 1) == 2451545
+        assert converter.from_jdn(2451545) == (2000, 1, 1)
+        assert converter.from_gregorian(2024, 2, 29) == (2024, 2, 29)
+        rng = np.random.default_rng(1234)
+        jdns = rng.integers(1721426, 2816788, 1000)
+        years, months, days = converter.from_jdn_array(jdns)
+        expected = [gregorian.from_jd(jdn - 0.5) for jdn in jdns.tolist()]
+        assert list(zip(years, months, days, strict=True)) == expected
+        assert converter.to_jdn_array(years, months, days).tolist() == jdns.tolist()
+
+    def test_weekdays(self):
+        converter = GregorianDateConverter()
+        years = np.arange(1600, 2101)
+        for month, day in [(2, 29), (3, 12), (12, 31)]:
+            expected = [
+                datetime.date(year, month, day).weekday()
+                if day <= converter.max_day(year, month)
+                else -1
+                for year in years
+            ]
+            assert converter.weekdays(years, month, day).tolist() == expected
+        # invalid months and days
+        assert converter.weekdays(years, 13, 1).tolist() == [-1] * len(years)
+        assert converter.weekdays(years, 4, 31).tolist() == [-1] * len(years)
 
     def test_representative_years(self):
         converter = GregorianDateConverter()
@@ -74,3 +135,30 @@ class TestGregorianDateConverter:
 
         with pytest.raises(ValueError, match="Could not parse"):
             GregorianDateConverter().parse("Foo 1920")
+        # dates that don't exist raise a value error
+        with pytest.raises(ValueError, match="Day 30 is out of range for 1900-02"):
+            GregorianDateConverter().parse("30 February 1900")
+
+    def test_languages(self):
+        converter = GregorianDateConverter(languages=["de", "fr"])
+        assert converter.languages == ("de", "fr")
+        assert converter.parse("18 avril 2025") == Undate(2025, 4, 18)
+        assert converter.parse("3. März 1801") == Undate(1801, 3, 3)
+        # month names in other languages are not recognized
+        with pytest.raises(ValueError, match="Could not parse"):
+            converter.parse("18 June 1900")
+        # parser is cached by languages
+        assert GregorianDateConverter(languages=["de", "fr"]).parser is converter.parser
+        assert GregorianDateConverter().parser is not converter.parser
+        assert GregorianDateConverter().languages is None
+
+        with pytest.raises(ValueError, match="Unsupported language.*: xx"):
+            GregorianDateConverter(languages=["en", "xx"])
+
+    def test_pickle(self):
+        # parser is not stored on the converter, so it can be pickled
+        converter = pickle.loads(pickle.dumps(GregorianDateConverter(languages=["fr"])))
+        assert converter.languages == ("fr",)
+        assert converter.parse("18 avril 2025") == Undate(2025, 4, 18)
+        date = pickle.loads(pickle.dumps(Undate(1900, 6, 18)))
+        assert date == Undate(1900, 6, 18)
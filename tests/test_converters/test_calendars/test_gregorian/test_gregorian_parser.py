@@ -1,7 +1,14 @@
+import re
+
 import pytest
 from lark.exceptions import UnexpectedCharacters, UnexpectedEOF
 
-from undate.converters.calendars.gregorian.parser import gregorian_parser
+from undate.converters.calendars.gregorian.month_names import MONTH_NAMES
+from undate.converters.calendars.gregorian.parser import (
+    gregorian_parser,
+    month_numbers,
+)
+from undate.converters.trie import trie_regex
 
 # test that valid dates can be parsed to confirm parser is working correctly
 
@@ -70,3 +77,25 @@ error_cases = [
 def test_should_error(date_string, exception):
     with pytest.raises(exception):
         gregorian_parser.parse(date_string)
+
+
+def test_trie_regex():
+    words = ["jan", "janvier", "januar", "january", "juin", "mai", "märz"]
+    pattern = trie_regex(words)
+    assert pattern == "(?:j(?:an(?:uar(?:y)?|vier)?|uin)|m(?:ai|ärz))"
+    for word in words:
+        # longest matching word is preferred
+        assert re.match(pattern, word).group() == word
+    assert not re.fullmatch(pattern, "ja")
+    assert not re.fullmatch(pattern, "june")
+    # special characters are escaped
+    assert re.fullmatch(trie_regex(["a.b", "a"]), "a.b")
+    assert not re.fullmatch(trie_regex(["a.b", "a"]), "axb")
+
+
+def test_month_numbers():
+    assert month_numbers(["fr"]) == MONTH_NAMES["fr"]
+    all_months = month_numbers()
+    assert all_months["janvier"] == 1
+    assert all_months["ugushyingo"] == 11
+    assert "janvier" not in month_numbers(["en", "de"])
@@ -1,6 +1,10 @@
+import numpy as np
 import pytest
+from convertdate import hebrew
 
 from undate.converters.calendars import HebrewDateConverter
+from undate.converters.calendars.hebrew import converter as hebrew_converter
+from undate.converters.calendars.hebrew.converter import elapsed_days, year_days
 from undate.converters.calendars.hebrew.transformer import HebrewUndate
 from undate.date import Date, DatePrecision
 from undate.undate import Calendar, Undate
@@ -67,6 +71,12 @@ class TestHebrewDateConverter:
         # empty string should also error
         with pytest.raises(ValueError):
             HebrewDateConverter().parse("")
+        # Adar II only exists in leap years
+        with pytest.raises(ValueError, match="Month 13 is out of range for year 5781"):
+            HebrewDateConverter().parse("Adar II 5781")
+        assert HebrewDateConverter().parse("Adar II 5782") == Undate(
+            5782, 13, calendar="Hebrew"
+        )
 
         # non-string input should raise a type error
         with pytest.raises(TypeError):
@@ -75,6 +85,32 @@ class TestHebrewDateConverter:
         with pytest.raises(TypeError):
             HebrewDateConverter().parse({"foo": "bar"})
 
+    def test_jdn(self):
+        converter = HebrewDateConverter()
+        # 26 Tammuz 4816 is 17 July 1056 Gregorian
+        jdn = converter.to_jdn(4816, 4, 26)
+        assert jdn == int(hebrew.to_jd(4816, 4, 26) + 0.5)
+        assert converter.from_jdn(jdn) == (4816, 4, 26)
+        assert converter.from_gregorian(1056, 7, 17) == (4816, 4, 26)
+        # compare with convertdate for a range of days
+        jdns = np.arange(348000, 2900000, 997)
+        years, months, days = converter.from_jdn_array(jdns)
+        expected = [hebrew.from_jd(jdn - 0.5) for jdn in jdns.tolist()]
+        assert list(zip(years, months, days, strict=True)) == expected
+        assert converter.to_jdn_array(years, months, days).tolist() == jdns.tolist()
+        with pytest.raises(ValueError, match="between 1 and 13"):
+            converter.to_jdn(5780, 14, 1)
+
+    def test_weekdays(self):
+        converter = HebrewDateConverter()
+        years = np.arange(5700, 5800)
+        # julian days start at noon on a Monday
+        expected = [int(hebrew.to_jd(year, 7, 1) + 0.5) % 7 for year in years]
+        assert converter.weekdays(years, 7, 1).tolist() == expected
+        # month 13 only exists in leap years
+        weekdays = converter.weekdays(years, 13, 1)
+        assert ((weekdays == -1) == ~np.array([hebrew.leap(y) for y in years])).all()
+
     def test_partially_known(self):
         # hebrew dates get existing partially unknown behavior
 
@@ -161,6 +197,13 @@ class TestHebrewDateConverter:
         assert converter.days_in_year(4818) == 384
         assert converter.days_in_year(4819) == 355
 
+    def test_year_days(self):
+        years = np.arange(1, 6000)
+        assert year_days(years).tolist() == [hebrew.year_days(y) for y in years]
+        assert elapsed_days(np.array([4816]))[0] == (
+            hebrew.delay_1(4816) + hebrew.delay_2(4816)
+        )
+
     def test_representative_years(self):
         converter = HebrewDateConverter()
         # single year is not filtered
@@ -178,6 +221,33 @@ class TestHebrewDateConverter:
             4837,
         ]
 
+        # ranges are supported (and cached)
+        assert converter.representative_years(range(4810, 4820)) == [
+            4810,
+            4811,
+            4812,
+            4813,
+            4816,
+            4818,
+        ]
+        cache_info = hebrew_converter._range_representative_years.cache_info()
+        assert cache_info.maxsize == hebrew_converter.REPRESENTATIVE_YEARS_CACHE_SIZE
+        converter.representative_years(range(4810, 4820))
+        assert (
+            hebrew_converter._range_representative_years.cache_info().hits
+            == cache_info.hits + 1
+        )
+        # other collections of years are not cached
+        converter.representative_years([4810, 4811])
+        assert (
+            hebrew_converter._range_representative_years.cache_info().currsize
+            == cache_info.currsize
+        )
+        # all six year lengths are found even when they span multiple chunks
+        rep_years = converter.representative_years(range(1000, 1000000))
+        assert len(rep_years) == 6
+        assert rep_years == converter.representative_years(list(range(1000, 3000)))
+
         # if no years are provided, returns a known leap year and non-leap years
         assert converter.representative_years() == [
             converter.LEAP_YEAR,
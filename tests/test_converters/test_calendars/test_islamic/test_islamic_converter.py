@@ -1,5 +1,8 @@
+import numpy as np
 import pytest
+from convertdate import islamic
 
+from undate.converters.base import BaseDateConverter
 from undate.converters.calendars import IslamicDateConverter
 from undate.converters.calendars.islamic.transformer import IslamicUndate
 from undate.date import Date, DatePrecision
@@ -153,6 +156,61 @@ class TestIslamicDateConverter:
         expected_gregorian_years = [33, 1049, 1350, 1479, 1495, 1995]
         assert [d.earliest.year for d in sorted_dates] == expected_gregorian_years
 
+    def test_jdn(self):
+        converter = IslamicDateConverter()
+        assert converter.to_jdn(1, 1, 1) == 1948440
+        assert converter.from_jdn(1948440) == (1, 1, 1)
+        assert converter.from_gregorian(2024, 1, 1) == islamic.from_gregorian(
+            2024, 1, 1
+        )
+        # compare with convertdate for a range of days
+        jdns = np.arange(1948440, 2900000, 331)
+        years, months, days = converter.from_jdn_array(jdns)
+        expected = [islamic.from_jd(jdn - 0.5) for jdn in jdns.tolist()]
+        assert list(zip(years, months, days, strict=True)) == expected
+        assert converter.to_jdn_array(years, months, days).tolist() == jdns.tolist()
+        # convert directly between calendars
+        hebrew_converter = BaseDateConverter.get_converter("Hebrew")
+        jdns = hebrew_converter.to_jdn_array([4816, 5780], [4, 7], [26, 1])
+        years, months, days = converter.from_jdn_array(jdns)
+        assert list(zip(years, months, days, strict=True)) == [
+            islamic.from_gregorian(1056, 7, 17),
+            islamic.from_gregorian(2019, 9, 30),
+        ]
+
+    def test_weekdays(self):
+        converter = IslamicDateConverter()
+        years = np.arange(1400, 1460)
+        expected = [int(islamic.to_jd(year, 12, 30) + 0.5) % 7 for year in years]
+        leap = np.array([islamic.leap(year) for year in years])
+        weekdays = converter.weekdays(years, 12, 30)
+        assert (weekdays[leap] == np.array(expected)[leap]).all()
+        assert (weekdays[~leap] == -1).all()
+
+    def test_max_day(self):
+        converter = IslamicDateConverter()
+        years = np.arange(1, 1500)
+        for month in range(1, 13):
+            expected = [islamic.month_length(year, month) for year in years]
+            assert [converter.max_day(year, month) for year in years] == expected
+            assert converter.max_day_array(years, month).tolist() == expected
+        with pytest.raises(ValueError, match="out of range"):
+            converter.max_day(1458, 13)
+        with pytest.raises(ValueError, match="between 1 and 12"):
+            converter.max_day_array(years, 13)
+
+    def test_leap_years(self):
+        converter = IslamicDateConverter()
+        years = np.arange(1, 1500)
+        expected = [islamic.leap(year) for year in years]
+        assert [converter.is_leap_year(year) for year in years] == expected
+        assert converter.is_leap_year_array(years).tolist() == expected
+        assert converter.days_in_year(converter.LEAP_YEAR) == 355
+        assert converter.days_in_year(converter.NON_LEAP_YEAR) == 354
+        assert converter.days_in_year_array(years).tolist() == [
+            355 if leap else 354 for leap in expected
+        ]
+
     def test_representative_years(self):
         converter = IslamicDateConverter()
         # single year is not filtered
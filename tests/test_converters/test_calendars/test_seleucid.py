@@ -1,4 +1,6 @@
-from undate.converters.calendars import SeleucidDateConverter
+import pytest
+
+from undate.converters.calendars import HebrewDateConverter, SeleucidDateConverter
 from undate.date import Date, DatePrecision
 from undate.undate import Calendar, Undate
 
@@ -59,6 +61,52 @@ class TestSeleucidDateConverter:
         assert converter.days_in_year(2349) == 385
         assert converter.days_in_year(2351) == 355
 
+    def test_leap_years(self):
+        converter = SeleucidDateConverter()
+        # 1451 Seleucid (4900 Anno Mundi) is a leap year; 1452 is not
+        assert converter.max_month(1451) == 13
+        assert converter.max_month(1452) == 12
+        assert converter.max_day(1377, 12) == 30  # Adar I in a leap year
+        assert converter.max_month(converter.LEAP_YEAR) == 13
+        assert converter.max_month(converter.NON_LEAP_YEAR) == 12
+        assert Undate(1451, 13, 1, calendar="Seleucid").earliest == Date(1140, 2, 28)
+        with pytest.raises(ValueError, match="Month 13 is out of range"):
+            Undate(1452, 13, 1, calendar="Seleucid")
+        # month 13 in a partially known year uses the first leap year
+        assert (
+            Undate("145X", 13, calendar="Seleucid").earliest
+            == Undate(1451, 13, calendar="Seleucid").earliest
+        )
+
+    def test_representative_years(self):
+        converter = SeleucidDateConverter()
+        hebrew_converter = HebrewDateConverter()
+        offset = converter.SELEUCID_OFFSET
+        expected = [
+            year - offset
+            for year in hebrew_converter.representative_years(
+                range(1450 + offset, 1460 + offset)
+            )
+        ]
+        assert converter.representative_years(range(1450, 1460)) == expected
+        assert converter.representative_years(list(range(1450, 1460))) == expected
+        assert converter.representative_years() == [
+            converter.LEAP_YEAR,
+            converter.NON_LEAP_YEAR,
+        ]
+
+    def test_jdn(self):
+        converter = SeleucidDateConverter()
+        hebrew_converter = HebrewDateConverter()
+        jdn = converter.to_jdn(1458, 7, 1)
+        assert jdn == hebrew_converter.to_jdn(1458 + converter.SELEUCID_OFFSET, 7, 1)
+        assert converter.from_jdn(jdn) == (1458, 7, 1)
+        assert converter.from_gregorian(1146, 9, 16) == (1458, 7, 1)
+        years, months, days = converter.from_jdn_array([jdn, jdn + 30])
+        assert years.tolist() == [1458, 1458]
+        assert months.tolist() == [7, 8]
+        assert days.tolist() == [1, 1]
+
 
 # TODO: update validation error to say seleucid instead of hebrew
 
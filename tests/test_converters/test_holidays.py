@@ -1,8 +1,21 @@
+import datetime
+
+import numpy as np
 import pytest
+from convertdate import holidays
 from lark import Token, Tree
 
 from undate import Calendar, Undate
-from undate.converters.holidays import HolidayDateConverter, HolidayTransformer
+from undate.converters import holidays as undate_holidays
+from undate.converters.holidays import (
+    HolidayDateConverter,
+    HolidayTransformer,
+    computus,
+    easter_date,
+    easter_dates,
+    holiday_dates,
+    movable_feast_dates,
+)
 from undate.date import Weekday
 
 
@@ -74,11 +87,102 @@ class TestHolidayConverter:
         with pytest.raises(ValueError, match="Could not parse"):
             self.converter.parse("Easter")
 
+    def test_candidate_dates(self):
+        pentecost = self.converter.candidate_dates("Pentecost", range(1500, 1901))
+        assert len(pentecost) == 401
+        assert pentecost[-1] == np.datetime64("1900-06-03")
+        # partially known year
+        ash_wednesday = self.converter.candidate_dates("ash wednesday", "16XX")
+        assert len(ash_wednesday) == 100
+        assert ash_wednesday[0] == np.datetime64("1600-02-16")
+        assert (
+            ash_wednesday.astype("datetime64[Y]").astype(int) + 1970
+        ).tolist() == list(range(1600, 1700))
+        # fixed holidays are supported too
+        assert self.converter.candidate_dates("Epiphany", [1600, 1700]).tolist() == [
+            datetime.date(1600, 1, 6),
+            datetime.date(1700, 1, 6),
+        ]
+        with pytest.raises(ValueError, match="Could not parse"):
+            self.converter.candidate_dates("Easter 1612", [1612])
+        with pytest.raises(ValueError, match="Could not parse"):
+            self.converter.candidate_dates("Not a holiday", [1612])
+
     def test_to_string_error(self):
         with pytest.raises(ValueError, match="does not support"):
             self.converter.to_string(Undate(1916))
 
 
+class TestEasterDates:
+    def test_computus(self):
+        years = np.arange(1, 4000)
+        expected = [datetime.date(*holidays.easter(int(year))) for year in years]
+        assert computus(years).tolist() == expected
+        # integer arithmetic is exact for very large years
+        assert computus(np.array([10**12])).dtype == np.dtype("datetime64[D]")
+        assert computus(np.array([10**12]))[0] == np.datetime64("1000000000000-04-02")
+
+    def test_easter_dates(self, monkeypatch):
+        # start with a small table to test extending it
+        monkeypatch.setattr(
+            undate_holidays, "_easter_table", (1900, computus(np.arange(1900, 1910)))
+        )
+        assert easter_dates([1900])[0] == np.datetime64("1900-04-15")
+        assert easter_dates([1612, 2025]).tolist() == [
+            datetime.date(1612, 4, 22),
+            datetime.date(2025, 4, 20),
+        ]
+        start, table = undate_holidays._easter_table
+        assert start == 1612
+        assert len(table) == 2026 - 1612
+        # years beyond the maximum span are calculated but not stored
+        assert easter_dates([20000])[0] == computus(np.array([20000]))[0]
+        assert undate_holidays._easter_table[0] == 1612
+        assert len(easter_dates([])) == 0
+        assert easter_date(1612) == datetime.date(1612, 4, 22)
+        assert easter_date(1066) == datetime.date(*holidays.easter(1066))
+
+    def test_easter_dates_invalid_years(self):
+        with pytest.raises(ValueError, match="years before 1: 0"):
+            easter_dates([0, 1900])
+        with pytest.raises(ValueError, match="years before 1: -5"):
+            easter_dates(np.array([-5]))
+        with pytest.raises(ValueError, match="years before 1"):
+            movable_feast_dates("PENTECOST", range(-1, 2))
+
+    def test_movable_feast_dates(self):
+        pentecost = movable_feast_dates("PENTECOST", range(2015, 2018))
+        assert pentecost.dtype == np.dtype("datetime64[D]")
+        assert pentecost.tolist() == [
+            datetime.date(2015, 5, 24),
+            datetime.date(2016, 5, 15),
+            datetime.date(2017, 6, 4),
+        ]
+        assert movable_feast_dates("ASH_WEDNESDAY", [2000])[0] == np.datetime64(
+            "2000-03-08"
+        )
+        with pytest.raises(ValueError, match="Unknown movable feast"):
+            movable_feast_dates("EPIPHANY", [2000])
+
+    def test_holiday_dates(self):
+        assert holiday_dates("EASTER", "161X").tolist() == [
+            datetime.date(*holidays.easter(year)) for year in range(1610, 1620)
+        ]
+        # step is based on the last missing digit
+        assert len(holiday_dates("EASTER", "1X00")) == 10
+        assert holiday_dates("ST_PATRICKS", "189X")[-1] == np.datetime64("1899-03-17")
+        with pytest.raises(ValueError, match="completely unknown year"):
+            holiday_dates("EASTER", "XXXX")
+        with pytest.raises(ValueError, match="Unknown holiday"):
+            holiday_dates("CHRISTMAS", [1900])
+        with pytest.raises(ValueError, match="years before 1"):
+            holiday_dates("EASTER", [0])
+        with pytest.raises(ValueError, match="years before 1"):
+            holiday_dates("ST_PATRICKS", "0XX")
+        with pytest.raises(ValueError, match="Could not parse"):
+            Undate.parse("Easter 0", "holidays")
+
+
 # edge cases  - should not happen from parser input but possible
 
 
@@ -0,0 +1,130 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from undate.converters import holidays
+from undate.converters.calendars import (
+    GregorianDateConverter,
+    HebrewDateConverter,
+    IslamicDateConverter,
+)
+from undate.converters.calendars.gregorian import parser as gregorian_parser
+from undate.converters.combined import OmnibusDateConverter
+from undate.converters.edtf import EDTFDateConverter
+from undate.converters.holidays import HolidayDateConverter
+from undate.converters.iso8601 import ISO8601DateFormat
+
+NUM_THREADS = 8
+
+# shared converter instances and values they can parse
+CONVERTER_VALUES = [
+    (
+        OmnibusDateConverter(),
+        [
+            "2001-XX",
+            "1984?",
+            "18 June 1900",
+            "Tammuz 4816",
+            "Jumādā I 1243",
+            "Easter 1612",
+            "1800/1805",
+        ],
+    ),
+    (EDTFDateConverter(), ["2001-XX", "1984?", "1000-03~", "1800/1805", "XXXX-05-03"]),
+    (ISO8601DateFormat(), ["2022-05-01", "1991", "--05-03", "2022-05"]),
+    (GregorianDateConverter(), ["18 June 1900", "mai 1845", "Dezember 12"]),
+    (HebrewDateConverter(), ["26 Tammuz 4816", "Tammuz 4816", "Adar I 5781"]),
+    (IslamicDateConverter(), ["Jumādā I 1243", "Ṣafar 1291", "7 Jumādā I 1243"]),
+    (HolidayDateConverter(), ["Easter 1612", "Pentecost 1400", "Epiphany 1921"]),
+]
+
+
+def parse_results(converter, values):
+    return [(repr(date), date.label) for date in map(converter.parse, values)]
+
+
+def run_threads(func, num_threads=NUM_THREADS):
+    # start all threads at the same time to maximize overlap
+    barrier = threading.Barrier(num_threads)
+
+    def run(thread_index):
+        barrier.wait()
+        return func(thread_index)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        return list(executor.map(run, range(num_threads)))
+
+
+@pytest.mark.parametrize(
+    "converter,values",
+    CONVERTER_VALUES,
+    ids=[type(converter).__name__ for converter, _ in CONVERTER_VALUES],
+)
+def test_shared_converter(converter, values):
+    expected = parse_results(converter, values)
+    # each thread parses the values repeatedly, in a different order
+    repeats = 25
+
+    def parse_values(thread_index):
+        ordered = (
+            values[thread_index % len(values) :] + values[: thread_index % len(values)]
+        )
+        return [parse_results(converter, ordered) for _ in range(repeats)]
+
+    for thread_index, results in enumerate(run_threads(parse_values)):
+        offset = thread_index % len(values)
+        ordered_expected = expected[offset:] + expected[:offset]
+        assert all(result == ordered_expected for result in results)
+
+
+def test_shared_converter_errors():
+    # failed parses in some threads don't affect parsing in others
+    converter = OmnibusDateConverter()
+
+    def parse_or_fail(thread_index):
+        results = []
+        for _ in range(25):
+            if thread_index % 2:
+                with pytest.raises(ValueError):
+                    converter.parse("not a date")
+            else:
+                results.append(repr(converter.parse("18 June 1900")))
+        return results
+
+    for thread_index, results in enumerate(run_threads(parse_or_fail)):
+        if not thread_index % 2:
+            assert set(results) == {
+                "undate.Undate(year=1900, month=6, day=18, calendar='Gregorian')"
+            }
+
+
+def test_easter_table_concurrent_extension(monkeypatch):
+    # start with a small table, so that each thread needs to extend it
+    start = 1700
+    monkeypatch.setattr(
+        holidays,
+        "_easter_table",
+        (start, holidays.computus(holidays.np.arange(start, start + 10))),
+    )
+
+    def easter_dates(thread_index):
+        years = holidays.np.arange(1600 - thread_index * 10, 1800 + thread_index * 10)
+        return years, holidays.easter_dates(years)
+
+    for years, dates in run_threads(easter_dates):
+        assert (dates == holidays.computus(years)).all()
+    table_start, table = holidays._easter_table
+    # table covers all requested years
+    assert table_start == 1600 - (NUM_THREADS - 1) * 10
+    assert table_start + len(table) == 1800 + (NUM_THREADS - 1) * 10
+    assert (table == holidays.computus(holidays.np.arange(table_start, 1870))).all()
+
+
+def test_get_parser_concurrent(monkeypatch):
+    monkeypatch.setattr(gregorian_parser, "_parsers", {})
+    languages = ("fr", "de")
+    parsers = run_threads(lambda _: gregorian_parser.get_parser(languages))
+    # parser is only built once, and shared by all threads
+    assert all(parser is parsers[0] for parser in parsers)
+    assert gregorian_parser._parsers == {languages: parsers[0]}
@@ -1,4 +1,5 @@
 import datetime
+import pickle
 
 import numpy as np
 import pytest
@@ -99,6 +100,19 @@ class TestDate:
         year_prior = Date(2024, 1, 2) - ONE_YEAR
         assert isinstance(year_prior, Date)
 
+    @pytest.mark.parametrize("protocol", [2, pickle.HIGHEST_PROTOCOL])
+    def test_pickle(self, protocol):
+        for date in [Date(2024, 1, 2), Date(1801, 3), Date(-50)]:
+            restored = pickle.loads(pickle.dumps(date, protocol=protocol))
+            assert isinstance(restored, Date)
+            assert restored.dtype == date.dtype
+            assert restored == date
+        # arrays of dates still use numpy pickling
+        dates = np.array(["2024-01-02", "2024-01-03"], dtype="datetime64[D]").view(Date)
+        restored = pickle.loads(pickle.dumps(dates, protocol=protocol))
+        assert isinstance(restored, Date)
+        assert np.array_equal(restored, dates)
+
 
 class TestTimeDelta:
     def test_init_from_int(self):
@@ -116,6 +130,12 @@ class TestTimeDelta:
     def test_days(self):
         assert Timedelta(10).days == 10
 
+    def test_pickle(self):
+        restored = pickle.loads(pickle.dumps(Timedelta(10)))
+        assert isinstance(restored, Timedelta)
+        assert restored.dtype == "timedelta64[D]"
+        assert restored.days == 10
+
 
 class TestUnInt:
     def test_init(self):
@@ -229,6 +249,11 @@ class TestUnDelta:
         with pytest.raises(ValueError, match="Must specify at least two values"):
             UnDelta(10)
 
+    def test_pickle(self):
+        restored = pickle.loads(pickle.dumps(UnDelta(28, 31)))
+        assert isinstance(restored, UnDelta)
+        assert restored.days == UnInt(28, 31)
+
     def test_repr(self):
         # test customized string representation
 
@@ -0,0 +1,90 @@
+import datetime
+
+import pytest
+
+from undate import Undate
+from undate.index import MonthDayIndex, month_day_keys
+
+
+def test_month_day_keys():
+    assert month_day_keys(Undate(month=3, day=12)) == (3 * 32 + 12, 3 * 32 + 12)
+    assert month_day_keys(Undate(1801, 3)) == (3 * 32 + 1, 3 * 32 + 31)
+    assert month_day_keys(Undate(month=3, day="1X")) == (3 * 32 + 10, 3 * 32 + 19)
+    # months 10-12
+    assert month_day_keys(Undate("XXXX", "1X")) == (10 * 32 + 1, 12 * 32 + 31)
+    assert month_day_keys(Undate(1900, "XX", "XX")) == (1 * 32 + 1, 12 * 32 + 31)
+    # hebrew calendar has 13 months
+    assert month_day_keys(Undate(5780, "XX", "XX", calendar="Hebrew"))[1] == (
+        13 * 32 + 31
+    )
+
+
+class TestMonthDayIndex:
+    undates = [
+        Undate(month=3, day=12),
+        Undate(1801, 3, 12),
+        Undate(month=3),
+        Undate(1801),
+        None,
+        Undate(month=12, day=25),
+        Undate(month=1, day=2),
+        Undate(month=3, day=12, calendar="Hebrew"),
+        Undate("XXXX", "1X"),
+        Undate(1900, "XX", "XX"),
+        Undate(month=2, day="1X"),
+    ]
+
+    def test_len(self):
+        # missing values and year-precision dates are not indexed
+        assert len(MonthDayIndex(self.undates)) == 9
+        assert len(MonthDayIndex([])) == 0
+        assert MonthDayIndex([]).search(Undate(month=3)).tolist() == []
+
+    def test_search(self):
+        index = MonthDayIndex(self.undates)
+        # only dates in the same calendar
+        assert index.search(Undate(month=3, day=12)).tolist() == [0, 1, 2, 9]
+        assert index.search(datetime.date(2020, 3, 13)).tolist() == [2, 9]
+        assert index.search(Undate(month=2, day=15)).tolist() == [9, 10]
+        assert index.search(Undate(month=3, day=12, calendar="Hebrew")).tolist() == [7]
+        # month precision includes the whole month
+        assert index.search(Undate(month=2)).tolist() == [9, 10]
+
+    def test_search_range(self):
+        index = MonthDayIndex(self.undates)
+        assert index.search(Undate(month=3, day=13), Undate(month=4)).tolist() == [
+            2,
+            9,
+        ]
+        # wraps around the end of the year
+        assert index.search(
+            Undate(month=12, day=20), Undate(month=1, day=6)
+        ).tolist() == [5, 6, 8, 9]
+
+    def test_search_matches_scan(self):
+        index = MonthDayIndex(self.undates)
+        for start, end in [((1, 1), (3, 11)), ((2, 20), (12, 24)), ((12, 26), (1, 1))]:
+            first = start[0] * 32 + start[1]
+            last = end[0] * 32 + end[1]
+            expected = []
+            for i, undate in enumerate(self.undates):
+                if undate is None or i in (3, 7):
+                    continue
+                low, high = month_day_keys(undate)
+                if first <= last:
+                    match = low <= last and high >= first
+                else:
+                    match = high >= first or low <= last
+                if match:
+                    expected.append(i)
+            results = index.search(
+                Undate(month=start[0], day=start[1]), Undate(month=end[0], day=end[1])
+            )
+            assert results.tolist() == expected
+
+    def test_search_invalid(self):
+        index = MonthDayIndex(self.undates)
+        with pytest.raises(ValueError, match="requires dates with a month"):
+            index.search(Undate(1801))
+        with pytest.raises(ValueError, match="same calendar"):
+            index.search(Undate(month=3), Undate(month=4, calendar="Hebrew"))
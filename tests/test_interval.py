@@ -1,5 +1,6 @@
 import calendar
 import datetime
+import pickle
 
 import pytest
 
@@ -253,3 +254,12 @@ class TestUndateInterval:
         # NOTE: an interval contains itself or an equivalent interval,
         # but that may not make sense for open intervals...
         assert whenever in whenever  # noqa: PLR0124
+
+    def test_pickle(self):
+        interval = UndateInterval(Undate(1900), Undate(1901, 3), label="war")
+        restored = pickle.loads(pickle.dumps(interval))
+        assert restored == interval
+        assert restored.label == "war"
+        open_interval = pickle.loads(pickle.dumps(UndateInterval(latest=Undate(1900))))
+        assert open_interval.earliest is None
+        assert open_interval.latest == Undate(1900)
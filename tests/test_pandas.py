@@ -0,0 +1,174 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from undate import Undate
+from undate.array import TriState
+
+pd = pytest.importorskip("pandas")
+undate_pandas = pytest.importorskip("undate.pandas")
+
+
+@pytest.fixture
+def dates():
+    return pd.Series(
+        [
+            Undate(1801, 3),
+            Undate("19XX"),
+            Undate(month=5),
+            None,
+            Undate(1801, 3, 12),
+            Undate(1700),
+        ],
+        dtype="undate",
+    )
+
+
+class TestUndateExtensionArray:
+    def test_dtype(self, dates):
+        assert isinstance(dates.dtype, undate_pandas.UndateDtype)
+        assert isinstance(dates.array, undate_pandas.UndateExtensionArray)
+        assert dates.isna().tolist() == [False, False, False, True, False, False]
+
+    def test_getitem(self, dates):
+        assert dates.iloc[0] == Undate(1801, 3)
+        assert dates.iloc[3] is pd.NA
+        assert len(dates.iloc[1:3]) == 2
+
+    def test_setitem(self, dates):
+        dates.loc[0] = Undate(1800)
+        dates.iloc[1] = None
+        assert dates.iloc[0] == Undate(1800)
+        assert dates.isna().tolist() == [False, True, False, True, False, False]
+        dates.loc[[1, 3]] = [Undate("18XX"), Undate(1850, 2)]
+        assert dates.iloc[1].year == "18XX"
+        assert dates.undate.earliest.iloc[3] == pd.Timestamp("1850-02-01")
+        dates[dates.undate.known_year] = pd.NA
+        assert dates.notna().tolist() == [False, True, True, False, False, False]
+        with pytest.raises(TypeError, match="Can only set Undate"):
+            dates.array[0] = "1800"
+
+    def test_fillna_where_mask(self, dates):
+        filled = dates.fillna(Undate(1900))
+        assert filled.iloc[3] == Undate(1900)
+        assert filled.undate.earliest.iloc[3] == pd.Timestamp("1900-01-01")
+        # original series is unchanged
+        assert dates.iloc[3] is pd.NA
+        assert dates.where(dates.notna(), Undate(1)).iloc[3] == Undate(1)
+        masked = dates.mask(dates.undate.known_year)
+        assert masked.isna().tolist() == [True, False, False, True, True, True]
+        assert repr(dates.ffill().iloc[3]) == repr(dates.iloc[2])
+
+    def test_eq(self, dates):
+        assert (dates == Undate(1801, 3)).tolist() == [True] + [False] * 5
+
+    def test_sort(self, dates):
+        result = dates.sort_values()
+        # unknown year sorts after known dates; missing value last
+        assert result.index.tolist() == [5, 0, 4, 1, 2, 3]
+
+    def test_groupby(self, dates):
+        frame = pd.DataFrame({"date": pd.concat([dates, dates]), "count": 1})
+        counts = frame.groupby("date")["count"].sum()
+        assert len(counts) == 5
+        assert (counts == 2).all()
+        assert len(dates.unique()) == len(dates)
+        assert len(pd.concat([dates, dates]).drop_duplicates()) == len(dates)
+        counts = pd.concat([dates, dates]).value_counts()
+        assert len(counts) == len(dates) - 1
+        assert (counts == 2).all()
+        assert Undate(1801, 3) in counts.index.tolist()
+        assert len(dates.value_counts(dropna=False)) == len(dates)
+
+    def test_factorize_with_missing(self):
+        dates = pd.Series(
+            [Undate(-50), None, Undate(1999), Undate(-50)], dtype="undate"
+        )
+        codes, uniques = dates.factorize()
+        assert codes.tolist() == [0, -1, 1, 0]
+        assert uniques.tolist() == [Undate(-50), Undate(1999)]
+        codes, uniques = dates.factorize(use_na_sentinel=False)
+        assert codes.tolist() == [0, 1, 2, 0]
+        assert uniques[0] == Undate(-50)
+        assert uniques[1] is pd.NA
+        assert uniques[2] == Undate(1999)
+
+        frame = pd.DataFrame({"date": dates, "count": 1})
+        counts = frame.groupby("date", dropna=False)["count"].sum()
+        assert counts.index[0] == Undate(-50)
+        assert counts.iloc[0] == 2
+        assert counts.index[1] == Undate(1999)
+        assert counts.index[2] is pd.NA
+        assert counts.tolist() == [2, 1, 1]
+
+        counts = dates.value_counts(dropna=False)
+        assert counts.index[0] == Undate(-50)
+        assert counts.iloc[0] == 2
+        assert sorted(counts.tolist()) == [1, 1, 2]
+        assert counts.index.isna().sum() == 1
+
+    def test_take_reindex(self, dates):
+        reindexed = dates.reindex([0, 1, 10])
+        assert reindexed.isna().tolist() == [False, False, True]
+        with pytest.raises(ValueError):
+            dates.array.take([0, -1], allow_fill=True, fill_value=Undate(1900))
+
+
+class TestUndateAccessor:
+    def test_invalid_dtype(self):
+        with pytest.raises(AttributeError):
+            pd.Series([1, 2]).undate  # noqa: B018
+
+    def test_earliest_latest(self, dates):
+        assert dates.undate.earliest.iloc[0] == pd.Timestamp("1801-03-01")
+        assert dates.undate.latest.iloc[1] == pd.Timestamp("1999-12-31")
+        # unknown year bounds cannot be represented in pandas
+        assert pd.isna(dates.undate.earliest.iloc[2])
+        assert pd.isna(dates.undate.latest.iloc[3])
+
+    def test_precision_known_year(self, dates):
+        assert dates.undate.precision.tolist() == [4, 3, 4, 0, 5, 3]
+        assert dates.undate.known_year.tolist() == [
+            True,
+            False,
+            False,
+            False,
+            True,
+            True,
+        ]
+
+    def test_duration(self, dates):
+        duration = dates.undate.duration()
+        assert duration["min_days"].tolist() == [31, 365, 31, pd.NA, 1, 365]
+        assert duration["max_days"].tolist() == [31, 366, 31, pd.NA, 1, 365]
+
+    def test_contains_overlaps(self, dates):
+        assert dates.undate.contains(datetime.date(1801, 3, 12)).tolist() == [
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+        ]
+        assert dates[dates.undate.overlaps(Undate(1801))].index.tolist() == [0, 4]
+
+    def test_tristate(self, dates):
+        before = dates.undate.before(Undate(1850))
+        assert before.dtype == np.int8
+        assert dates[before >= TriState.POSSIBLY].index.tolist() == [0, 2, 4, 5]
+        assert dates.undate.after(Undate(1850)).tolist() == [0, 2, 1, 0, 0, 0]
+        assert dates.undate.equal(Undate(1801, 3)).tolist()[0] == TriState.TRUE
+        assert dates.undate.includes(Undate(1950, 5)).tolist()[1] == TriState.POSSIBLY
+
+    def test_format(self, dates):
+        assert dates.undate.format("EDTF").tolist() == [
+            "1801-03",
+            "19XX",
+            "XXXX-05",
+            None,
+            "1801-03-12",
+            "1700",
+        ]
+        assert dates.undate.format("EDTF").dtype == np.dtype(object)
@@ -0,0 +1,138 @@
+import lark
+import pytest
+
+from undate import Undate, profiling
+from undate.converters.calendars import HebrewDateConverter
+from undate.converters.calendars.hebrew.transformer import HebrewDateTransformer
+from undate.converters.combined import OmnibusDateConverter
+
+
+@pytest.fixture(autouse=True)
+def reset_profiling():
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test_disabled_by_default():
+    assert not profiling.is_enabled()
+    Undate.parse("1984", "EDTF")
+    assert profiling.stats() == {}
+
+
+def test_lark_not_patched():
+    # timing hooks are part of undate methods; third-party
+    # classes are never changed
+    parse = lark.Lark.parse
+    transform = vars(HebrewDateTransformer).get("transform")
+    with profiling.profile():
+        Undate.parse("Tammuz 4816", "Hebrew")
+        assert lark.Lark.parse is parse
+        assert vars(HebrewDateTransformer).get("transform") is transform
+    assert profiling.stats()[("lark", "Hebrew")].calls == 1
+
+
+def test_profile():
+    with profiling.profile():
+        assert profiling.is_enabled()
+        date = Undate.parse("Tammuz 4816", "Hebrew")
+        # earliest and latest are converted to Gregorian on first use
+        assert ("to_gregorian", "Hebrew") not in profiling.stats()
+        _ = date.earliest, date.latest
+    assert not profiling.is_enabled()
+    stats = profiling.stats()
+    assert stats[("parse", "Hebrew")].calls == 1
+    assert stats[("lark", "Hebrew")].calls == 1
+    assert stats[("transform", "Hebrew")].calls == 1
+    assert stats[("undate", "Hebrew")].calls == 1
+    assert stats[("earliest_latest", "Hebrew")].calls == 1
+    # conversion is attributed to the calendar, not the converter that parsed
+    assert stats[("to_gregorian", "Hebrew")].calls == 2
+    assert stats[("date", profiling.NO_CONVERTER)].calls == 2
+    # nested stages take no longer than the parse that includes them
+    assert stats[("lark", "Hebrew")].total <= stats[("parse", "Hebrew")].total
+    assert stats[("parse", "Hebrew")].mean == stats[("parse", "Hebrew")].total
+
+
+def test_converter_names():
+    with profiling.profile():
+        date = OmnibusDateConverter().parse("Jumādā I 1243")
+        _ = date.earliest, date.latest
+        Undate(1900, 1, 1)
+    stats = profiling.stats()
+    # parsing stages are attributed to the omnibus converter,
+    # calendar conversion to the calendar
+    assert stats[("parse", "omnibus")].calls == 1
+    assert stats[("undate", "omnibus")].calls == 1
+    assert ("parse", "Islamic") not in stats
+    assert stats[("to_gregorian", "Islamic")].calls == 2
+    # lark transformers used when loading grammars are not included
+    assert ("transform", profiling.NO_CONVERTER) not in stats
+    # undates created outside of parsing
+    assert stats[("undate", profiling.NO_CONVERTER)].calls == 1
+
+
+def test_inherited_parse():
+    # Seleucid inherits its parse method from Hebrew
+    with profiling.profile():
+        Undate.parse("Tishri 1500", "Seleucid")
+    stats = profiling.stats()
+    assert stats[("parse", "Seleucid")].calls == 1
+    assert ("parse", "Hebrew") not in stats
+
+
+def test_new_converter():
+    # converters defined outside of undate are profiled too
+    class UpperCaseConverter(HebrewDateConverter):
+        name = "UpperCase"
+
+        def parse(self, value: str):
+            return super().parse(value.title())
+
+    with profiling.profile():
+        UpperCaseConverter().parse("TAMMUZ 4816")
+    stats = profiling.stats()
+    # calling the inherited parse method is not counted separately
+    assert stats[("parse", "UpperCase")].calls == 1
+    assert stats[("lark", "UpperCase")].calls == 1
+
+
+def test_enable_disable_reset():
+    profiling.enable()
+    profiling.enable()
+    Undate(1900)
+    profiling.disable()
+    Undate(1900)
+    assert profiling.stats()[("undate", profiling.NO_CONVERTER)].calls == 1
+    HebrewDateConverter().parse("Tammuz 4816")
+    assert ("parse", "Hebrew") not in profiling.stats()
+    # statistics accumulate until reset
+    profiling.enable()
+    Undate(1900)
+    profiling.disable()
+    assert profiling.stats()[("undate", profiling.NO_CONVERTER)].calls == 2
+    profiling.reset()
+    assert profiling.stats() == {}
+
+
+def test_errors_are_recorded():
+    with profiling.profile(), pytest.raises(ValueError):
+        Undate.parse("not a date", "EDTF")
+    assert profiling.stats()[("parse", "EDTF")].calls == 1
+
+
+def test_report():
+    assert profiling.report().split() == [
+        "stage",
+        "converter",
+        "calls",
+        "total",
+        "ms",
+        "mean",
+        "µs",
+    ]
+    with profiling.profile():
+        Undate.parse("1984", "EDTF")
+    lines = profiling.report().splitlines()
+    assert lines[1].split()[:3] == ["parse", "EDTF", "1"]
+    assert len(lines) == len(profiling.stats()) + 1
@@ -1,13 +1,18 @@
 import datetime
+import pickle
 from enum import auto
 from unittest import mock
 
+import numpy as np
 import pytest
 
-from undate import Calendar, Undate, UndateInterval
+from undate import Calendar, Relation, Undate, UndateInterval
 from undate.converters.base import BaseCalendarConverter, BaseDateConverter
-from undate.date import Date, DatePrecision, Timedelta, UnDelta, UnInt
-from undate.undate import StrEnum  # import whichever version is used there
+from undate.date import Date, DatePrecision, Timedelta, UnDelta, UnInt, Weekday
+from undate.undate import (
+    StrEnum,  # import whichever version is used there
+    day_number,
+)
 
 
 class TestUndate:
@@ -178,6 +183,121 @@ class TestUndate:
         # invalid month should raise an error
         with pytest.raises(ValueError):
             Undate(1990, 22)
+        # invalid dates raise an error on initialization, even though
+        # earliest and latest are not calculated until used
+        with pytest.raises(ValueError, match="Month 0 is out of range"):
+            Undate(1990, 0)
+        with pytest.raises(ValueError, match="Day 30 is out of range for 1990-02"):
+            Undate(1990, 2, 30)
+        with pytest.raises(ValueError, match="Day 29 is out of range for 1900-02"):
+            Undate(1900, 2, 29)
+        # for years that are not known, the day must exist in some possible year
+        with pytest.raises(ValueError, match="Day 29 is out of range for 19X1-02"):
+            Undate("19X1", 2, 29)
+        with pytest.raises(ValueError, match="Day 30 is out of range for month 2"):
+            Undate(month=2, day=30)
+        with pytest.raises(ValueError, match="Month 13 is out of range"):
+            Undate("19XX", 13)
+        # validated for the calendar of the date
+        with pytest.raises(ValueError, match="Month 13 .* 5780 in Hebrew calendar"):
+            Undate(5780, 13, calendar="Hebrew")
+        assert Undate(5779, 13, calendar="Hebrew")
+        with pytest.raises(ValueError, match="Day 31 .* in Islamic calendar"):
+            Undate(1400, 12, 31, calendar="Islamic")
+
+    def test_unknown_year_bounds(self):
+        # bounds use the nearest possible years in which the month and day exist
+        date = Undate("19XX", 2, 29)
+        assert date.earliest == Date(1904, 2, 29)
+        assert date.latest == Date(1996, 2, 29)
+        assert Undate("1X00", 2, 29).earliest == Date(1200, 2, 29)
+        # years with leading zeros
+        assert Undate("0XX").latest == Date(99, 12, 31)
+        assert Undate("01XX", 2, 29).earliest == Date(104, 2, 29)
+        # Adar II (13) and 30 Dhū al-Ḥijjah only exist in leap years
+        for kwargs in [
+            {"month": 13, "calendar": "Hebrew"},
+            {"year": "57XX", "month": 13, "calendar": "Hebrew"},
+            {"year": "XXXX", "month": 13, "day": 1, "calendar": "Hebrew"},
+            {"year": None, "month": 12, "day": 30, "calendar": "Islamic"},
+            {"year": "14XX", "month": 12, "day": 30, "calendar": "Islamic"},
+        ]:
+            date = Undate(**kwargs)
+            assert date.earliest < date.latest
+        date = Undate("57XX", 13, calendar="Hebrew")
+        assert date.earliest == Undate(5700, 13, calendar="Hebrew").earliest
+        assert date.latest == Undate(5798, 13, calendar="Hebrew").latest
+
+    def test_earliest_latest_lazy(self):
+        date = Undate(4816, 4, calendar="Hebrew")
+        # not converted to Gregorian until used
+        assert "earliest" not in vars(date)
+        assert "latest" not in vars(date)
+        assert date.earliest == Date(1056, 6, 22)
+        assert date.latest == Date(1056, 7, 20)
+        # cached after first use
+        assert vars(date)["earliest"] is date.earliest
+        # formatting does not require earliest or latest
+        date = Undate.parse("1984-05", "EDTF")
+        assert date.format("EDTF") == "1984-05"
+        assert "earliest" not in vars(date)
+
+    def test_earliest_latest_unknown_year(self):
+        # bounds of dates with unknown years are in the calendar's extreme years
+        may = Undate(month=5, day=12)
+        assert may.earliest == Date(Undate.MIN_ALLOWABLE_YEAR, 5, 12)
+        assert may.latest == Date(Undate.MAX_ALLOWABLE_YEAR, 5, 12)
+        hebrew = Undate(month=5, day=12, calendar="Hebrew")
+        assert hebrew.earliest == Date(-3759, 7, 11)
+        # conversions are shared, but each date has its own copy
+        other = Undate(month=5, day=12, calendar="Hebrew")
+        assert other.earliest == hebrew.earliest
+        assert other.earliest is not hebrew.earliest
+
+    @pytest.mark.parametrize("protocol", [2, pickle.HIGHEST_PROTOCOL])
+    def test_pickle(self, protocol):
+        date = Undate("18XX", 3, label="spring", calendar="Hebrew")
+        _ = date.earliest
+        restored = pickle.loads(pickle.dumps(date, protocol=protocol))
+        assert repr(restored) == repr(date)
+        assert restored.precision == date.precision
+        assert restored.calendar_converter is date.calendar_converter
+        assert restored.converter is date.converter
+        # calculated dates are not pickled
+        assert "earliest" not in vars(restored)
+        assert (restored.earliest, restored.latest) == (date.earliest, date.latest)
+        # pickles only the initial values, not converters or dates
+        assert len(pickle.dumps(date, protocol=protocol)) < 200
+
+        restored = pickle.loads(pickle.dumps(Undate(2001, 3, 5)))
+        assert restored == Undate(2001, 3, 5)
+        assert "calendar" not in vars(restored)
+
+    def test_unpickle_dict_state(self):
+        # earlier versions pickled the full instance dictionary
+        date = Undate(1140, 2, label="adar", calendar="Hebrew")
+        state = {
+            "initial_values": date.initial_values,
+            "precision": date.precision,
+            "label": date.label,
+            "calendar": date.calendar,
+            "calendar_converter": date.calendar_converter,
+            "earliest": date.earliest,
+            "latest": date.latest,
+            "converter": date.converter,
+        }
+        restored = Undate.__new__(Undate)
+        restored.__setstate__(state)
+        assert restored == date
+        assert repr(restored) == repr(date)
+        # and can be pickled again with the current format
+        assert pickle.loads(pickle.dumps(restored)) == date
+
+    def test_pickle_converter(self):
+        # converters other than the default are pickled
+        converter = BaseDateConverter.get_converter("EDTF")
+        restored = pickle.loads(pickle.dumps(Undate(1984, converter=converter)))
+        assert isinstance(restored.converter, type(converter))
 
     def test_to_undate(self):
         undate_from_date = Undate.to_undate(datetime.date(2001, 3, 5))
@@ -197,9 +317,19 @@ class TestUndate:
         assert y2k_to_undate.month is None
         assert y2k_to_undate.day is None
 
+        # from numpy datetime64, keeping year or month precision
+        assert Undate.to_undate(np.datetime64("2001-03-05")) == Undate(2001, 3, 5)
+        assert Undate.to_undate(np.datetime64("2001-03-05T12:30")) == Undate(2001, 3, 5)
+        assert (
+            Undate.to_undate(np.datetime64("2001-03")).precision == DatePrecision.MONTH
+        )
+        assert Undate.to_undate(np.datetime64("1801")).year == "1801"
+
         # unsupported type
         with pytest.raises(TypeError):
             Undate.to_undate("foo")
+        with pytest.raises(TypeError):
+            Undate.to_undate(np.datetime64("NaT", "D"))
 
     # test properties for accessing parts of date
     def test_year_property(self):
@@ -274,6 +404,40 @@ class TestUndate:
         assert Undate(2022) != datetime.date(2022, 10, 1)
         assert Undate(2022, 10) != datetime.date(2022, 10, 1)
 
+    @pytest.mark.parametrize(
+        "day",
+        [
+            datetime.date(2022, 10, 1),
+            datetime.datetime(2022, 10, 1, 15, 30),
+            np.datetime64("2022-10-01"),
+            np.datetime64("2022-10-01T15:30:00"),
+            Date(2022, 10, 1),
+        ],
+    )
+    def test_compare_single_day(self, day):
+        assert Undate(2022, 10, 1) == day
+        assert Undate(2022, 10, 1) <= day
+        assert Undate(2022, 9, 30) < day
+        assert Undate(2022, 10, 2) > day
+        assert Undate(2022, 10, 1).compare(day) == Relation.EQUAL
+        assert Undate(2022, 10).compare(day) == Relation.CONTAINS
+        assert day in Undate(2022)
+        # other date precisions and partially known dates are not equal
+        assert Undate(2022, 10) != day
+        assert Undate(2022, 10, "XX") != day
+        assert Undate(month=10, day=1).compare(day) == Relation.INDETERMINATE
+
+    def test_day_number(self):
+        assert day_number(datetime.date(1970, 1, 2)) == 1
+        assert day_number(datetime.datetime(1969, 12, 31, 23)) == -1
+        assert day_number(np.datetime64("1970-01-11T10:00")) == 10
+        assert day_number(Date(1970, 2, 1)) == 31
+        # not a single day
+        assert day_number(Date(1970)) is None
+        assert day_number(np.datetime64("1970-02")) is None
+        assert day_number(np.datetime64("NaT", "D")) is None
+        assert day_number(Undate(1970, 1, 1)) is None
+
     def test_not_eq(self):
         assert Undate(2022) != Undate(2023)
         assert Undate(2022, 10) != Undate(2022, 11)
@@ -368,6 +532,37 @@ class TestUndate:
         ):
             assert Undate(2022, 5) < Undate(2022)
 
+    testdata_compare = [
+        (Undate(1980), Undate(2020), Relation.BEFORE),
+        (Undate(2020, 6), Undate(1980), Relation.AFTER),
+        (Undate(2022, 5, 1), Undate(2022, 5, 1), Relation.EQUAL),
+        (Undate(2022), Undate(2022, 5), Relation.CONTAINS),
+        (Undate(2022, 5, 1), Undate(2022, 5), Relation.WITHIN),
+        # same precision, overlapping ranges
+        (Undate("199X"), Undate("19XX"), Relation.OVERLAPS),
+        # the same partially known date is not equal
+        (Undate(1980, "XX"), Undate(1980, "XX"), Relation.OVERLAPS),
+        (Undate(month=6), Undate(2022), Relation.INDETERMINATE),
+        (Undate(1950), Undate(day=31), Relation.INDETERMINATE),
+        # other supported types
+        (Undate(2022), datetime.date(2022, 6, 1), Relation.CONTAINS),
+        (Undate(2022, 6, 1), datetime.date(2022, 6, 1), Relation.EQUAL),
+    ]
+
+    @pytest.mark.parametrize("date1,date2,relation", testdata_compare)
+    def test_compare(self, date1, date2, relation):
+        assert date1.compare(date2) == relation
+
+    def test_compare_unsupported(self):
+        with pytest.raises(TypeError):
+            Undate(2022).compare("foo")
+
+    def test_gt_overlapping(self):
+        # overlapping dates are neither less nor greater
+        assert not Undate("199X") > Undate("19XX")
+        assert not Undate("199X") < Undate("19XX")
+        assert not Undate("19XX") > Undate("199X")
+
     testdata_contains = [
         # first date falls within the range of the other
         # dates within range: middle, start, end, varying precision
@@ -446,6 +641,28 @@ class TestUndate:
         # someyear = Undate("1XXX")
         # assert sorted([d1991, someyear]) == [someyear, d1991]
 
+    def test_sort_key(self):
+        d1991 = Undate(1991)
+        d1991_02 = Undate(1991, 2)
+        d1991_02_01 = Undate(1991, 2, 1)
+        d19XX = Undate("19XX")
+        may = Undate(month=5)
+        unknown_april = Undate("XXXX", 4)
+        # sorted by earliest, then latest; unknown years last
+        assert sorted(
+            [may, d1991_02, unknown_april, d19XX, d1991, d1991_02_01],
+            key=Undate.sort_key,
+        ) == [d19XX, d1991, d1991_02_01, d1991_02, unknown_april, may]
+        # same start, shorter first
+        assert Undate(1800, 3, 1).sort_key() < Undate(1800, 3).sort_key()
+        assert Undate(1800, 3).sort_key() < Undate(1800, 3, 31).sort_key()
+        # same bounds, more precise first
+        assert Undate(1800, 1, "XX").sort_key() < Undate(1800, 1).sort_key()
+        assert (
+            Undate(5779, 13, calendar="Hebrew").sort_key()
+            < Undate(2019, 4, calendar="Gregorian").sort_key()
+        )
+
     def test_possible_years(self):
         assert Undate(1991).possible_years == [1991]
         assert Undate("190X").possible_years == range(1900, 1910)
@@ -488,6 +705,46 @@ class TestUndate:
                 range(4810, 4820)
             )
 
+    def test_resolve_weekday(self):
+        # Tuesday, 12 March 17XX
+        candidates = Undate("17XX", 3, 12).resolve_weekday(Weekday.TUESDAY)
+        expected = [
+            year
+            for year in range(1700, 1800)
+            if datetime.date(year, 3, 12).weekday() == Weekday.TUESDAY
+        ]
+        assert [candidate.year for candidate in candidates] == [
+            str(year) for year in expected
+        ]
+        assert all(candidate.precision == DatePrecision.DAY for candidate in candidates)
+        # partially known month and day
+        assert Undate(1801, "XX", 13).resolve_weekday(Weekday.FRIDAY) == [
+            Undate(1801, 2, 13),
+            Undate(1801, 3, 13),
+            Undate(1801, 11, 13),
+        ]
+        assert Undate("180X", 2, "2X").resolve_weekday(Weekday.MONDAY)[:2] == [
+            Undate(1800, 2, 24),
+            Undate(1801, 2, 23),
+        ]
+        # other calendars; 1 Tishri is never on a Sunday, Wednesday, or Friday
+        hebrew_date = Undate("578X", 7, 1, calendar="Hebrew")
+        candidates = hebrew_date.resolve_weekday(Weekday.MONDAY)
+        assert candidates == [
+            Undate(5780, 7, 1, calendar="Hebrew"),
+            Undate(5783, 7, 1, calendar="Hebrew"),
+        ]
+        assert all(
+            candidate.earliest.weekday == Weekday.MONDAY for candidate in candidates
+        )
+        assert hebrew_date.resolve_weekday(Weekday.WEDNESDAY) == []
+
+    def test_resolve_weekday_invalid(self):
+        with pytest.raises(ValueError, match="day-precision"):
+            Undate("17XX", 3).resolve_weekday(Weekday.TUESDAY)
+        with pytest.raises(ValueError, match="completely unknown year"):
+            Undate(month=3, day=12).resolve_weekday(Weekday.TUESDAY)
+
     def test_duration(self):
         day_duration = Undate(2022, 11, 7).duration()
         assert isinstance(day_duration, Timedelta)
@@ -657,6 +914,25 @@ class TestUndate:
         with pytest.raises(ValueError, match="Unsupported format"):
             Undate(1984).format("%Y-%m")
 
+    def test_format_many(self):
+        undates = [Undate(1984, 4), Undate("19XX"), Undate(month=12, day=31)]
+        assert Undate.format_many(undates, "EDTF") == ["1984-04", "19XX", "XXXX-12-31"]
+        assert Undate.format_many(undates, "ISO8601") == ["1984-04", "-", "--12-31"]
+        interval = UndateInterval(Undate(2000), Undate(2001))
+        assert Undate.format_many([interval], "EDTF") == ["2000/2001"]
+        assert Undate.format_many([], "EDTF") == []
+        with pytest.raises(ValueError, match="Unsupported format"):
+            Undate.format_many(undates, "foobar")
+
+    def test_part_string(self):
+        assert Undate.part_string("year", 33, DatePrecision.YEAR) == "0033"
+        assert Undate.part_string("year", "19XX", DatePrecision.YEAR) == "19XX"
+        assert Undate.part_string("month", 3, DatePrecision.MONTH) == "03"
+        # unset values included in the precision are unknown
+        assert Undate.part_string("year", None, DatePrecision.DAY) == "XXXX"
+        assert Undate.part_string("day", None, DatePrecision.DAY) == "XX"
+        assert Undate.part_string("day", None, DatePrecision.MONTH) is None
+
 
 def test_calendar_get_converter():
     # ensure we can retrieve a calendar converter for each